@@ -0,0 +1,71 @@
+"""
+Benchmarks for reading history windows and spot values through the
+``DataPortal``.
+"""
+from .datasets import UNIVERSE_SIZES, load_dataset
+
+
+class GetHistoryWindow(object):
+    """
+    ``DataPortal.get_history_window`` for every asset in the universe, ending
+    at the last minute of the dataset.
+    """
+    params = (UNIVERSE_SIZES, ['1d', '1m'])
+    param_names = ['num_sids', 'frequency']
+    timeout = 600
+
+    # A quarter of daily bars, or two sessions of minute bars.
+    bar_counts = {'1d': 63, '1m': 780}
+
+    def setup(self, num_sids, frequency):
+        dataset = load_dataset(num_sids)
+        self.data_portal = dataset.make_data_portal()
+        self.assets = dataset.assets
+        self.end_dt = dataset.last_minute
+        self.bar_count = self.bar_counts[frequency]
+
+    def time_get_history_window(self, num_sids, frequency):
+        self.data_portal.get_history_window(
+            self.assets,
+            self.end_dt,
+            self.bar_count,
+            frequency,
+            'close',
+        )
+
+    def peakmem_get_history_window(self, num_sids, frequency):
+        self.data_portal.get_history_window(
+            self.assets,
+            self.end_dt,
+            self.bar_count,
+            frequency,
+            'close',
+        )
+
+
+class GetMinuteSpotValue(object):
+    """
+    ``DataPortal.get_spot_value`` of the price of every asset in the universe,
+    for each of the first 30 minutes of the last session of the dataset.
+    """
+    params = (UNIVERSE_SIZES, [False, True])
+    param_names = ['num_sids', 'prefetch']
+    timeout = 600
+
+    # Each sample starts from a cold session cache.
+    number = 1
+
+    def setup(self, num_sids, prefetch):
+        dataset = load_dataset(num_sids)
+        self.data_portal = dataset.make_data_portal()
+        self.assets = dataset.assets
+        self.session = session = dataset.minute_days[-1]
+        self.minutes = dataset.env.market_minutes_for_day(session)[:30]
+
+    def time_get_spot_value(self, num_sids, prefetch):
+        data_portal = self.data_portal
+        if prefetch:
+            data_portal.prefetch_minute_session(self.session, self.assets)
+        for minute in self.minutes:
+            for asset in self.assets:
+                data_portal.get_spot_value(asset, 'price', minute, 'minute')
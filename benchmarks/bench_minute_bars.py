@@ -0,0 +1,41 @@
+"""
+Benchmarks for the bcolz minute bar reader.
+"""
+from .datasets import MINUTE_SESSIONS, UNIVERSE_SIZES, load_dataset
+
+FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class UnadjustedWindow(object):
+    """
+    ``BcolzMinuteBarReader.unadjusted_window`` for every field and every asset
+    in the universe over the last ``num_sessions`` sessions of minute bars.
+    """
+    params = (UNIVERSE_SIZES, [1, MINUTE_SESSIONS])
+    param_names = ['num_sids', 'num_sessions']
+    timeout = 600
+
+    def setup(self, num_sids, num_sessions):
+        dataset = load_dataset(num_sids)
+        self.reader = dataset.equity_minute_reader
+        self.sids = dataset.sids
+        self.start_dt = dataset.env.open_and_closes.market_open[
+            dataset.minute_days[-num_sessions]
+        ]
+        self.end_dt = dataset.last_minute
+
+    def time_unadjusted_window(self, num_sids, num_sessions):
+        self.reader.unadjusted_window(
+            FIELDS,
+            self.start_dt,
+            self.end_dt,
+            self.sids,
+        )
+
+    def peakmem_unadjusted_window(self, num_sids, num_sessions):
+        self.reader.unadjusted_window(
+            FIELDS,
+            self.start_dt,
+            self.end_dt,
+            self.sids,
+        )
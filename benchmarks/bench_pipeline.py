@@ -0,0 +1,60 @@
+"""
+Benchmarks for computing pipelines over the synthetic daily bars.
+"""
+from zipline.pipeline import Pipeline, SimplePipelineEngine
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.factors import Returns, SimpleMovingAverage
+from zipline.pipeline.loaders import USEquityPricingLoader
+
+from .datasets import UNIVERSE_SIZES, load_dataset
+
+# The number of assets that pass the pipeline's screen each day.
+SCREEN_SIZE = 50
+
+
+def make_pipeline():
+    sma = SimpleMovingAverage(
+        inputs=[USEquityPricing.close],
+        window_length=20,
+    )
+    returns = Returns(window_length=5)
+    return Pipeline(
+        columns={
+            'close': USEquityPricing.close.latest,
+            'sma': sma,
+            'returns': returns,
+            'returns_rank': returns.rank(),
+        },
+        screen=sma.top(SCREEN_SIZE),
+    )
+
+
+class RunPipeline(object):
+    """
+    ``SimplePipelineEngine.run_pipeline`` over ``num_sessions`` sessions,
+    loading adjusted daily bars from bcolz and SQLite.
+    """
+    params = (UNIVERSE_SIZES, [21, 126])
+    param_names = ['num_sids', 'num_sessions']
+    timeout = 600
+
+    def setup(self, num_sids, num_sessions):
+        dataset = load_dataset(num_sids)
+        loader = USEquityPricingLoader(
+            dataset.equity_daily_reader,
+            dataset.adjustment_reader,
+        )
+        self.engine = SimplePipelineEngine(
+            lambda column: loader,
+            dataset.daily_days,
+            dataset.env.asset_finder,
+        )
+        self.pipeline = make_pipeline()
+        self.start_date = dataset.daily_days[-num_sessions]
+        self.end_date = dataset.daily_days[-1]
+
+    def time_run_pipeline(self, num_sids, num_sessions):
+        self.engine.run_pipeline(self.pipeline, self.start_date, self.end_date)
+
+    def peakmem_run_pipeline(self, num_sids, num_sessions):
+        self.engine.run_pipeline(self.pipeline, self.start_date, self.end_date)
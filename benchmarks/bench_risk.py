@@ -0,0 +1,52 @@
+"""
+Benchmarks for the cumulative risk metrics updated at the end of each session.
+"""
+import numpy as np
+import pandas as pd
+
+from zipline.finance.risk import RiskMetricsCumulative
+from zipline.utils.factory import create_simulation_parameters
+
+from .datasets import make_trading_environment
+
+
+class RiskMetricsCumulativeUpdate(object):
+    """
+    ``RiskMetricsCumulative.update`` called once for each of ``num_sessions``
+    sessions, as the performance tracker does over a backtest.
+    """
+    params = ([21, 252, 1260],)
+    param_names = ['num_sessions']
+    timeout = 600
+
+    def setup(self, num_sessions):
+        self.env = make_trading_environment(
+            start_date=pd.Timestamp('2010-01-04', tz='UTC'),
+            end_date=pd.Timestamp('2015-12-31', tz='UTC'),
+        )
+        days = self.env.trading_days[-num_sessions:]
+        self.sim_params = create_simulation_parameters(
+            start=days[0],
+            end=days[-1],
+            env=self.env,
+        )
+        rand = np.random.RandomState(1234)
+        self.days = days
+        self.algorithm_returns = rand.normal(0.0005, 0.01, num_sessions)
+        self.benchmark_returns = rand.normal(0.0003, 0.01, num_sessions)
+        self.leverages = rand.uniform(0.5, 1.5, num_sessions)
+
+    def _update_all(self):
+        metrics = RiskMetricsCumulative(self.sim_params, self.env)
+        for dt, algorithm_return, benchmark_return, leverage in zip(
+                self.days,
+                self.algorithm_returns,
+                self.benchmark_returns,
+                self.leverages):
+            metrics.update(dt, algorithm_return, benchmark_return, leverage)
+
+    def time_update(self, num_sessions):
+        self._update_all()
+
+    def peakmem_update(self, num_sessions):
+        self._update_all()
@@ -0,0 +1,96 @@
+"""
+Benchmarks for running a full backtest through ``AlgorithmSimulator``.
+"""
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from zipline import TradingAlgorithm
+from zipline.utils.factory import create_simulation_parameters
+
+from .datasets import UNIVERSE_SIZES, load_dataset
+
+# The number of daily sessions to simulate, ending at the last session of the
+# dataset.
+NUM_SESSIONS = 21
+
+
+class BuyAndHold(TradingAlgorithm):
+    """
+    Buy an equal weight of every asset on the first bar and hold them.
+
+    After the first bar each session is spent tracking the positions, which is
+    what dominates ``AlgorithmSimulator.transform`` for large universes.
+    """
+    def initialize(self, assets):
+        self.assets = assets
+        self.ordered = False
+
+    def handle_data(self, data):
+        if not self.ordered:
+            weight = 1.0 / len(self.assets)
+            self.order_target_percents(
+                {asset: weight for asset in self.assets},
+            )
+            self.ordered = True
+
+
+class DailySimulation(object):
+    """
+    ``AlgorithmSimulator.transform`` over ``NUM_SESSIONS`` daily sessions with
+    every asset in the universe held.
+    """
+    params = (UNIVERSE_SIZES,)
+    param_names = ['num_sids']
+    timeout = 600
+
+    # Each sample needs a fresh algorithm, so don't let asv run the
+    # simulation more than once per sample.
+    number = 1
+    repeat = 3
+
+    def setup(self, num_sids):
+        self.dataset = dataset = load_dataset(num_sids)
+        self.data_portal = dataset.make_data_portal()
+        self.sim_params = create_simulation_parameters(
+            start=dataset.daily_days[-NUM_SESSIONS],
+            end=dataset.daily_days[-1],
+            capital_base=1.0e7,
+            data_frequency='daily',
+            emission_rate='daily',
+            env=dataset.env,
+        )
+
+    def _run(self, **kwargs):
+        algo = BuyAndHold(
+            assets=self.dataset.assets,
+            sim_params=self.sim_params,
+            env=self.dataset.env,
+        )
+        # ``run`` only adds building the daily stats frame on top of draining
+        # ``AlgorithmSimulator.transform``.
+        algo.run(self.data_portal, **kwargs)
+
+    def time_transform(self, num_sids):
+        self._run()
+
+    def peakmem_transform(self, num_sids):
+        self._run()
+
+
+class CheckpointedDailySimulation(DailySimulation):
+    """
+    ``DailySimulation`` writing a checkpoint every 5 sessions, to compare
+    against the cost of the simulation itself.
+    """
+    def setup(self, num_sids):
+        super(CheckpointedDailySimulation, self).setup(num_sids)
+        self.checkpoint_dir = mkdtemp()
+
+    def teardown(self, num_sids):
+        rmtree(self.checkpoint_dir)
+
+    def _run(self):
+        super(CheckpointedDailySimulation, self)._run(
+            checkpoint_dir=self.checkpoint_dir,
+            checkpoint_every=5,
+        )
@@ -0,0 +1,257 @@
+"""
+Deterministic synthetic datasets shared by the benchmarks.
+
+The first benchmark that asks for a universe writes its asset db, daily bars,
+minute bars and adjustments under ``ZIPLINE_BENCHMARK_DATA`` (by default a
+directory in the system temp dir).  Every later process opens the files that
+are already there, so the cost of writing them is paid once per machine and
+does not show up in any timing.
+"""
+import os
+import shutil
+import sqlite3
+from tempfile import gettempdir
+
+import bcolz
+import numpy as np
+import pandas as pd
+from six import iteritems
+from toolz import partition_all
+
+from zipline.assets.synthetic import make_simple_equity_info
+from zipline.data.data_portal import DataPortal
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    SQLiteAdjustmentReader,
+    SQLiteAdjustmentWriter,
+)
+from zipline.finance.risk.risk import TREASURY_DURATIONS
+from zipline.finance.trading import TradingEnvironment
+from zipline.testing.core import create_daily_bar_data, create_minute_bar_data
+
+# Bump this whenever the contents of the datasets change so that files written
+# by an older version of this module are not picked up.
+DATASET_VERSION = 1
+
+UNIVERSE_SIZES = [100, 1000, 8000]
+
+START_DATE = pd.Timestamp('2015-01-02', tz='UTC')
+END_DATE = pd.Timestamp('2015-12-31', tz='UTC')
+
+# The number of sessions, ending at END_DATE, which have minute bars.
+MINUTE_SESSIONS = 5
+
+# The number of sids to build minute frames for at once.
+MINUTE_WRITE_CHUNKSIZE = 100
+
+# Every SPLIT_EVERY_NTH_SID asset has a 2:1 split on SPLIT_DATE.
+SPLIT_EVERY_NTH_SID = 10
+SPLIT_DATE = pd.Timestamp('2015-07-01', tz='UTC')
+
+_DONE_MARKER = 'DONE'
+
+
+def synthetic_market_data(trading_day, trading_days, bm_symbol):
+    """
+    A ``load`` function for ``TradingEnvironment`` which makes up benchmark
+    returns and treasury curves instead of downloading them.
+
+    Both are seeded, so every call for the same days returns the same data.
+    """
+    benchmark_returns = pd.Series(
+        np.random.RandomState(1234).normal(0.0003, 0.01, len(trading_days)),
+        index=trading_days,
+    )
+    treasury_curves = pd.DataFrame(
+        np.tile(
+            np.linspace(0.0002, 0.03, len(TREASURY_DURATIONS)),
+            (len(trading_days), 1),
+        ),
+        index=trading_days,
+        columns=TREASURY_DURATIONS,
+    )
+    return benchmark_returns, treasury_curves
+
+
+def make_trading_environment(start_date=START_DATE,
+                             end_date=END_DATE,
+                             asset_db_path=':memory:'):
+    """
+    Create a ``TradingEnvironment`` over ``[start_date, end_date]`` which uses
+    ``synthetic_market_data`` for its benchmark and treasury data.
+    """
+    return TradingEnvironment(
+        load=synthetic_market_data,
+        min_date=start_date,
+        max_date=end_date,
+        asset_db_path=asset_db_path,
+    )
+
+
+def data_root():
+    return os.path.join(
+        os.environ.get(
+            'ZIPLINE_BENCHMARK_DATA',
+            os.path.join(gettempdir(), 'zipline-benchmarks'),
+        ),
+        'v%d' % DATASET_VERSION,
+    )
+
+
+class SyntheticDataset(object):
+    """
+    Readers over a universe of ``num_sids`` equities which all trade every day
+    from ``START_DATE`` to ``END_DATE``.
+
+    Parameters
+    ----------
+    num_sids : int
+        The number of assets in the universe.
+    path : str
+        The directory holding the dataset's files.  They are written if they
+        are not already there.
+
+    Attributes
+    ----------
+    env : TradingEnvironment
+    sids : np.ndarray[int64]
+    assets : list[Equity]
+    daily_days : pd.DatetimeIndex
+        The sessions with daily bars.
+    minute_days : pd.DatetimeIndex
+        The sessions with minute bars.
+    equity_daily_reader : BcolzDailyBarReader
+    equity_minute_reader : BcolzMinuteBarReader
+    adjustment_reader : SQLiteAdjustmentReader
+    """
+    def __init__(self, num_sids, path):
+        self.num_sids = num_sids
+        self.path = path
+        self.sids = np.arange(1, num_sids + 1, dtype=np.int64)
+
+        if not os.path.exists(os.path.join(path, _DONE_MARKER)):
+            # Clear out anything left behind by a write that didn't finish.
+            shutil.rmtree(path, ignore_errors=True)
+            os.makedirs(path)
+            write_files = True
+        else:
+            write_files = False
+
+        self.env = make_trading_environment(
+            asset_db_path=os.path.join(path, 'assets.db'),
+        )
+        self.daily_days = self.env.days_in_range(START_DATE, END_DATE)
+        self.minute_days = self.daily_days[-MINUTE_SESSIONS:]
+
+        if write_files:
+            self._write()
+            open(os.path.join(path, _DONE_MARKER), 'w').close()
+
+        self.assets = self.env.asset_finder.retrieve_all(self.sids)
+        self.equity_daily_reader = BcolzDailyBarReader(
+            bcolz.open(self._daily_bar_path, mode='r'),
+        )
+        self.equity_minute_reader = BcolzMinuteBarReader(
+            self._minute_bar_path,
+        )
+        self.adjustment_reader = SQLiteAdjustmentReader(
+            sqlite3.connect(self._adjustments_path),
+        )
+
+    @property
+    def _daily_bar_path(self):
+        return os.path.join(self.path, 'daily_equity_pricing.bcolz')
+
+    @property
+    def _minute_bar_path(self):
+        return os.path.join(self.path, 'minute_equity_pricing.bcolz')
+
+    @property
+    def _adjustments_path(self):
+        return os.path.join(self.path, 'adjustments.db')
+
+    @property
+    def first_minute(self):
+        return self.env.open_and_closes.market_open[self.minute_days[0]]
+
+    @property
+    def last_minute(self):
+        return self.env.open_and_closes.market_close[self.minute_days[-1]]
+
+    def _write(self):
+        self.env.write_data(equities=make_simple_equity_info(
+            self.sids,
+            START_DATE,
+            END_DATE,
+            symbols=['SYM%d' % sid for sid in self.sids],
+        ))
+
+        daily_bars = BcolzDailyBarWriter(
+            self._daily_bar_path,
+            self.daily_days,
+        ).write(create_daily_bar_data(self.daily_days, self.sids))
+
+        days = self.minute_days
+        writer = BcolzMinuteBarWriter(
+            days[0],
+            self._minute_bar_path,
+            self.env.open_and_closes.market_open.loc[days],
+            self.env.open_and_closes.market_close.loc[days],
+            US_EQUITIES_MINUTES_PER_DAY,
+        )
+        minutes = self.env.minutes_for_days_in_range(days[0], days[-1])
+        # Build the minute frames a chunk of sids at a time; holding all of
+        # them for the largest universe would take several gigabytes.
+        for sids in partition_all(MINUTE_WRITE_CHUNKSIZE, self.sids):
+            for sid, df in iteritems(create_minute_bar_data(minutes, sids)):
+                writer.write(sid, df)
+
+        split_sids = self.sids[::SPLIT_EVERY_NTH_SID]
+        SQLiteAdjustmentWriter(
+            self._adjustments_path,
+            BcolzDailyBarReader(daily_bars),
+            self.daily_days,
+        ).write(splits=pd.DataFrame({
+            'effective_date': np.full(
+                len(split_sids),
+                SPLIT_DATE.value // 10 ** 9,
+                dtype=np.int64,
+            ),
+            'ratio': np.full(len(split_sids), 0.5),
+            'sid': split_sids,
+        }))
+
+    def make_data_portal(self):
+        """
+        Create a new ``DataPortal`` over this dataset's readers.
+        """
+        return DataPortal(
+            self.env,
+            equity_daily_reader=self.equity_daily_reader,
+            equity_minute_reader=self.equity_minute_reader,
+            adjustment_reader=self.adjustment_reader,
+        )
+
+
+_datasets = {}
+
+
+def load_dataset(num_sids):
+    """
+    Get the ``SyntheticDataset`` with ``num_sids`` assets, writing it to disk
+    the first time it is requested on this machine.
+    """
+    try:
+        return _datasets[num_sids]
+    except KeyError:
+        dataset = _datasets[num_sids] = SyntheticDataset(
+            num_sids,
+            os.path.join(data_root(), str(num_sids)),
+        )
+        return dataset
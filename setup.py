@@ -81,6 +81,9 @@ class LazyBuildExtCommandClass(dict):
 ext_modules = [
     Extension('zipline.assets._assets', ['zipline/assets/_assets.pyx']),
     Extension('zipline.lib.adjustment', ['zipline/lib/adjustment.pyx']),
+    Extension(
+        'zipline.lib._float32window', ['zipline/lib/_float32window.pyx']
+    ),
     Extension(
         'zipline.lib._float64window', ['zipline/lib/_float64window.pyx']
     ),
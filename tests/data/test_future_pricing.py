@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+import bcolz
+from numpy import array, intp, uint32
+from numpy.testing import assert_almost_equal
+from pandas import Timestamp, date_range
+from testfixtures import TempDirectory
+
+from zipline.data.future_pricing import FutureMinuteReader
+
+
+class FutureMinuteReaderTestCase(TestCase):
+
+    def setUp(self):
+        self.dir_ = TempDirectory()
+        self.start_dt = Timestamp('2015-01-01', tz='UTC')
+
+        # Zeros mark minutes without a trade.
+        bcolz.ctable(
+            columns=[
+                array([0, 5000, 0, 0, 7000, 0], dtype=uint32),
+                array([0, 10, 0, 0, 3, 0], dtype=uint32),
+            ],
+            names=['close', 'volume'],
+            rootdir=self.dir_.getpath('1.bcolz'),
+            mode='w',
+        )
+        self.reader = FutureMinuteReader(self.dir_.path)
+
+    def tearDown(self):
+        self.dir_.cleanup()
+
+    def test_forward_fill(self):
+        # Two minutes before the start through one minute past the end.
+        minutes = date_range(
+            '2014-12-31 23:58',
+            periods=9,
+            freq='T',
+            tz='UTC',
+        )
+        expected = {
+            'close': [0, 0, 0, 5, 5, 5, 7, 7, 7],
+            'volume': [0, 0, 0, 10, 10, 10, 3, 3, 3],
+        }
+        for field, values in expected.items():
+            assert_almost_equal(
+                self.reader.load_raw_window(
+                    1, minutes.asi8, field, self.start_dt,
+                ),
+                values,
+            )
+            assert_almost_equal(
+                [
+                    self.reader.get_value(1, minute, field, self.start_dt)
+                    for minute in minutes
+                ],
+                values,
+            )
+
+    def test_cache_size(self):
+        # Each column of 6 bars takes 6 float64 values and 6 intp positions.
+        column_size = 6 * 8 + 6 * array([], dtype=intp).itemsize
+        reader = FutureMinuteReader(
+            self.dir_.path,
+            cache_size=2 * column_size,
+        )
+        minute = Timestamp('2015-01-01 00:05', tz='UTC')
+        for field in 'close', 'volume', 'close':
+            reader.get_value(1, minute, field, self.start_dt)
+        self.assertEqual(len(reader._columns), 2)
+
+        # Columns are dropped once the cache is full, least recently read
+        # first, and are read again when needed.
+        bcolz.ctable(
+            columns=[array([9000] * 6, dtype=uint32)],
+            names=['close'],
+            rootdir=self.dir_.getpath('2.bcolz'),
+            mode='w',
+        )
+        self.assertEqual(
+            reader.get_value(2, minute, 'close', self.start_dt),
+            9.0,
+        )
+        self.assertEqual(sorted(reader._columns), [(1, 'close'), (2, 'close')])
+        self.assertEqual(
+            reader.get_value(1, minute, 'volume', self.start_dt),
+            3,
+        )
+        self.assertEqual(
+            sorted(reader._columns),
+            [(1, 'volume'), (2, 'close')],
+        )
+
+        # Columns larger than the cache are read but not kept.
+        reader = FutureMinuteReader(self.dir_.path, cache_size=column_size - 1)
+        self.assertEqual(
+            reader.get_value(1, minute, 'close', self.start_dt),
+            7.0,
+        )
+        self.assertEqual(len(reader._columns), 0)
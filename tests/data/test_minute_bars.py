@@ -37,10 +37,12 @@ from pandas import (
 )
 from testfixtures import TempDirectory
 
+from zipline.assets import Equity
 from zipline.data.minute_bars import (
     BcolzMinuteBarWriter,
     BcolzMinuteBarReader,
     BcolzMinuteOverlappingData,
+    SessionMinuteBarCache,
     US_EQUITIES_MINUTES_PER_DAY,
     BcolzMinuteWriterColumnMismatch
 )
@@ -801,3 +803,56 @@ class BcolzMinuteBarTestCase(TestCase):
                 Timestamp('2015-11-30 21:01:00', tz='UTC'),
                 'open'),
             600)
+
+    def test_session_cache_matches_reader(self):
+        tds = self.market_opens.index
+        days = tds[tds.slice_indexer(
+            start=self.test_calendar_start + 1,
+            end=self.test_calendar_start + 3
+        )]
+        minutes = self.env.minutes_for_days_in_range(days[0], days[1])
+
+        # Sid 1 trades every third minute and sid 2 every seventh, so both
+        # have minutes without trades to forward fill over.
+        for sid, every in ((1, 3), (2, 7)):
+            traded = minutes[::every]
+            values = arange(1, len(traded) + 1, dtype=float64)
+            self.writer.write(sid, DataFrame(
+                data={
+                    'open': values,
+                    'high': values + 1,
+                    'low': values - 0.5,
+                    'close': values + 0.25,
+                    'volume': values * 100,
+                },
+                index=traded,
+            ))
+
+        assets = [
+            Equity(1, symbol='A', start_date=days[0]),
+            Equity(2, symbol='B', start_date=days[0]),
+        ]
+        cache = SessionMinuteBarCache(self.reader)
+
+        # Only sid 1 is prefetched, so sid 2 is read on its first request.
+        cache.start_session(self.market_opens[days[1]], [1])
+
+        session_minutes = self.env.minutes_for_days_in_range(days[1], days[1])
+        # The last minute of the day before is passed through to the reader.
+        for minute in session_minutes.insert(0, minutes[-391]):
+            for asset in assets:
+                for field in SessionMinuteBarCache.FIELDS:
+                    assert_almost_equal(
+                        cache.get_value(asset.sid, minute, field),
+                        self.reader.get_value(asset.sid, minute, field),
+                        err_msg='%s %s %s' % (asset, minute, field),
+                    )
+                self.assertEqual(
+                    cache.get_last_traded_dt(asset, minute),
+                    self.reader.get_last_traded_dt(asset, minute),
+                )
+
+        # The sids requested during a session are read again at the start
+        # of the next one.
+        cache.start_session(self.market_opens[days[2]], [])
+        self.assertEqual(sorted(cache._rows), [1, 2])
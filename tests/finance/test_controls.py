@@ -0,0 +1,146 @@
+from unittest import TestCase
+
+from nose_parameterized import parameterized
+from numpy import array
+from numpy.testing import assert_array_equal
+import pandas as pd
+
+from zipline.assets import Equity
+from zipline.errors import TradingControlViolation
+from zipline.finance.controls import (
+    AssetDateBounds,
+    LongOnly,
+    MaxOrderCount,
+    MaxOrderSize,
+    MaxPositionSize,
+    RestrictedListOrder,
+)
+from zipline.protocol import Portfolio, Position
+
+
+class FakeCurrentData(object):
+
+    def __init__(self, prices):
+        self.prices = prices
+
+    def current(self, assets, field):
+        assert field == 'price'
+        if isinstance(assets, list):
+            return pd.Series(
+                [self.prices[asset] for asset in assets],
+                index=assets,
+            )
+        return self.prices[assets]
+
+
+class ValidateManyTestCase(TestCase):
+
+    def setUp(self):
+        self.dt = pd.Timestamp('2015-06-01 15:00', tz='UTC')
+        self.assets = [
+            Equity(
+                1,
+                start_date=pd.Timestamp('2015-01-01', tz='UTC'),
+                end_date=pd.Timestamp('2016-01-01', tz='UTC'),
+            ),
+            Equity(
+                2,
+                start_date=pd.Timestamp('2015-07-01', tz='UTC'),
+                end_date=pd.Timestamp('2016-01-01', tz='UTC'),
+            ),
+            Equity(
+                3,
+                start_date=pd.Timestamp('2014-01-01', tz='UTC'),
+                end_date=pd.Timestamp('2015-05-01', tz='UTC'),
+            ),
+            Equity(4),
+        ]
+        self.portfolio = Portfolio()
+        for sid, amount in (1, 50), (3, -10):
+            position = Position(self.assets[sid - 1])
+            position.amount = amount
+            self.portfolio.positions[self.assets[sid - 1]] = position
+        self.current_data = FakeCurrentData(dict(zip(
+            self.assets, [10.0, 20.0, float('nan'), 5.0],
+        )))
+
+    @parameterized.expand([
+        ('max_order_count', lambda assets: MaxOrderCount(3)),
+        ('restricted_list', lambda assets: RestrictedListOrder(assets[1:3])),
+        ('max_order_size', lambda assets: MaxOrderSize(max_shares=30)),
+        ('max_order_notional', lambda assets: MaxOrderSize(
+            max_notional=250.0,
+        )),
+        ('max_order_size_one_asset', lambda assets: MaxOrderSize(
+            asset=assets[0],
+            max_shares=30,
+        )),
+        ('max_position_size', lambda assets: MaxPositionSize(max_shares=60)),
+        ('max_position_notional', lambda assets: MaxPositionSize(
+            max_notional=500.0,
+        )),
+        ('long_only', lambda assets: LongOnly()),
+        ('asset_date_bounds', lambda assets: AssetDateBounds()),
+    ])
+    def test_matches_validate(self, name, make_control):
+        assets = self.assets * 2
+        amounts = array([20, -40, 5, 0, -60, 15, 35, 10])
+
+        failed, reasons = make_control(assets).validate_many(
+            assets,
+            amounts,
+            self.portfolio,
+            self.dt,
+            self.current_data,
+        )
+
+        control = make_control(assets)
+        expected_failed = []
+        expected_reasons = []
+        for asset, amount in zip(assets, amounts):
+            try:
+                control.validate(
+                    asset,
+                    amount,
+                    self.portfolio,
+                    self.dt,
+                    self.current_data,
+                )
+            except TradingControlViolation as e:
+                expected_failed.append(True)
+                expected_reasons.append(e.kwargs['constraint'])
+            else:
+                expected_failed.append(False)
+                expected_reasons.append(None)
+
+        assert_array_equal(failed, expected_failed)
+        self.assertEqual(reasons, expected_reasons)
+        self.assertTrue(any(expected_failed))
+
+    def test_max_order_count_records_placed_orders(self):
+        control = MaxOrderCount(3)
+        assets = self.assets[:2]
+        amounts = array([10, 20])
+
+        def validate():
+            failed, _ = control.validate_many(
+                assets,
+                amounts,
+                self.portfolio,
+                self.dt,
+                self.current_data,
+            )
+            return failed
+
+        # Validating a batch doesn't count it, since another control may
+        # still reject it.
+        assert_array_equal(validate(), [False, False])
+        assert_array_equal(validate(), [False, False])
+
+        control.record_many(assets, amounts, self.dt)
+        assert_array_equal(validate(), [False, True])
+
+        # The count starts over on the next day.
+        control.record_many(assets, amounts, self.dt)
+        self.dt += pd.Timedelta(days=1)
+        assert_array_equal(validate(), [False, False])
@@ -0,0 +1,123 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import TestCase
+
+import pandas as pd
+
+from zipline.assets import Equity
+from zipline.finance.order import Order
+from zipline.finance.performance.ledger import (
+    OrderLog,
+    RecordLog,
+    TransactionLog,
+)
+from zipline.finance.transaction import Transaction
+
+
+class RecordLogTestCase(TestCase):
+
+    def test_records_across_chunks(self):
+        log = RecordLog([('a', 'i8'), ('b', 'f8')], chunksize=3)
+        self.assertEqual(len(log.records()), 0)
+
+        for i in range(8):
+            log.append((i, i / 2.0))
+        self.assertEqual(len(log), 8)
+
+        for start in range(9):
+            records = log.records(start)
+            self.assertEqual(list(records['a']), list(range(start, 8)))
+            self.assertEqual(
+                list(records['b']),
+                [i / 2.0 for i in range(start, 8)],
+            )
+
+
+class LedgerTestCase(TestCase):
+
+    def setUp(self):
+        self.asset = Equity(1)
+        self.dt1 = pd.Timestamp('2016-01-04 14:31', tz='UTC')
+        self.dt2 = pd.Timestamp('2016-01-04 14:32', tz='UTC')
+
+    def test_transaction_log(self):
+        log = TransactionLog(chunksize=2)
+        txns = [
+            Transaction(self.asset, 10, self.dt1, 10.5, 'a'),
+            Transaction(self.asset, -5, self.dt1, 10.25, 'b', commission=1.0),
+            Transaction(self.asset, 3, self.dt2, 10.0, 'a'),
+        ]
+        for txn in txns:
+            log.append(txn)
+
+        self.assertEqual(log.to_dicts(), [txn.to_dict() for txn in txns])
+        self.assertEqual(
+            log.to_dicts(dt=self.dt1),
+            [txn.to_dict() for txn in txns[:2]],
+        )
+        self.assertEqual(log.to_dicts(dt=self.dt2), [txns[2].to_dict()])
+        self.assertIs(log.to_dicts()[0]['sid'], self.asset)
+        self.assertEqual(list(log.records()['amount']), [10, -5, 3])
+
+        # A transaction recorded out of order is still found for its dt.
+        late = Transaction(self.asset, 1, self.dt1, 10.0, 'c')
+        log.append(late)
+        self.assertEqual(
+            log.to_dicts(dt=self.dt1),
+            [txn.to_dict() for txn in txns[:2] + [late]],
+        )
+        self.assertEqual(log.to_dicts(dt=self.dt2), [txns[2].to_dict()])
+
+        log.clear()
+        self.assertEqual(len(log), 0)
+        self.assertEqual(log.to_dicts(), [])
+        self.assertEqual(log.to_dicts(dt=self.dt1), [])
+
+    def test_order_log(self):
+        log = OrderLog(chunksize=2)
+        filled = Order(self.dt1, self.asset, 10, limit=10.5)
+        cancelled = Order(self.dt1, self.asset, -5)
+        log.append(filled)
+        log.append(cancelled)
+
+        filled.filled = 10
+        filled.commission = 1.0
+        filled.dt = self.dt2
+        log.append(filled)
+
+        # A filled order is read from the log, so changing it afterwards
+        # doesn't change the dicts.
+        expected_filled = filled.to_dict()
+        filled.reason = 'changed'
+
+        self.assertEqual(
+            log.to_dicts(),
+            [cancelled.to_dict(), expected_filled],
+        )
+        self.assertEqual(log.to_dicts(dt=self.dt2), [expected_filled])
+
+        # An order which was open when it was last recorded is read from the
+        # order itself, e.g. when it is cancelled at the end of the day
+        # without being recorded again.
+        cancelled.cancel()
+        self.assertEqual(
+            log.to_dicts(),
+            [cancelled.to_dict(), expected_filled],
+        )
+        self.assertNotIn('broker_order_id', log.to_dicts()[0])
+
+        log.clear()
+        self.assertEqual(log.to_dicts(), [])
+        self.assertEqual(len(log.records()), 0)
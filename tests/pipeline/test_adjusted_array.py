@@ -27,6 +27,7 @@ from zipline.utils.numpy_utils import (
     coerce_to_dtype,
     datetime64ns_dtype,
     default_missing_value_for_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
 )
@@ -102,6 +103,7 @@ def _gen_multiplicative_adjustment_cases(dtype):
     We then build all legal windows over these buffers.
     """
     adjustment_type = {
+        float32_dtype: Float64Multiply,
         float64_dtype: Float64Multiply,
     }[dtype]
 
@@ -168,6 +170,7 @@ def _gen_overwrite_adjustment_cases(dtype):
     the adjustments are expected to modify the arrays.
     """
     adjustment_type = {
+        float32_dtype: Float64Overwrite,
         float64_dtype: Float64Overwrite,
         datetime64ns_dtype: Datetime64Overwrite,
     }[dtype]
@@ -263,6 +266,7 @@ class AdjustedArrayTestCase(TestCase):
 
     @parameterized.expand(
         chain(
+            _gen_unadjusted_cases(float32_dtype),
             _gen_unadjusted_cases(float64_dtype),
             _gen_unadjusted_cases(datetime64ns_dtype),
         )
@@ -275,14 +279,25 @@ class AdjustedArrayTestCase(TestCase):
                             missing_value,
                             expected):
 
-        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        array = AdjustedArray(
+            data,
+            NOMASK,
+            adjustments,
+            missing_value,
+            column_dtype=data.dtype,
+        )
         for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
             window_iter = array.traverse(lookback)
             for yielded, expected_yield in zip_longest(window_iter, expected):
                 self.assertEqual(yielded.dtype, data.dtype)
                 assert_array_equal(yielded, expected_yield)
 
-    @parameterized.expand(_gen_multiplicative_adjustment_cases(float64_dtype))
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float32_dtype),
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+        )
+    )
     def test_multiplicative_adjustments(self,
                                         name,
                                         data,
@@ -291,14 +306,22 @@ class AdjustedArrayTestCase(TestCase):
                                         missing_value,
                                         expected):
 
-        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        array = AdjustedArray(
+            data,
+            NOMASK,
+            adjustments,
+            missing_value,
+            column_dtype=data.dtype,
+        )
         for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
             window_iter = array.traverse(lookback)
             for yielded, expected_yield in zip_longest(window_iter, expected):
+                self.assertEqual(yielded.dtype, data.dtype)
                 assert_array_equal(yielded, expected_yield)
 
     @parameterized.expand(
         chain(
+            _gen_overwrite_adjustment_cases(float32_dtype),
             _gen_overwrite_adjustment_cases(float64_dtype),
             _gen_overwrite_adjustment_cases(datetime64ns_dtype),
         )
@@ -310,7 +333,13 @@ class AdjustedArrayTestCase(TestCase):
                                         adjustments,
                                         missing_value,
                                         expected):
-        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        array = AdjustedArray(
+            data,
+            NOMASK,
+            adjustments,
+            missing_value,
+            column_dtype=data.dtype,
+        )
         for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
             window_iter = array.traverse(lookback)
             for yielded, expected_yield in zip_longest(window_iter, expected):
@@ -318,7 +347,7 @@ class AdjustedArrayTestCase(TestCase):
                 assert_array_equal(yielded, expected_yield)
 
     @parameter_space(
-        dtype=[float64_dtype, int64_dtype, datetime64ns_dtype],
+        dtype=[float32_dtype, float64_dtype, int64_dtype, datetime64ns_dtype],
         missing_value=[0, 10000],
         window_length=[2, 3],
     )
@@ -334,6 +363,7 @@ class AdjustedArrayTestCase(TestCase):
             mask,
             adjustments={},
             missing_value=missing_value,
+            column_dtype=dtype,
         )
 
         gen_expected = moving_window(masked_baseline, window_length)
@@ -341,6 +371,26 @@ class AdjustedArrayTestCase(TestCase):
         for expected, actual in zip(gen_expected, gen_actual):
             check_arrays(expected, actual)
 
+    def test_float32_only_for_float32_columns(self):
+        data = arange(15, dtype=float32_dtype).reshape(5, 3)
+
+        for column_dtype in None, float64_dtype:
+            array = AdjustedArray(data, NOMASK, {}, float('nan'), column_dtype)
+            self.assertEqual(array.dtype, float64_dtype)
+            for window in array.traverse(2):
+                self.assertEqual(window.dtype, float64_dtype)
+
+        array = AdjustedArray(
+            data.astype(float64_dtype),
+            NOMASK,
+            {},
+            float('nan'),
+            float32_dtype,
+        )
+        self.assertEqual(array.dtype, float32_dtype)
+        for window in array.traverse(2):
+            self.assertEqual(window.dtype, float32_dtype)
+
     def test_invalid_lookback(self):
 
         data = arange(30, dtype=float).reshape(6, 5)
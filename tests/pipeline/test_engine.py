@@ -6,6 +6,7 @@ from collections import OrderedDict
 from itertools import product
 from operator import add, sub
 
+from mock import patch
 from nose_parameterized import parameterized
 from numpy import (
     arange,
@@ -16,6 +17,7 @@ from numpy import (
     full,
     log,
     nan,
+    nanmean,
     tile,
     where,
     zeros,
@@ -39,10 +41,19 @@ from six import iteritems, itervalues
 from toolz import merge
 
 from zipline.assets.synthetic import make_rotating_equity_info
+from zipline.lib.adjusted_array import AdjustedArray
 from zipline.lib.adjustment import MULTIPLY
 from zipline.pipeline import CustomFactor, Pipeline
-from zipline.pipeline.data import Column, DataSet, USEquityPricing
-from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.data import (
+    Column,
+    DataSet,
+    USEquityPricing,
+    USEquityPricingFloat32,
+)
+from zipline.pipeline.engine import (
+    IncrementalPipelineEngine,
+    SimplePipelineEngine,
+)
 from zipline.pipeline.factors import (
     AverageDollarVolume,
     EWMA,
@@ -72,6 +83,7 @@ from zipline.testing.fixtures import (
     ZiplineTestCase,
 )
 from zipline.utils.memoize import lazyval
+from zipline.utils.numpy_utils import float32_dtype, float64_dtype
 
 
 class RollingSumDifference(CustomFactor):
@@ -268,6 +280,33 @@ class ConstantInputTestCase(WithTradingEnvironment, ZiplineTestCase):
 
             assert_frame_equal(result, expected_result)
 
+    def test_run_pipeline_columnar(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        dates = self.dates[10:15]
+
+        factor = AssetID()
+        p = Pipeline(columns={'f': factor}, screen=factor <= self.asset_ids[1])
+        result = engine.run_pipeline_columnar(p, dates[0], dates[-1])
+        expected = engine.run_pipeline(p, dates[0], dates[-1])
+
+        assert_frame_equal(result.to_frame(), expected)
+        for date in dates:
+            assert_frame_equal(result.for_date(date), expected.loc[date])
+
+        with self.assertRaises(KeyError):
+            result.for_date(self.dates[15])
+
+        # Days on which no assets pass the screen give empty frames.
+        p = Pipeline(columns={'f': factor}, screen=factor < 0)
+        result = engine.run_pipeline_columnar(p, dates[0], dates[-1])
+        for date in dates:
+            day = result.for_date(date)
+            self.assertEqual(len(day), 0)
+            self.assertEqual(list(day.columns), ['f'])
+
     def test_single_factor(self):
         loader = self.loader
         assets = self.assets
@@ -905,6 +944,162 @@ class FrameInputTestCase(WithTradingEnvironment, ZiplineTestCase):
                 high_results = results.unstack()['high']
                 assert_frame_equal(high_results, high_base.iloc[iloc_bounds])
 
+    def test_float32_frame_for_float64_column(self):
+        close = USEquityPricing.close
+        loader = DataFrameLoader(
+            close,
+            self.make_frame(30.0).astype(float32),
+            adjustments=None,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+        )
+
+        window_dtypes = set()
+
+        class WindowDtype(CustomFactor):
+            inputs = (close,)
+            window_length = 3
+
+            def compute(self, today, assets, out, close):
+                window_dtypes.add(close.dtype)
+                out[:] = close[-1]
+
+        results = engine.run_pipeline(
+            Pipeline(columns={'close': WindowDtype()}),
+            self.dates[3],
+            self.dates[-1],
+        )
+
+        # Float data is only kept as float32 for float32 columns.
+        self.assertEqual(window_dtypes, {float64_dtype})
+        self.assertEqual(results['close'].dtype, float64_dtype)
+
+    def test_incremental_engine_with_adjustments(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = USEquityPricing.high
+        apply_idxs = [3, 10, 16]
+
+        adjustments = DataFrame.from_records(
+            [
+                dict(
+                    kind=MULTIPLY,
+                    sid=asset_ids[1],
+                    value=value,
+                    start_date=None,
+                    end_date=dates[idx - 1],
+                    apply_date=dates[idx],
+                )
+                for idx, value in zip(apply_idxs, [2.0, 3.0, 5.0])
+            ]
+        )
+        high_base = DataFrame(
+            self.make_frame(arange(len(dates) * 3.0).reshape(-1, 3))
+        )
+        high_loader = DataFrameLoader(high, high_base, adjustments)
+
+        simple = SimplePipelineEngine(
+            {high: high_loader}.__getitem__,
+            self.dates,
+            self.asset_finder,
+        )
+        incremental = IncrementalPipelineEngine(
+            {high: high_loader}.__getitem__,
+            self.dates,
+            self.asset_finder,
+            prefetch_length=5,
+        )
+
+        window_length = 3
+        pipe = Pipeline(
+            columns={
+                'mavg': SimpleMovingAverage(
+                    inputs=[high],
+                    window_length=window_length,
+                ),
+                'rank': high.latest.rank(),
+                'sum': RollingSumSum(inputs=[high], window_length=2),
+            },
+        )
+        expected = simple.run_pipeline(
+            pipe,
+            dates[window_length],
+            dates[-1],
+        )
+
+        # Skip a day in the middle to check that windows are stepped over
+        # rows that were never requested.
+        to_request = dates[window_length:].delete(4)
+        for date in to_request:
+            result = incremental.run_pipeline(pipe, date, date)
+            assert_frame_equal(
+                result.sort_index(axis=1),
+                expected.loc[[date]].sort_index(axis=1),
+            )
+
+        # Going backwards rebuilds the engine's state.
+        date = dates[window_length + 1]
+        assert_frame_equal(
+            incremental.run_pipeline(pipe, date, date).sort_index(axis=1),
+            expected.loc[[date]].sort_index(axis=1),
+        )
+
+    def test_shared_windows_with_adjustments(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = USEquityPricing.high
+
+        adjustments = DataFrame.from_records(
+            [
+                dict(
+                    kind=MULTIPLY,
+                    sid=asset_ids[1],
+                    value=value,
+                    start_date=None,
+                    end_date=dates[idx - 1],
+                    apply_date=dates[idx],
+                )
+                for idx, value in zip([3, 10, 16], [2.0, 3.0, 5.0])
+            ]
+        )
+        high_base = DataFrame(
+            self.make_frame(arange(len(dates) * 3.0).reshape(-1, 3))
+        )
+        engine = SimplePipelineEngine(
+            {high: DataFrameLoader(high, high_base, adjustments)}.__getitem__,
+            self.dates,
+            self.asset_finder,
+        )
+
+        # The first three terms read the same window of `high`, so they
+        # should share a single traversal.  The last reads a shorter window.
+        columns = {
+            'mavg': SimpleMovingAverage(inputs=[high], window_length=3),
+            'sum': RollingSumSum(inputs=[high], window_length=3),
+            'id': AssetIDPlusDay(inputs=[high], window_length=3),
+            'short_sum': RollingSumSum(inputs=[high], window_length=2),
+        }
+        start, end = dates[3], dates[-1]
+
+        traverse = AdjustedArray.traverse
+        with patch.object(
+            AdjustedArray,
+            'traverse',
+            autospec=True,
+            side_effect=traverse,
+        ) as mock_traverse:
+            result = engine.run_pipeline(Pipeline(columns=columns), start, end)
+        self.assertEqual(mock_traverse.call_count, 2)
+
+        for name, term in iteritems(columns):
+            expected = engine.run_pipeline(
+                Pipeline(columns={name: term}),
+                start,
+                end,
+            )
+            assert_frame_equal(result[[name]], expected)
+
 
 class SyntheticBcolzTestCase(WithAdjustmentReader,
                              ZiplineTestCase):
@@ -1061,6 +1256,52 @@ class SyntheticBcolzTestCase(WithAdjustmentReader,
 
         assert_frame_equal(expected, result)
 
+    def test_float32_pricing(self):
+        engine = SimplePipelineEngine(
+            lambda column: self.pipeline_loader,
+            self.env.trading_days,
+            self.asset_finder,
+        )
+        window_length = 5
+        dates = date_range(
+            self.first_asset_start + self.env.trading_day,
+            self.last_asset_end,
+            freq=self.env.trading_day,
+        )
+        dates_to_test = dates[window_length:]
+
+        window_dtypes = set()
+
+        class Float32Mean(CustomFactor):
+            inputs = (USEquityPricingFloat32.close,)
+            dtype = float32_dtype
+
+            def compute(self, today, assets, out, close):
+                window_dtypes.add(close.dtype)
+                out[:] = nanmean(close, axis=0)
+
+        results = engine.run_pipeline(
+            Pipeline(
+                columns={
+                    'float32': Float32Mean(window_length=window_length),
+                    'float64': SimpleMovingAverage(
+                        inputs=(USEquityPricing.close,),
+                        window_length=window_length,
+                    ),
+                },
+            ),
+            dates_to_test[0],
+            dates_to_test[-1],
+        )
+
+        self.assertEqual(window_dtypes, {float32_dtype})
+        self.assertEqual(results['float32'].dtype, float32_dtype)
+        assert_almost_equal(
+            results['float32'].values,
+            results['float64'].values,
+            decimal=3,
+        )
+
 
 class ParameterizedFactorTestCase(WithTradingEnvironment, ZiplineTestCase):
     sids = ASSET_FINDER_EQUITY_SIDS = Int64Index([1, 2, 3])
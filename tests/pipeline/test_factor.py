@@ -7,6 +7,7 @@ from nose_parameterized import parameterized
 from unittest import TestCase
 
 from toolz import compose
+from pandas import qcut
 from numpy import (
     apply_along_axis,
     arange,
@@ -23,8 +24,14 @@ from numpy import (
 from numpy.random import randn, seed
 
 from zipline.errors import UnknownRankMethod
+from zipline.lib.quantiles import quantiles
 from zipline.lib.rank import masked_rankdata_2d
-from zipline.lib.normalize import naive_grouped_rowwise_apply as grouped_apply
+from zipline.lib.normalize import (
+    demean,
+    grouped_rowwise_apply,
+    naive_grouped_rowwise_apply as grouped_apply,
+    zscore,
+)
 from zipline.pipeline import Classifier, Factor, Filter, TermGraph
 from zipline.pipeline.factors import (
     Returns,
@@ -629,6 +636,23 @@ class FactorTestCase(BasePipelineTestCase):
             mask=self.build_mask(nomask),
         )
 
+    @parameter_space(
+        seed_value=[1, 2],
+        func=[demean, zscore],
+        nlabels=[1, 3, 500],
+    )
+    def test_vectorized_grouped_transforms(self, seed_value, func, nlabels):
+        seed(seed_value)
+        data = randn(30, 40)
+        data[randn(30, 40) > 1.5] = nan
+        labels = (abs(randn(30, 40)) * nlabels).astype(int64_dtype) % nlabels
+
+        check_allclose(
+            grouped_rowwise_apply(data, labels, func),
+            grouped_apply(data, labels, func),
+            atol=1e-12,
+        )
+
     @parameter_space(method_name=['demean', 'zscore'])
     def test_cant_normalize_non_float(self, method_name):
         class DateFactor(Factor):
@@ -832,6 +856,19 @@ class FactorTestCase(BasePipelineTestCase):
             mask=self.build_mask(self.ones_mask(shape=shape)),
         )
 
+    @parameter_space(seed_value=[1, 2, 3], bins=[2, 3, 5, 10])
+    def test_quantiles_matches_qcut(self, seed_value, bins):
+        seed(seed_value)
+        data = randn(20, 50)
+        data[randn(20, 50) > 1.5] = nan
+
+        expected = array([qcut(row, bins, labels=False) for row in data])
+        check_arrays(quantiles(data, bins), expected)
+
+        bounds = [0, .1, .25, .5, .9]
+        expected = array([qcut(row, bounds, labels=False) for row in data])
+        check_arrays(quantiles(data, bounds), expected)
+
     def test_quantile_helpers(self):
         f = self.f
         m = Mask()
@@ -18,6 +18,7 @@ from numpy import (
 )
 from numpy.testing import assert_almost_equal
 import pandas as pd
+from pandas.util.testing import assert_frame_equal
 from pandas import (
     concat,
     DataFrame,
@@ -41,6 +42,7 @@ from zipline.errors import (
 )
 from zipline.lib.adjustment import MULTIPLY
 from zipline.pipeline import Pipeline
+from zipline.pipeline.engine import IncrementalPipelineEngine
 from zipline.pipeline.factors import VWAP
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.loaders.frame import DataFrameLoader
@@ -550,6 +552,58 @@ class PipelineAlgorithmTestCase(WithBcolzDailyBarReaderFromCSVs,
             overwrite_sim_params=False,
         )
 
+    @parameterized.expand([
+        (True,),
+        (False,),
+    ])
+    def test_incremental_pipeline(self, set_screen):
+        window_lengths = [1, 2, 5, 10]
+
+        def initialize(context):
+            pipeline = Pipeline()
+            for length in window_lengths:
+                pipeline.add(VWAP(window_length=length), 'vwap_%d' % length)
+
+            filter_ = (USEquityPricing.close.latest > 300)
+            pipeline.add(filter_, 'filter')
+            if set_screen:
+                pipeline.set_screen(filter_)
+
+            attach_pipeline(pipeline, 'test')
+            context.outputs = {}
+
+        def before_trading_start(context, data):
+            context.outputs[get_datetime()] = pipeline_output('test')
+
+        def run(incremental_pipeline):
+            algo = TradingAlgorithm(
+                initialize=initialize,
+                handle_data=lambda context, data: None,
+                before_trading_start=before_trading_start,
+                data_frequency='daily',
+                get_pipeline_loader=lambda column: self.pipeline_loader,
+                start=self.dates[max(window_lengths)],
+                end=self.dates[-1],
+                env=self.env,
+                incremental_pipeline=incremental_pipeline,
+            )
+            algo.run(FakeDataPortal(), overwrite_sim_params=False)
+            return algo
+
+        expected = run(incremental_pipeline=False)
+        result = run(incremental_pipeline=True)
+        self.assertIsInstance(result.engine, IncrementalPipelineEngine)
+
+        # The incremental engine sees the same results every day, including
+        # across AAPL's split.
+        self.assertEqual(
+            sorted(result.outputs),
+            sorted(expected.outputs),
+        )
+        self.assertIn(self.AAPL_split_date, result.outputs)
+        for dt, frame in iteritems(expected.outputs):
+            assert_frame_equal(result.outputs[dt], frame)
+
     def test_empty_pipeline(self):
 
         # For ensuring we call before_trading_start.
@@ -21,7 +21,7 @@ from zipline.pipeline import (
     Filter,
     TermGraph,
 )
-from zipline.pipeline.data import Column, DataSet
+from zipline.pipeline.data import Column, DataSet, USEquityPricingFloat32
 from zipline.pipeline.data.testing import TestingDataSet
 from zipline.pipeline.term import AssetExists, NotSpecified
 from zipline.pipeline.expression import NUMEXPR_MATH_FUNCS
@@ -29,6 +29,7 @@ from zipline.utils.numpy_utils import (
     bool_dtype,
     complex128_dtype,
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     NoDefaultMissingValue,
@@ -483,6 +484,18 @@ class ObjectIdentityTestCase(TestCase):
             # property of correctly handling `NaN`.
             self.assertIs(column.missing_value, column.latest.missing_value)
 
+    def test_float32_factors(self):
+        close = USEquityPricingFloat32.close.latest
+        self.assertIsInstance(close, Factor)
+        self.assertEqual(close.dtype, float32_dtype)
+
+        # Comparisons coerce scalars to the factor's dtype.
+        self.assertIsInstance(close > 5, Filter)
+
+        # Arithmetic is only defined between float64 factors.
+        with self.assertRaises(TypeError):
+            close + close
+
     def test_failure_timing_on_bad_dtypes(self):
 
         # Just constructing a bad column shouldn't fail.
@@ -15,6 +15,7 @@
 from collections import namedtuple
 import datetime
 from datetime import timedelta
+from operator import itemgetter
 from textwrap import dedent
 from unittest import TestCase, skip
 
@@ -797,6 +798,150 @@ def before_trading_start(context, data):
         with self.assertRaises(OrderInBeforeTradingStart):
             algo.run(self.data_portal)
 
+    def test_order_target_percents(self):
+        algotext = dedent("""
+        from zipline.api import sid, {order_func}
+
+        def initialize(context):
+            context.weights = {{sid(0): 0.25, sid(1): -0.1, sid(133): 0}}
+
+        def handle_data(context, data):
+            {order_call}
+        """)
+        batched = TradingAlgorithm(
+            script=algotext.format(
+                order_func='order_target_percents',
+                order_call='order_target_percents(context.weights)',
+            ),
+            sim_params=self.sim_params,
+            env=self.env,
+        ).run(self.data_portal)
+        looped = TradingAlgorithm(
+            script=algotext.format(
+                order_func='order_target_percent',
+                order_call=(
+                    'for asset, weight in context.weights.items(): '
+                    'order_target_percent(asset, weight)'
+                ),
+            ),
+            sim_params=self.sim_params,
+            env=self.env,
+        ).run(self.data_portal)
+
+        def by_sid(positions):
+            return [sorted(day, key=itemgetter('sid')) for day in positions]
+
+        self.assertEqual(by_sid(batched.positions), by_sid(looped.positions))
+        self.assertEqual(len(batched.positions.iloc[-1]), 2)
+
+    def test_order_batch(self):
+        # Zero amounts place no order, and fractional amounts are truncated
+        # towards zero as in order.
+        amounts = [10, 0, 2.5, -3.00001]
+
+        def make_algorithm(place_orders):
+            def initialize(context):
+                context.assets = [
+                    context.sid(0),
+                    context.sid(1),
+                    context.sid(133),
+                    context.sid(1),
+                ]
+                context.order_ids = []
+
+            def handle_data(context, data):
+                context.order_ids.append(place_orders(context))
+
+            return TradingAlgorithm(
+                initialize=initialize,
+                handle_data=handle_data,
+                sim_params=self.sim_params,
+                env=self.env,
+            )
+
+        batched = make_algorithm(
+            lambda context: context.order_batch(context.assets, amounts),
+        )
+        batched_results = batched.run(self.data_portal)
+        looped = make_algorithm(
+            lambda context: [
+                context.order(asset, amount)
+                for asset, amount in zip(context.assets, amounts)
+            ],
+        )
+        looped_results = looped.run(self.data_portal)
+
+        def placed(algo):
+            # The (sid, amount) of the order at each position of the
+            # returned ids, or None where no order was placed.
+            return [
+                [
+                    None if order_id is None else (
+                        algo.blotter.orders[order_id].sid.sid,
+                        algo.blotter.orders[order_id].amount,
+                    )
+                    for order_id in order_ids
+                ]
+                for order_ids in algo.order_ids
+            ]
+
+        self.assertEqual(
+            placed(batched),
+            [[(0, 10), None, (133, 2), (1, -3)]] * len(batched.order_ids),
+        )
+        self.assertEqual(placed(batched), placed(looped))
+
+        def by_sid(positions):
+            return [sorted(day, key=itemgetter('sid')) for day in positions]
+
+        self.assertEqual(
+            by_sid(batched_results.positions),
+            by_sid(looped_results.positions),
+        )
+
+    def test_run_with_profile(self):
+        algotext = dedent("""
+        from zipline.api import order, schedule_function, sid
+
+        def initialize(context):
+            schedule_function(rebalance)
+
+        def rebalance(context, data):
+            order(sid(0), 1)
+
+        def handle_data(context, data):
+            data.current(sid(0), 'price')
+        """)
+        algo = TradingAlgorithm(
+            script=algotext,
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+        results, profile = algo.run(self.data_portal, profile=True)
+        num_sessions = len(self.sim_params.trading_days)
+
+        self.assertEqual(len(results), num_sessions)
+        self.assertTrue(
+            profile.daily_seconds.index.equals(self.sim_params.trading_days),
+        )
+        calls = profile.totals.calls
+        for phase in ('handle_data',
+                      'scheduled_functions',
+                      'before_trading_start',
+                      'risk_update',
+                      'perf_packet'):
+            self.assertEqual(calls[phase], num_sessions)
+        self.assertGreaterEqual(calls['process_order'], num_sessions)
+        self.assertGreaterEqual(
+            calls['data_portal.get_spot_value'],
+            num_sessions,
+        )
+
+        # The instrumentation is removed after the run.
+        self.assertNotIn('get_transactions', vars(algo.blotter))
+        self.assertNotIn('get_spot_value', vars(self.data_portal))
+        self.assertEqual(algo.run(self.data_portal).shape, results.shape)
+
     def test_run_twice(self):
         algo1 = TestRegisterTransformAlgorithm(
             sim_params=self.sim_params,
@@ -1966,6 +2111,27 @@ class TestTradingControls(WithSimParams, WithDataPortal, ZiplineTestCase):
                                            env=self.env)
         self.check_algo_fails(algo, handle_data, 0)
 
+    def test_order_batch_violation(self):
+        # The second order is too large.  Its violation is raised before the
+        # first order, which would have passed on its own, is placed.
+        def initialize(algo):
+            algo.set_max_order_size(max_shares=10)
+
+        def handle_data(algo, data):
+            algo.order_batch([self.asset, self.another_asset], [5, 20])
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+        with self.assertRaises(TradingControlViolation) as e:
+            algo.run(self.data_portal)
+        self.assertEqual(e.exception.kwargs['asset'], self.another_asset)
+        self.assertEqual(e.exception.kwargs['amount'], 20)
+        self.assertEqual(algo.blotter.orders, {})
+
     def test_set_do_not_order_list(self):
         # set the restricted list to be the sid, and fail.
         algo = SetDoNotOrderListAlgorithm(
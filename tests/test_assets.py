@@ -27,7 +27,8 @@ import warnings
 
 from nose.tools import raises
 from nose_parameterized import parameterized
-from numpy import full, int32, int64
+from numpy import array, full, int32, int64
+from numpy.testing import assert_array_equal
 import pandas as pd
 from pandas.util.testing import assert_frame_equal
 from six import PY2
@@ -585,6 +586,88 @@ class AssetFinderTestCase(ZiplineTestCase):
         # it has a later start_date
         check(3, pd.Timestamp('2011-01-01'))
 
+    def test_lookup_symbols_as_of(self):
+        df = pd.DataFrame.from_records(
+            [
+                {
+                    'sid': 1,
+                    'symbol': 'multiple',
+                    'start_date': pd.Timestamp('2010-01-01'),
+                    'end_date': pd.Timestamp('2012-01-01'),
+                    'exchange': 'NYSE'
+                },
+                {
+                    'sid': 2,
+                    'symbol': 'multiple',
+                    'start_date': pd.Timestamp('2010-01-01'),
+                    'end_date': pd.Timestamp('2013-01-01'),
+                    'exchange': 'NYSE'
+                },
+                {
+                    'sid': 3,
+                    'symbol': 'multiple',
+                    'start_date': pd.Timestamp('2011-01-01'),
+                    'end_date': pd.Timestamp('2012-01-01'),
+                    'exchange': 'NYSE'
+                },
+                {
+                    'sid': 4,
+                    'symbol': 'multiple',
+                    'start_date': pd.Timestamp('2014-01-01'),
+                    'end_date': pd.Timestamp('2015-01-01'),
+                    'exchange': 'NYSE'
+                },
+                {
+                    'sid': 5,
+                    'symbol': 'other.a',
+                    'start_date': pd.Timestamp('2010-01-01'),
+                    'end_date': pd.Timestamp('2015-01-01'),
+                    'exchange': 'NYSE'
+                },
+            ]
+        )
+        self.write_assets(equities=df)
+        finder = self.asset_finder
+
+        symbols = [
+            'MULTIPLE',
+            'MULTIPLE',
+            'MULTIPLE',
+            'MULTIPLE',
+            'MULTIPLE',
+            'MULTIPLE',
+            'OTHER_A',
+            'OTHER',
+            'MISSING',
+            'MULTIPLE',
+        ]
+        dates = pd.to_datetime([
+            '2010-12-31',
+            '2011-01-01 12:00',
+            # Sid 3 has ended, but sid 2 is still alive.
+            '2012-06-01',
+            # Nothing is alive; sid 2 ended most recently.
+            '2013-06-01',
+            '2014-06-01',
+            # After every asset has ended.
+            '2016-01-01',
+            '2012-01-01',
+            '2012-01-01',
+            '2012-01-01',
+            # Before any asset started.
+            '2009-01-01',
+        ])
+        expected = array([2, 3, 2, 2, 4, 4, 5, -1, -1, -1])
+        result = finder.lookup_symbols_as_of(symbols, dates)
+        assert_array_equal(result, expected)
+
+        for symbol, date, sid in zip(symbols, dates, result):
+            if sid == -1:
+                with self.assertRaises(SymbolNotFound):
+                    finder.lookup_symbol(symbol, date)
+            else:
+                self.assertEqual(finder.lookup_symbol(symbol, date).sid, sid)
+
     def test_lookup_generic(self):
         """
         Ensure that lookup_generic works with various permutations of inputs.
@@ -753,6 +836,47 @@ class AssetFinderTestCase(ZiplineTestCase):
         self.assertEqual(len(ad_contracts), 6)
         self.assertEqual(ad_contracts[5].sid, 5)
 
+    def test_lookup_future_chain_missing_dates(self):
+        metadata = pd.DataFrame.from_records([
+            {
+                'symbol': 'ADN15',
+                'root_symbol': 'AD',
+                'expiration_date': pd.Timestamp('2015-08-14', tz='UTC'),
+            },
+            {
+                'symbol': 'ADV15',
+                'root_symbol': 'AD',
+                'notice_date': pd.Timestamp('2015-06-14', tz='UTC'),
+            },
+            # No notice or expiration date, so never in a dated chain.
+            {
+                'symbol': 'ADX15',
+                'root_symbol': 'AD',
+            },
+        ])
+        self.write_assets(futures=metadata)
+        finder = self.asset_finder
+
+        for dt, expected in (
+            ('2015-01-01', [1, 0]),
+            ('2015-06-14', [1, 0]),
+            ('2015-06-15', [0]),
+            ('2015-08-15', []),
+        ):
+            self.assertEqual(
+                finder.lookup_future_chain('AD', pd.Timestamp(dt, tz='UTC')),
+                expected,
+            )
+
+        chain = finder.lookup_future_chain('AD', pd.NaT)
+        self.assertEqual(sorted(chain), [0, 1, 2])
+        # Contracts are shared with the asset cache.
+        for contract in chain:
+            self.assertIs(finder.retrieve_asset(contract.sid), contract)
+
+        with self.assertRaises(RootSymbolNotFound):
+            finder.lookup_future_chain('XX', pd.NaT)
+
     def test_map_identifier_index_to_sids(self):
         # Build an empty finder and some Assets
         dt = pd.Timestamp('2014-01-01', tz='UTC')
@@ -1007,6 +1131,57 @@ class AssetFinderCachedEquitiesTestCase(AssetFinderTestCase):
         self.asset_finder.rehash_equities()
 
 
+class PreloadedAssetFinder(AssetFinder):
+
+    def __init__(self, engine):
+        super(PreloadedAssetFinder, self).__init__(engine, preload=True)
+
+
+class AssetFinderPreloadedTestCase(AssetFinderTestCase):
+    asset_finder_type = PreloadedAssetFinder
+
+    def write_assets(self, **kwargs):
+        super(AssetFinderPreloadedTestCase, self).write_assets(**kwargs)
+        self.asset_finder.preload()
+
+    def test_retrieve_all_preloaded(self):
+        equities = make_simple_equity_info(
+            [1, 3, 5],
+            start_date=pd.Timestamp('2014-01-01'),
+            end_date=pd.Timestamp('2015-01-01'),
+        )
+        futures = make_commodity_future_info(
+            first_sid=10,
+            root_symbols=['CL'],
+            years=[2014],
+        )
+        self.write_assets(equities=equities, futures=futures)
+        finder = self.asset_finder
+
+        sids = array([11, 5, 1, 10, 5])
+        results = finder.retrieve_all(sids)
+        self.assertEqual(list(map(int, results)), list(sids))
+        self.assertEqual(
+            list(map(type, results)),
+            [Future, Equity, Equity, Future, Equity],
+        )
+        self.assertIs(results[1], results[4])
+        self.assertIs(finder.retrieve_asset(5), results[1])
+        self.assertEqual(
+            results[2].start_date,
+            pd.Timestamp('2014-01-01', tz='UTC'),
+        )
+        self.assertEqual(results[0].root_symbol, 'CL')
+
+        self.assertEqual(
+            finder.retrieve_all([2, 3, 12345], default_none=True),
+            [None, finder.retrieve_asset(3), None],
+        )
+        with self.assertRaises(SidsNotFound) as e:
+            finder.retrieve_all([2, 3, 12345, 2])
+        self.assertEqual(e.exception.sids, [2, 12345])
+
+
 class TestFutureChain(WithAssetFinder, ZiplineTestCase):
     @classmethod
     def make_futures_info(cls):
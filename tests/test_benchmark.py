@@ -102,6 +102,36 @@ class TestBenchmark(WithDataPortal, WithSimParams, ZiplineTestCase):
                 manually_calculated[idx + 1]
             )
 
+    def test_environment_benchmark(self):
+        days = self.sim_params.trading_days[:3]
+        expected = self.env.benchmark_returns.loc[days]
+
+        daily_source = BenchmarkSource(None, self.env, days, self.data_portal)
+        minute_source = BenchmarkSource(
+            None, self.env, days, self.data_portal, emission_rate='minute',
+        )
+
+        for day, daily_return in expected.iteritems():
+            self.assertEqual(daily_source.get_value(day), daily_return)
+            self.assertEqual(
+                daily_source.get_return_since_open(day),
+                daily_return,
+            )
+
+            # Every minute of the day carries the day's return, compounded
+            # from the open.
+            minutes = self.env.market_minutes_for_day(day)
+            for minute in minutes[[0, 1, 200, -1]]:
+                self.assertEqual(minute_source.get_value(minute), daily_return)
+            for count in (1, 2, 201, len(minutes)):
+                self.assertAlmostEqual(
+                    minute_source.get_return_since_open(minutes[count - 1]),
+                    (1 + daily_return) ** count - 1,
+                )
+
+        with self.assertRaises(KeyError):
+            minute_source.get_value(days[0])
+
     def test_asset_not_trading(self):
         with self.assertRaises(BenchmarkAssetNotAvailableTooEarly) as exc:
             BenchmarkSource(
@@ -177,6 +207,50 @@ class TestBenchmark(WithDataPortal, WithSimParams, ZiplineTestCase):
                     manually_calculated[idx + 1]
                 )
 
+    def test_minute_benchmark_asset(self):
+        days = self.sim_params.trading_days[1:5]
+        minutes = self.env.minutes_for_days_in_range(
+            self.sim_params.trading_days[0],
+            days[-1],
+        )
+        data = create_minute_bar_data(minutes, [2])
+        # Leave gaps in the middle of a session and over a session's close,
+        # so that the returns read day by day have to forward fill both
+        # within and into a session.
+        first_close = self.env.market_minutes_for_day(days[0])[-1]
+        data[2] = data[2].drop(
+            minutes[100:110].append(pd.DatetimeIndex([first_close])),
+        )
+
+        with tmp_bcolz_minute_bar_reader(
+                self.env, self.env.trading_days, data) as reader:
+            data_portal = DataPortal(
+                self.env,
+                equity_minute_reader=reader,
+                equity_daily_reader=self.bcolz_daily_bar_reader,
+                adjustment_reader=self.adjustment_reader,
+            )
+            source = BenchmarkSource(
+                2, self.env, days, data_portal, emission_rate='minute',
+            )
+
+            sim_minutes = self.env.minutes_for_days_in_range(
+                days[0], days[-1],
+            )
+            expected = data_portal.get_history_window(
+                [2],
+                sim_minutes[-1],
+                bar_count=len(sim_minutes) + 1,
+                frequency='1m',
+                field='price',
+            )[2].pct_change()[1:]
+
+            for minute, expected_return in expected.iteritems():
+                self.assertAlmostEqual(
+                    source.get_value(minute),
+                    expected_return,
+                )
+
     def test_no_stock_dividends_allowed(self):
         # try to use sid(4) as benchmark, should blow up due to the presence
         # of a stock dividend
@@ -12,10 +12,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from numpy import array, isnan, nan
+from numpy.testing import assert_array_equal
 from pandas.tslib import Timedelta
 
+from zipline.assets import Equity
 from zipline.data.data_portal import DataPortal
 from zipline.testing.fixtures import WithTradingEnvironment, ZiplineTestCase
+from zipline.utils.factory import create_simulation_parameters
 import pandas as pd
 
 
@@ -71,3 +75,127 @@ class TestDataPortal(WithTradingEnvironment, ZiplineTestCase):
             390 + 390 + 210 + 31,
             self.data_portal._get_minute_count_for_transform(nov_30_dt, 4)
         )
+
+    def test_extra_source_lookups(self):
+        aapl = Equity(1, symbol='AAPL')
+        ibm = Equity(2, symbol='IBM')
+        source_df = pd.DataFrame(
+            {
+                'sid': [aapl, 'PALLADIUM', ibm, aapl],
+                'signal': [1.0, 2.0, 3.0, 4.0],
+            },
+            index=pd.to_datetime(
+                ['2015-07-06', '2015-07-07', '2015-07-08', '2015-07-09'],
+                utc=True,
+            ),
+        )
+        sim_params = create_simulation_parameters(
+            start=pd.Timestamp('2015-07-06', tz='UTC'),
+            end=pd.Timestamp('2015-07-10', tz='UTC'),
+            env=self.env,
+        )
+        self.data_portal.handle_extra_source(source_df, sim_params)
+
+        missing = Equity(3, symbol='MSFT')
+        assets = [aapl, ibm, 'PALLADIUM', missing]
+        expected = {
+            '2015-07-06': ([aapl], [1.0, nan, nan, nan]),
+            '2015-07-07': ([aapl], [1.0, nan, 2.0, nan]),
+            '2015-07-08': ([aapl, ibm], [1.0, 3.0, 2.0, nan]),
+            '2015-07-09': ([aapl, ibm], [4.0, 3.0, 2.0, nan]),
+            # Forward filled past the last row of the source.
+            '2015-07-10': ([aapl, ibm], [4.0, 3.0, 2.0, nan]),
+        }
+        for day, (fetcher_assets, values) in sorted(expected.items()):
+            dt = pd.Timestamp(day, tz='UTC') + Timedelta('10 hours')
+            self.assertEqual(
+                set(self.data_portal.get_fetcher_assets(dt)),
+                set(fetcher_assets),
+            )
+            assert_array_equal(
+                self.data_portal.get_extra_source_values(assets, 'signal', dt)
+                .astype(float),
+                array(values),
+            )
+            for asset, value in zip(assets[:-1], values):
+                assert_array_equal(
+                    self.data_portal.get_spot_value(
+                        asset, 'signal', dt, 'daily',
+                    ),
+                    value,
+                )
+
+        self.assertTrue(self.data_portal.contains(aapl, 'signal'))
+        self.assertFalse(self.data_portal.contains(missing, 'signal'))
+
+        # Days outside of the simulation have no data.
+        outside = pd.Timestamp('2015-07-13', tz='UTC')
+        self.assertEqual(self.data_portal.get_fetcher_assets(outside), [])
+        assert_array_equal(
+            self.data_portal.get_extra_source_values(
+                assets, 'signal', outside,
+            ),
+            array([nan] * 4),
+        )
+
+    def test_extra_source_merged_across_calls(self):
+        aapl = Equity(1, symbol='AAPL')
+        ibm = Equity(2, symbol='IBM')
+        sim_params = create_simulation_parameters(
+            start=pd.Timestamp('2015-07-06', tz='UTC'),
+            end=pd.Timestamp('2015-07-10', tz='UTC'),
+            env=self.env,
+        )
+        index = pd.to_datetime(['2015-07-06', '2015-07-07'], utc=True)
+        self.data_portal.handle_extra_source(
+            pd.DataFrame(
+                {'sid': [aapl, 'PALLADIUM'], 'signal': [1.0, 2.0]},
+                index=index,
+            ),
+            sim_params,
+        )
+        # A second source with the same column adds IBM and replaces
+        # PALLADIUM, and keeps AAPL.
+        self.data_portal.handle_extra_source(
+            pd.DataFrame(
+                {'sid': [ibm, 'PALLADIUM'], 'signal': [3.0, 4.0]},
+                index=index,
+            ),
+            sim_params,
+        )
+
+        dt = pd.Timestamp('2015-07-08 10:00', tz='UTC')
+        assets = [aapl, ibm, 'PALLADIUM']
+        assert_array_equal(
+            self.data_portal.get_extra_source_values(assets, 'signal', dt),
+            array([1.0, 3.0, 4.0]),
+        )
+        for asset, value in zip(assets, [1.0, 3.0, 4.0]):
+            self.assertEqual(
+                self.data_portal.get_spot_value(asset, 'signal', dt, 'daily'),
+                value,
+            )
+            self.assertTrue(self.data_portal.contains(asset, 'signal'))
+
+    def test_extra_source_spot_value_before_source(self):
+        aapl = Equity(1, symbol='AAPL')
+        source_df = pd.DataFrame(
+            {'sid': [aapl, 'PALLADIUM'], 'signal': [1.0, 2.0]},
+            index=pd.to_datetime(['2015-07-08', '2015-07-08'], utc=True),
+        )
+        sim_params = create_simulation_parameters(
+            start=pd.Timestamp('2015-07-06', tz='UTC'),
+            end=pd.Timestamp('2015-07-10', tz='UTC'),
+            env=self.env,
+        )
+        self.data_portal.handle_extra_source(source_df, sim_params)
+
+        # Before the first row of the source, both inside and outside of the
+        # simulation's days.
+        for day in '2015-07-02', '2015-07-06', '2015-07-07':
+            dt = pd.Timestamp(day, tz='UTC') + Timedelta('10 hours')
+            for asset in aapl, 'PALLADIUM':
+                value = self.data_portal.get_spot_value(
+                    asset, 'signal', dt, 'daily',
+                )
+                self.assertTrue(isnan(value), (day, asset, value))
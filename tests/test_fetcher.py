@@ -196,6 +196,45 @@ def handle_data(context, data):
         self.assertEqual(5, results["ibm_signal"].iloc[-1])
         self.assertEqual(5, results["dell_signal"].iloc[-1])
 
+    def test_fetch_csv_twice_with_same_column(self):
+        self.responses.add(
+            self.responses.GET,
+            'https://fake.urls.com/aapl_csv_data.csv',
+            body=AAPL_CSV_DATA,
+            content_type='text/csv',
+        )
+        self.responses.add(
+            self.responses.GET,
+            'https://fake.urls.com/multi_signal_csv_data.csv',
+            body=MULTI_SIGNAL_CSV_DATA,
+            content_type='text/csv',
+        )
+
+        results = self.run_algo(
+            """
+from zipline.api import fetch_csv, record, sid
+
+def initialize(context):
+    fetch_csv('https://fake.urls.com/aapl_csv_data.csv')
+    fetch_csv('https://fake.urls.com/multi_signal_csv_data.csv')
+
+def handle_data(context, data):
+    signals = data.current([sid(24), sid(3766), sid(25317)], "signal")
+    record(aapl_signal=signals[sid(24)])
+    record(ibm_signal=signals[sid(3766)])
+    record(dell_signal=signals[sid(25317)])
+    record(aapl_spot_signal=data.current(sid(24), "signal"))
+    """)
+
+        # The second fetch_csv adds to the signals of the first.
+        self.assertEqual(5, results["aapl_signal"].iloc[-1])
+        self.assertEqual(5, results["ibm_signal"].iloc[-1])
+        self.assertEqual(5, results["dell_signal"].iloc[-1])
+        np.testing.assert_array_equal(
+            results["aapl_signal"],
+            results["aapl_spot_signal"],
+        )
+
     def test_fetch_csv_with_pure_signal_file(self):
         self.responses.add(
             self.responses.GET,
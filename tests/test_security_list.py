@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+from numpy.testing import assert_array_equal
 import pandas as pd
 from testfixtures import TempDirectory
 
@@ -15,6 +16,7 @@ from zipline.testing import (
 from zipline.testing.fixtures import WithLogger, ZiplineTestCase
 from zipline.utils import factory
 from zipline.utils.security_list import (
+    SecurityList,
     SecurityListSet,
     load_from_directory,
 )
@@ -155,6 +157,59 @@ class SecurityListTestCase(WithLogger, ZiplineTestCase):
         for sid in shouldnt_exist:
             self.assertNotIn(sid, rl.leveraged_etf_list)
 
+    def test_point_in_time_membership(self):
+        kd1, kd2, kd3 = pd.to_datetime(
+            ['2015-01-01', '2015-02-01', '2015-03-01'], utc=True,
+        )
+        lookup_date = self.extra_knowledge_date
+        data = {
+            kd1: {lookup_date: {'add': ['BZQ', 'URTY'], 'delete': []}},
+            kd2: {lookup_date: {'add': ['AAPL'], 'delete': ['BZQ']}},
+            kd3: {lookup_date: {'add': ['BZQ'], 'delete': ['NOTASYMBOL']}},
+        }
+        bzq, urty, aapl = sids = [
+            self.env.asset_finder.lookup_symbol(
+                symbol, as_of_date=lookup_date,
+            ).sid
+            for symbol in ['BZQ', 'URTY', 'AAPL']
+        ]
+
+        dt = [kd3]
+        rl = SecurityList(data, lambda: dt[0], self.env.asset_finder)
+
+        # Query the latest date first to check that earlier dates aren't
+        # affected by later changes.
+        cases = [
+            (kd3, {bzq, urty, aapl}),
+            (kd1 - pd.Timedelta(days=1), set()),
+            (kd1, {bzq, urty}),
+            (kd2 + pd.Timedelta(days=1), {urty, aapl}),
+            (kd3 + pd.Timedelta(days=100), {bzq, urty, aapl}),
+        ]
+        for date, expected in cases:
+            dt[0] = date
+            self.assertEqual(set(rl), expected)
+            for sid in sids:
+                self.assertEqual(sid in rl, sid in expected)
+            assert_array_equal(
+                rl.contains_many(sids),
+                [sid in expected for sid in sids],
+            )
+            assert_array_equal(
+                rl.contains_many(sids, kd1),
+                [True, True, False],
+            )
+
+        self.assertEqual(
+            sorted(rl.intervals.itertuples(index=False)),
+            sorted([
+                (bzq, kd1.value, kd2.value),
+                (bzq, kd3.value, rl.intervals.end.max()),
+                (urty, kd1.value, rl.intervals.end.max()),
+                (aapl, kd2.value, rl.intervals.end.max()),
+            ]),
+        )
+
     def test_security_add(self):
         def get_datetime():
             return pd.Timestamp("2015-01-27", tz='UTC')
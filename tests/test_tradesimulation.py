@@ -19,6 +19,14 @@ from nose_parameterized import parameterized
 from six.moves import range
 from unittest import TestCase
 from zipline import TradingAlgorithm
+from zipline.finance.trading import TradingEnvironment
+from zipline.gens.sim_engine import (
+    BAR,
+    DAY_END,
+    DAY_START,
+    MINUTE_END,
+    MinuteSimulationClock,
+)
 from zipline.sources.benchmark_source import BenchmarkSource
 from zipline.test_algorithms import NoopAlgorithm
 from zipline.utils import factory
@@ -81,3 +89,42 @@ class TestTradeSimulation(TestCase):
                 pd.DatetimeIndex(algo.before_trading_at)),
                 "Expected %s but was %s."
                 % (params.trading_days, algo.before_trading_at))
+
+    @parameterized.expand([('minute_emission', True),
+                           ('daily_emission', False)])
+    def test_minute_clock(self, name, minute_emission):
+        env = TradingEnvironment()
+        # Includes the early close on the day after Thanksgiving.
+        trading_days = env.days_in_range(
+            pd.Timestamp('2015-11-25', tz='UTC'),
+            pd.Timestamp('2015-11-30', tz='UTC'),
+        )
+        start_idx = env.get_index(trading_days[0])
+        stop_idx = start_idx + len(trading_days)
+        clock = MinuteSimulationClock(
+            trading_days,
+            env.calendar_index.opens[start_idx:stop_idx],
+            env.calendar_index.closes[start_idx:stop_idx],
+            env.trading_days,
+            minute_emission,
+        )
+
+        events = []
+        for dt, action in clock:
+            if action == BAR:
+                # The raw minute matches the emitted Timestamp.
+                self.assertEqual(clock.current_minute, dt.value)
+            events.append((dt, action))
+
+        expected = []
+        for day in trading_days:
+            expected.append((day, DAY_START))
+            minutes = env.market_minutes_for_day(day)
+            for minute in minutes:
+                expected.append((minute, BAR))
+                if minute_emission:
+                    expected.append((minute, MINUTE_END))
+            if not minute_emission:
+                expected.append((minutes[-1], DAY_END))
+
+        self.assertEqual(events, expected)
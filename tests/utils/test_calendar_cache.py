@@ -0,0 +1,136 @@
+from os import listdir
+from os.path import join
+from unittest import TestCase
+
+from pandas import DatetimeIndex, Timestamp
+from pandas.util.testing import assert_index_equal
+from testfixtures import TempDirectory
+
+from zipline.utils.calendar_cache import (
+    cached_calendar_dates,
+    calendar_cache_dir,
+    rules_key,
+)
+
+
+def fridays(start, end):
+    fridays.calls += 1
+    return DatetimeIndex(
+        start=start,
+        end=end,
+        freq='W-FRI',
+        tz='UTC',
+    )
+
+
+def mondays(start, end):
+    return DatetimeIndex(
+        start=start,
+        end=end,
+        freq='W-MON',
+        tz='UTC',
+    )
+
+
+class CalendarCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.dir_ = TempDirectory()
+        fridays.calls = 0
+
+    def tearDown(self):
+        self.dir_.cleanup()
+
+    def test_cached_calendar_dates(self):
+        start = Timestamp('2014-01-01', tz='UTC')
+        end = Timestamp('2014-06-01', tz='UTC')
+        expected = fridays(start, end)
+        fridays.calls = 0
+
+        for _ in range(3):
+            result = cached_calendar_dates(
+                'fridays', fridays, start, end, cache_dir=self.dir_.path,
+            )
+            assert_index_equal(result, expected)
+            self.assertEqual(result.tz, expected.tz)
+
+        # Only the first call evaluated the rules.
+        self.assertEqual(fridays.calls, 1)
+        self.assertEqual(len(listdir(self.dir_.path)), 1)
+
+        # A later end in the same year, e.g. on the next day, reads the same
+        # cached entry.
+        end = Timestamp('2014-12-01', tz='UTC')
+        expected = fridays(start, end)
+        fridays.calls = 0
+        assert_index_equal(
+            cached_calendar_dates(
+                'fridays', fridays, start, end, cache_dir=self.dir_.path,
+            ),
+            expected,
+        )
+        self.assertEqual(fridays.calls, 0)
+
+        # An end in another year replaces the cached entry.
+        end = Timestamp('2015-03-01', tz='UTC')
+        expected = fridays(start, end)
+        fridays.calls = 0
+        assert_index_equal(
+            cached_calendar_dates(
+                'fridays', fridays, start, end, cache_dir=self.dir_.path,
+            ),
+            expected,
+        )
+        self.assertEqual(fridays.calls, 1)
+        self.assertEqual(len(listdir(self.dir_.path)), 1)
+
+    def test_corrupt_cache_file(self):
+        start = Timestamp('2014-01-01', tz='UTC')
+        end = Timestamp('2014-06-01', tz='UTC')
+        cached_calendar_dates(
+            'fridays', fridays, start, end, cache_dir=self.dir_.path,
+        )
+        name, = listdir(self.dir_.path)
+
+        # A truncated file, e.g. from a full disk.
+        path = join(self.dir_.path, name)
+        with open(path, 'rb') as f:
+            data = f.read()
+        with open(path, 'wb') as f:
+            f.write(data[:len(data) // 2])
+
+        assert_index_equal(
+            cached_calendar_dates(
+                'fridays', fridays, start, end, cache_dir=self.dir_.path,
+            ),
+            fridays(start, end),
+        )
+        # The corrupt file was replaced, and is read on the next call.
+        fridays.calls = 0
+        cached_calendar_dates(
+            'fridays', fridays, start, end, cache_dir=self.dir_.path,
+        )
+        self.assertEqual(fridays.calls, 0)
+
+    def test_rules_key(self):
+        start = Timestamp('2014-01-01', tz='UTC')
+        end = Timestamp('2014-06-01', tz='UTC')
+        key = rules_key('dates', fridays, start, end)
+
+        # Times of day are ignored.
+        self.assertEqual(
+            rules_key('dates', fridays, start, end + (end - start) / 1000),
+            key,
+        )
+        self.assertNotEqual(rules_key('dates', mondays, start, end), key)
+        self.assertNotEqual(rules_key('other', fridays, start, end), key)
+        self.assertNotEqual(
+            rules_key('dates', fridays, start, Timestamp('2015', tz='UTC')),
+            key,
+        )
+
+    def test_calendar_cache_dir(self):
+        self.assertEqual(
+            calendar_cache_dir({'ZIPLINE_ROOT': '/zipline'}),
+            '/zipline/cache/calendars',
+        )
@@ -0,0 +1,122 @@
+from unittest import TestCase
+
+from numpy import arange, concatenate, int64
+from numpy.testing import assert_array_equal
+from pandas import Timedelta, Timestamp
+
+from zipline.utils import tradingcalendar
+from zipline.utils.calendar_index import CalendarIndex, NANOS_IN_MINUTE
+
+
+class CalendarIndexTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Includes MLK day, a weekend, and the early close on the day after
+        # Thanksgiving.
+        cls.days = days = tradingcalendar.trading_days[
+            tradingcalendar.trading_days.slice_indexer(
+                '2015-01-14', '2015-01-22',
+            )
+        ].append(
+            tradingcalendar.trading_days[
+                tradingcalendar.trading_days.slice_indexer(
+                    '2015-11-25', '2015-11-30',
+                )
+            ]
+        )
+        open_and_closes = tradingcalendar.open_and_closes.loc[days]
+        cls.calendar_index = CalendarIndex(
+            days.asi8,
+            open_and_closes.market_open.values.view(int64),
+            open_and_closes.market_close.values.view(int64),
+        )
+        cls.minutes = concatenate([
+            arange(o, c + NANOS_IN_MINUTE, NANOS_IN_MINUTE)
+            for o, c in zip(
+                cls.calendar_index.opens,
+                cls.calendar_index.closes,
+            )
+        ])
+
+    def test_sessions(self):
+        calendar_index = self.calendar_index
+        days = self.days
+        at_or_before = calendar_index.session_index_at_or_before
+
+        mlk_day = Timestamp('2015-01-19', tz='UTC')
+        self.assertFalse(calendar_index.is_session(mlk_day.value))
+        self.assertEqual(
+            days[calendar_index.next_session_index(mlk_day.value)],
+            Timestamp('2015-01-20', tz='UTC'),
+        )
+        self.assertEqual(
+            days[calendar_index.previous_session_index(mlk_day.value)],
+            Timestamp('2015-01-16', tz='UTC'),
+        )
+        self.assertEqual(
+            days[at_or_before(mlk_day.value)],
+            Timestamp('2015-01-16', tz='UTC'),
+        )
+
+        for idx, day in enumerate(days):
+            # Any time during the day maps to that day's session.
+            dt = (day + Timedelta('15 hours')).value
+            self.assertTrue(calendar_index.is_session(dt))
+            self.assertEqual(calendar_index.session_index(day.value), idx)
+            self.assertEqual(at_or_before(dt), idx)
+            self.assertEqual(calendar_index.next_session_index(dt), idx + 1)
+            self.assertEqual(
+                calendar_index.previous_session_index(dt),
+                idx - 1,
+            )
+
+    def test_minutes(self):
+        calendar_index = self.calendar_index
+        minutes = self.minutes
+
+        self.assertEqual(calendar_index.minute_count, len(minutes))
+        assert_array_equal(
+            calendar_index.minutes_for_sessions(0, len(self.days)),
+            minutes,
+        )
+        assert_array_equal(
+            calendar_index.minute_at(arange(len(minutes))),
+            minutes,
+        )
+        for position in 0, 389, 390, 1000, len(minutes) - 1:
+            self.assertEqual(
+                calendar_index.minute_index(minutes[position]),
+                position,
+            )
+
+        # The early close on the day after Thanksgiving.
+        day_after_thanksgiving = self.days.get_loc(
+            Timestamp('2015-11-27', tz='UTC'),
+        )
+        self.assertEqual(
+            calendar_index.minutes_per_session[day_after_thanksgiving],
+            210,
+        )
+
+        before_open = minutes[0] - NANOS_IN_MINUTE
+        self.assertFalse(calendar_index.is_market_minute(before_open))
+        with self.assertRaises(KeyError):
+            calendar_index.minute_index(before_open)
+
+    def test_minute_window(self):
+        calendar_index = self.calendar_index
+        minutes = self.minutes
+
+        assert_array_equal(
+            calendar_index.minute_window(minutes[300], 900),
+            minutes[300:1200],
+        )
+        assert_array_equal(
+            calendar_index.minute_window(minutes[1200], 801, step=-1),
+            minutes[399:1201][::-1],
+        )
+        with self.assertRaises(IndexError):
+            calendar_index.minute_window(minutes[10], 12, step=-1)
+        with self.assertRaises(IndexError):
+            calendar_index.minute_window(minutes[-10], 11)
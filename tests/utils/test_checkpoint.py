@@ -0,0 +1,165 @@
+import os
+
+from mock import patch
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from zipline import TradingAlgorithm
+from zipline.errors import CheckpointMismatch
+from zipline.testing.fixtures import (
+    WithDataPortal,
+    WithInstanceTmpDir,
+    WithSimParams,
+    ZiplineTestCase,
+)
+from zipline.utils.checkpoint import (
+    STATE_FILENAME,
+    _write,
+    has_checkpoint,
+    read_checkpoint,
+)
+from zipline.utils.factory import create_simulation_parameters
+
+
+class Crash(Exception):
+    pass
+
+
+class CheckpointTestCase(WithInstanceTmpDir,
+                         WithDataPortal,
+                         WithSimParams,
+                         ZiplineTestCase):
+    START_DATE = pd.Timestamp('2006-01-03', tz='utc')
+    END_DATE = pd.Timestamp('2006-03-31', tz='utc')
+
+    ASSET_FINDER_EQUITY_SIDS = [1, 2]
+
+    COMPARED_COLUMNS = [
+        'capital_used',
+        'ending_cash',
+        'portfolio_value',
+        'algorithm_period_return',
+        'sharpe',
+        'max_drawdown',
+        'num_orders',
+    ]
+
+    def make_algorithm(self, crash_on=None, sim_params=None):
+        def initialize(context):
+            context.asset = context.sid(1)
+            context.session = 0
+
+        def handle_data(context, data):
+            if context.get_datetime().normalize() == crash_on:
+                raise Crash()
+
+            # Trade on alternate sessions so that the checkpoints are
+            # written with both positions and open orders.
+            if context.session % 2:
+                context.order(context.asset, context.session % 7 - 3)
+            context.record(session=context.session)
+            context.session += 1
+
+        return TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            sim_params=sim_params or self.sim_params,
+            env=self.env,
+        )
+
+    def num_orders(self, perf):
+        return perf.orders.map(len).cumsum()
+
+    def test_resume_matches_uninterrupted_run(self):
+        expected = self.make_algorithm().run(self.data_portal)
+        expected['num_orders'] = self.num_orders(expected)
+
+        path = self.instance_tmpdir.getpath('checkpoint')
+        crash_on = pd.Timestamp('2006-03-01', tz='utc')
+        with self.assertRaises(Crash):
+            self.make_algorithm(crash_on=crash_on).run(
+                self.data_portal,
+                checkpoint_dir=path,
+                checkpoint_every=5,
+            )
+        self.assertTrue(has_checkpoint(path))
+
+        checkpoint = read_checkpoint(path, self.env)
+        sessions = self.sim_params.trading_days
+        self.assertLess(checkpoint.session, crash_on)
+        self.assertEqual(
+            len(checkpoint.perfs),
+            sessions.get_loc(checkpoint.session) + 1,
+        )
+
+        # Keep checkpointing into the same directory after resuming.
+        result = self.make_algorithm().run(
+            self.data_portal,
+            checkpoint_dir=path,
+            checkpoint_every=5,
+            resume_from=path,
+        )
+        result['num_orders'] = self.num_orders(result)
+
+        assert_frame_equal(
+            result[self.COMPARED_COLUMNS],
+            expected[self.COMPARED_COLUMNS],
+        )
+        # The context was restored rather than restarted by initialize.
+        self.assertEqual(list(result.session), list(range(len(sessions))))
+
+    def test_checkpoint_files(self):
+        path = self.instance_tmpdir.getpath('checkpoint')
+        self.make_algorithm().run(
+            self.data_portal,
+            checkpoint_dir=path,
+            checkpoint_every=20,
+        )
+
+        # One perf file for each checkpoint, and none after the last session.
+        sessions = self.sim_params.trading_days
+        num_checkpoints = (len(sessions) - 1) // 20
+        self.assertEqual(
+            sorted(os.listdir(path)),
+            sorted(
+                ['perfs-%s' % session.strftime('%Y%m%d')
+                 for session in sessions[19::20][:num_checkpoints]] +
+                [STATE_FILENAME]
+            ),
+        )
+
+    def test_sim_params_mismatch(self):
+        path = self.instance_tmpdir.getpath('checkpoint')
+        with self.assertRaises(Crash):
+            self.make_algorithm(
+                crash_on=pd.Timestamp('2006-02-01', tz='utc'),
+            ).run(self.data_portal, checkpoint_dir=path, checkpoint_every=5)
+
+        sim_params = create_simulation_parameters(
+            start=self.sim_params.period_start,
+            end=self.sim_params.period_end,
+            capital_base=self.sim_params.capital_base * 2,
+            env=self.env,
+        )
+        with self.assertRaises(CheckpointMismatch) as e:
+            self.make_algorithm(sim_params=sim_params).run(
+                self.data_portal,
+                resume_from=path,
+            )
+        self.assertEqual(e.exception.kwargs['field'], 'capital_base')
+
+    def test_write_replaces_existing_file(self):
+        path = self.instance_tmpdir.makedir('write')
+        _write(path, STATE_FILENAME, b'first')
+        _write(path, STATE_FILENAME, b'second')
+        with open(os.path.join(path, STATE_FILENAME), 'rb') as f:
+            self.assertEqual(f.read(), b'second')
+
+        # A failed write leaves the old file in place and removes its
+        # temporary file.
+        with patch('zipline.utils.checkpoint.replace', side_effect=OSError):
+            with self.assertRaises(OSError):
+                _write(path, STATE_FILENAME, b'third')
+        self.assertEqual(os.listdir(path), [STATE_FILENAME])
+        with open(os.path.join(path, STATE_FILENAME), 'rb') as f:
+            self.assertEqual(f.read(), b'second')
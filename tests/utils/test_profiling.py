@@ -0,0 +1,102 @@
+from unittest import TestCase
+
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from zipline.utils.profiling import SimulationProfiler
+
+
+class FakeTimer(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Phases(object):
+
+    def __init__(self, timer):
+        self.timer = timer
+
+    def outer(self):
+        self.timer.now += 1.0
+        self.inner()
+        self.timer.now += 2.0
+
+    def inner(self):
+        self.timer.now += 4.0
+
+    def read(self):
+        pass
+
+
+class SimulationProfilerTestCase(TestCase):
+
+    def test_profile(self):
+        timer = FakeTimer()
+        profiler = SimulationProfiler(timer)
+        phases = Phases(timer)
+        profiler.instrument(phases, 'outer', 'outer')
+        profiler.instrument(phases, 'inner', 'inner')
+        profiler.instrument(phases, 'read', 'read', timed=False)
+
+        sessions = pd.DatetimeIndex(['2016-01-04', '2016-01-05'], tz='UTC')
+        profiler.start_session(sessions[0])
+        phases.outer()
+        phases.read()
+        phases.read()
+        timer.now += 16.0
+
+        profiler.start_session(sessions[1])
+        phases.inner()
+        profiler.stop()
+
+        # The wrappers are gone once the profiler is stopped.
+        self.assertNotIn('outer', vars(phases))
+        self.assertNotIn('inner', vars(phases))
+        self.assertNotIn('read', vars(phases))
+
+        profile = profiler.report()
+        assert_frame_equal(
+            profile.daily_seconds,
+            pd.DataFrame(
+                {
+                    'outer': [3.0, 0.0],
+                    'inner': [4.0, 4.0],
+                    'other': [16.0, 0.0],
+                },
+                index=sessions,
+                columns=['inner', 'outer', 'other'],
+            ),
+        )
+        assert_frame_equal(
+            profile.daily_calls,
+            pd.DataFrame(
+                {
+                    'outer': [1, 0],
+                    'inner': [1, 1],
+                    'read': [2, 0],
+                },
+                index=sessions,
+                columns=['inner', 'outer', 'read'],
+            ),
+        )
+        self.assertEqual(list(profile.totals.index[:3]),
+                         ['other', 'inner', 'outer'])
+        self.assertEqual(profile.totals.loc['inner', 'calls'], 2)
+        self.assertEqual(profile.totals.loc['inner', 'seconds'], 8.0)
+        self.assertEqual(profile.totals.loc['read', 'calls'], 2)
+
+    def test_restores_instance_attributes(self):
+        profiler = SimulationProfiler(FakeTimer())
+        phases = Phases(FakeTimer())
+        original = phases.read = lambda: 'original'
+
+        profiler.instrument(phases, 'read', 'read')
+        self.assertIsNot(phases.read, original)
+        self.assertEqual(phases.read(), 'original')
+
+        profiler.stop()
+        self.assertIs(phases.read, original)
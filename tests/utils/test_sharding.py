@@ -0,0 +1,124 @@
+import numpy as np
+from numpy.testing import assert_allclose
+import pandas as pd
+
+from zipline import TradingAlgorithm
+from zipline.errors import ShardHandoffMismatch, ShardModelNotProportional
+from zipline.finance.commission import PerDollar
+from zipline.finance.slippage import FixedSlippage
+from zipline.testing.fixtures import (
+    WithDataPortal,
+    WithSimParams,
+    ZiplineTestCase,
+)
+from zipline.utils.sharding import run_sharded, shard_boundaries
+
+
+class ShardingTestCase(WithDataPortal, WithSimParams, ZiplineTestCase):
+    START_DATE = pd.Timestamp('2006-01-03', tz='utc')
+    END_DATE = pd.Timestamp('2006-03-31', tz='utc')
+
+    ASSET_FINDER_EQUITY_SIDS = [1, 2]
+
+    # A large capital base keeps the rounding of the orders to whole shares,
+    # the only part of the sizing which isn't proportional to the portfolio
+    # value, small.
+    SIM_PARAMS_CAPITAL_BASE = 1.0e9
+
+    def make_algorithm(self, sim_params, flatten=True, default_models=False):
+        # Invest half of the portfolio at the start of each month and sell
+        # it before the month ends.  Orders fill on the next bar, so the
+        # position is closed on the second to last session of the month to
+        # be flat at the shard boundary.
+        sessions = self.sim_params.trading_days
+        month_ends = np.hstack([
+            np.diff(sessions.year * 12 + sessions.month) != 0,
+            True,
+        ])
+        buy_days = set(sessions[np.roll(month_ends, 1)])
+        sell_days = set(sessions[np.roll(month_ends, -1)])
+
+        def initialize(context):
+            context.asset = context.sid(1)
+            if not default_models:
+                context.set_commission(PerDollar())
+                context.set_slippage(FixedSlippage(spread=0.02))
+
+        def handle_data(context, data):
+            today = context.get_datetime().normalize()
+            if today in buy_days:
+                context.order_target_percent(context.asset, 0.5)
+            elif flatten and today in sell_days:
+                context.order_target(context.asset, 0)
+
+        return TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            sim_params=sim_params,
+            env=self.env,
+        )
+
+    def test_shard_boundaries(self):
+        boundaries = shard_boundaries(self.sim_params.trading_days)
+        self.assertEqual(
+            list(boundaries),
+            [pd.Timestamp('2006-02-01', tz='utc'),
+             pd.Timestamp('2006-03-01', tz='utc')],
+        )
+
+    def test_stitched_results(self):
+        perf = run_sharded(
+            self.make_algorithm,
+            self.sim_params,
+            self.data_portal,
+            processes=2,
+        )
+        self.assertEqual(len(perf), len(self.sim_params.trading_days))
+
+        # The stitched results match a sequential run of the same algorithm.
+        expected = self.make_algorithm(self.sim_params).run(self.data_portal)
+        self.assertNotEqual(expected.returns.abs().sum(), 0)
+        for column in 'returns', 'portfolio_value', 'algorithm_period_return':
+            assert_allclose(
+                perf[column].values,
+                expected[column].values,
+                rtol=1e-5,
+                atol=1e-8,
+                err_msg=column,
+            )
+
+    def test_positions_at_boundary(self):
+        with self.assertRaises(ShardHandoffMismatch) as e:
+            run_sharded(
+                lambda sim_params: self.make_algorithm(
+                    sim_params,
+                    flatten=False,
+                ),
+                self.sim_params,
+                self.data_portal,
+                processes=2,
+            )
+        self.assertEqual(list(e.exception.kwargs['positions']), [1])
+        self.assertEqual(
+            e.exception.kwargs['start'],
+            pd.Timestamp('2006-02-01', tz='utc'),
+        )
+
+    def test_nonproportional_models(self):
+        # The default PerShare commission has a minimum trade cost, and the
+        # default VolumeShareSlippage caps fills at a share of the volume.
+        with self.assertRaises(ShardModelNotProportional) as e:
+            run_sharded(
+                lambda sim_params: self.make_algorithm(
+                    sim_params,
+                    default_models=True,
+                ),
+                self.sim_params,
+                self.data_portal,
+                processes=2,
+            )
+        self.assertIn('PerShare', e.exception.kwargs['model'])
+        self.assertEqual(
+            e.exception.kwargs['start'],
+            pd.Timestamp('2006-02-01', tz='utc'),
+        )
@@ -0,0 +1,112 @@
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from zipline import TradingAlgorithm
+from zipline.data.data_portal import DataPortal
+from zipline.data.us_equity_pricing import (
+    SQLiteAdjustmentReader,
+    SQLiteAdjustmentWriter,
+)
+from zipline.testing.fixtures import (
+    WithDataPortal,
+    WithInstanceTmpDir,
+    WithSimParams,
+    ZiplineTestCase,
+)
+from zipline.utils.sweep import imap_forked, prepare_for_fork, run_sweep
+
+
+class SweepTestCase(WithInstanceTmpDir,
+                    WithDataPortal,
+                    WithSimParams,
+                    ZiplineTestCase):
+    START_DATE = pd.Timestamp('2006-01-03', tz='utc')
+    END_DATE = pd.Timestamp('2006-01-31', tz='utc')
+
+    ASSET_FINDER_EQUITY_SIDS = [1, 2]
+
+    COMPARED_COLUMNS = ['capital_used', 'ending_cash', 'portfolio_value']
+
+    def make_algorithm(self, amount):
+        def initialize(context):
+            context.asset = context.sid(1)
+
+        def handle_data(context, data):
+            context.order(context.asset, amount)
+
+        return TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+
+    def test_matches_serial_runs(self):
+        amounts = [1, 5, 10, -3]
+        results = dict(run_sweep(
+            self.make_algorithm,
+            amounts,
+            self.data_portal,
+            processes=2,
+        ))
+
+        self.assertEqual(sorted(results), sorted(amounts))
+        for amount in amounts:
+            expected = self.make_algorithm(amount).run(self.data_portal)
+            assert_frame_equal(
+                results[amount][self.COMPARED_COLUMNS],
+                expected[self.COMPARED_COLUMNS],
+            )
+
+    def test_single_process(self):
+        results = list(run_sweep(
+            self.make_algorithm,
+            [1, 2],
+            self.data_portal,
+            processes=1,
+        ))
+        self.assertEqual([amount for amount, _ in results], [1, 2])
+
+    def test_workers_reconnect(self):
+        path = self.instance_tmpdir.getpath('adjustments.sqlite')
+        SQLiteAdjustmentWriter(
+            path,
+            self.bcolz_daily_bar_reader,
+            self.bcolz_daily_bar_days,
+        ).write()
+        adjustment_reader = SQLiteAdjustmentReader(path)
+        data_portal = DataPortal(
+            self.env,
+            equity_daily_reader=self.bcolz_daily_bar_reader,
+            adjustment_reader=adjustment_reader,
+        )
+
+        engine = self.env.asset_finder.engine
+        parent_conn = adjustment_reader.conn
+        parent_pool = engine.pool
+
+        def check(sid):
+            return (
+                adjustment_reader.conn is not parent_conn,
+                engine.pool is parent_pool,
+                adjustment_reader.get_adjustments_for_sid('splits', sid),
+                self.env.asset_finder.retrieve_asset(sid).sid,
+            )
+
+        results = dict(imap_forked(
+            check,
+            [1, 2],
+            processes=2,
+            initializer=prepare_for_fork(data_portal),
+        ))
+        # The adjustments file is reopened in each worker.  The test asset
+        # db is in memory, so its engine keeps the connection the fork
+        # copied.
+        self.assertEqual(
+            results,
+            {1: (True, True, [], 1), 2: (True, True, [], 2)},
+        )
+
+        # Only the workers reconnect.
+        self.assertIs(adjustment_reader.conn, parent_conn)
+        self.assertIs(engine.pool, parent_pool)
@@ -24,6 +24,7 @@ from cpython cimport bool
 from collections import Iterable
 
 from zipline.assets import Asset
+from zipline.data.data_portal import BASE_FIELDS
 from zipline.zipline_warnings import ZiplineDeprecationWarning
 
 
@@ -337,6 +338,19 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
+                    if field not in BASE_FIELDS:
+                        # Fetcher columns are read for all of the assets at
+                        # once.
+                        return pd.Series(
+                            self.data_portal.get_extra_source_values(
+                                assets,
+                                field,
+                                self._get_current_minute(),
+                            ),
+                            index=assets,
+                            name=fields,
+                        )
+
                     return pd.Series(data={
                         asset: self.data_portal.get_spot_value(
                                     asset,
@@ -25,6 +25,7 @@ import numpy as np
 
 from itertools import chain, repeat
 from numbers import Integral
+from types import ModuleType
 
 from six import (
     exec_,
@@ -47,6 +48,7 @@ from zipline.errors import (
     SetBenchmarkOutsideInitialize,
     SetCommissionPostInit,
     SetSlippagePostInit,
+    TradingControlViolation,
     UnsupportedCommissionModel,
     UnsupportedDatetimeFormat,
     UnsupportedOrderParameters,
@@ -80,6 +82,7 @@ from zipline.assets import Asset, Equity, Future
 from zipline.assets.futures import FutureChain
 from zipline.gens.tradesimulation import AlgorithmSimulator
 from zipline.pipeline.engine import (
+    IncrementalPipelineEngine,
     NoOpPipelineEngine,
     SimplePipelineEngine,
 )
@@ -92,6 +95,12 @@ from zipline.utils.api_support import (
 
 from zipline.utils.input_validation import ensure_upper_case, error_keywords
 from zipline.utils.cache import CachedObject, Expired
+from zipline.utils.checkpoint import (
+    Checkpointer,
+    check_sim_params,
+    read_checkpoint,
+    sim_params_key,
+)
 import zipline.utils.events
 from zipline.utils.events import (
     EventManager,
@@ -105,6 +114,7 @@ from zipline.utils.math_utils import (
     round_if_near_integer
 )
 from zipline.utils.preprocess import preprocess
+from zipline.utils.profiling import SimulationProfiler
 
 import zipline.protocol
 from zipline.sources.requests_csv import PandasRequestsCSV
@@ -178,6 +188,10 @@ class TradingAlgorithm(object):
         equities_metadata, but will be traded by this TradingAlgorithm.
     get_pipeline_loader : callable[BoundColumn -> PipelineLoader], optional
         The function that maps pipeline columns to their loaders.
+    incremental_pipeline : bool, optional
+        Whether to compute attached pipelines one day at a time, keeping
+        loaded data and rolling windows between days, instead of in chunks.
+        default: False
     create_event_context : callable[BarData -> context manager], optional
         A function used to create a context mananger that wraps the
         execution of all events that are scheduled for a bar.
@@ -283,11 +297,20 @@ class TradingAlgorithm(object):
             self.sim_params.update_internal_from_env(self.trading_environment)
 
         self.perf_tracker = None
+        self._profiler = None
+        # The Checkpoint being resumed by `run`, if any.
+        self._resume_from = None
+        # The attributes set by zipline before `initialize` is called.  The
+        # rest of the attributes are the user's context.
+        self._framework_attributes = frozenset()
         # Pull in the environment's new AssetFinder for quick reference
         self.asset_finder = self.trading_environment.asset_finder
 
         # Initialize Pipeline API data.
-        self.init_engine(kwargs.pop('get_pipeline_loader', None))
+        self.init_engine(
+            kwargs.pop('get_pipeline_loader', None),
+            kwargs.pop('incremental_pipeline', False),
+        )
         self._pipelines = {}
         # Create an always-expired cache so that we compute the first time data
         # is requested.
@@ -382,14 +405,19 @@ class TradingAlgorithm(object):
 
         self.benchmark_sid = kwargs.pop('benchmark_sid', None)
 
-    def init_engine(self, get_loader):
+    def init_engine(self, get_loader, incremental=False):
         """
         Construct and store a PipelineEngine from loader.
 
-        If get_loader is None, constructs a NoOpPipelineEngine.
+        If get_loader is None, constructs a NoOpPipelineEngine.  If
+        incremental is True, constructs an IncrementalPipelineEngine.
         """
         if get_loader is not None:
-            self.engine = SimplePipelineEngine(
+            engine_type = (
+                IncrementalPipelineEngine if incremental
+                else SimplePipelineEngine
+            )
+            self.engine = engine_type(
                 get_loader,
                 self.trading_environment.trading_days,
                 self.asset_finder,
@@ -463,19 +491,23 @@ class TradingAlgorithm(object):
         """
         If the clock property is not set, then create one based on frequency.
         """
+        trading_days = self.sim_params.trading_days
+        if self._resume_from is not None:
+            trading_days = trading_days[
+                trading_days > self._resume_from.session
+            ]
+
         if self.sim_params.data_frequency == 'minute':
             env = self.trading_environment
-            trading_o_and_c = env.open_and_closes.ix[
-                self.sim_params.trading_days]
-            market_opens = trading_o_and_c['market_open'].values.astype(
-                'datetime64[ns]').astype(np.int64)
-            market_closes = trading_o_and_c['market_close'].values.astype(
-                'datetime64[ns]').astype(np.int64)
+            start_idx = env.get_index(trading_days[0])
+            stop_idx = start_idx + len(trading_days)
+            market_opens = env.calendar_index.opens[start_idx:stop_idx]
+            market_closes = env.calendar_index.closes[start_idx:stop_idx]
 
             minutely_emission = self.sim_params.emission_rate == "minute"
 
             clock = MinuteSimulationClock(
-                self.sim_params.trading_days,
+                trading_days,
                 market_opens,
                 market_closes,
                 env.trading_days,
@@ -483,7 +515,7 @@ class TradingAlgorithm(object):
             )
             return clock
         else:
-            return DailySimulationClock(self.sim_params.trading_days)
+            return DailySimulationClock(trading_days)
 
     def _create_benchmark_source(self):
         return BenchmarkSource(
@@ -510,16 +542,23 @@ class TradingAlgorithm(object):
             self.on_dt_changed(self.sim_params.period_start)
 
         if not self.initialized:
+            self._framework_attributes = frozenset(vars(self)).union(
+                ['datetime', 'risk_report', 'trading_client'],
+            )
             self.initialize(*self.initialize_args, **self.initialize_kwargs)
             self.initialized = True
 
+        if self._resume_from is not None:
+            self._restore_checkpoint_state(self._resume_from.state)
+
         self.trading_client = AlgorithmSimulator(
             self,
             sim_params,
             self.data_portal,
             self._create_clock(),
             self._create_benchmark_source(),
-            universe_func=self._calculate_universe
+            universe_func=self._calculate_universe,
+            profiler=self._profiler,
         )
 
         return self.trading_client.transform()
@@ -540,15 +579,39 @@ class TradingAlgorithm(object):
         """
         return self._create_generator(self.sim_params)
 
-    def run(self, data=None, overwrite_sim_params=True):
+    def run(self,
+            data=None,
+            overwrite_sim_params=True,
+            profile=False,
+            checkpoint_dir=None,
+            checkpoint_every=21,
+            resume_from=None):
         """Run the algorithm.
 
         :Arguments:
             source : DataPortal
+            profile : bool, optional
+              Time each phase of the simulation and count data portal reads.
+            checkpoint_dir : str, optional
+              Write a checkpoint of the simulation into this directory every
+              ``checkpoint_every`` sessions.
+            checkpoint_every : int, optional
+              The number of sessions between checkpoints.
+            resume_from : str, optional
+              A checkpoint directory to resume the simulation from.  The
+              algorithm must have been built the same way, with the same
+              sim_params, as the one that wrote the checkpoint.
+              ``initialize`` is called again and then the algorithm's context
+              attributes, blotter, perf tracker and pipeline cache are
+              replaced with the ones in the checkpoint.  The returned
+              daily_stats cover the whole simulation.
 
         :Returns:
             daily_stats : pandas.DataFrame
               Daily performance metrics such as returns, alpha etc.
+            profile : zipline.utils.profiling.SimulationProfile
+              Only returned when ``profile`` is True.  The calls and seconds
+              spent in each phase, in total and for each session.
 
         """
         self._assets_from_source = []
@@ -618,12 +681,37 @@ class TradingAlgorithm(object):
         # this is a repeat run of the algorithm.
         self.perf_tracker = None
 
-        # Create zipline and loop through simulated_trading.
-        # Each iteration returns a perf dictionary
+        self._profiler = profiler = SimulationProfiler() if profile else None
+
         try:
             perfs = []
+            if resume_from is not None:
+                self._resume_from = read_checkpoint(
+                    resume_from,
+                    self.trading_environment,
+                )
+                check_sim_params(self._resume_from, self.sim_params)
+                perfs.extend(self._resume_from.perfs)
+
+            session_closed = None
+            if checkpoint_dir is not None:
+                session_closed = Checkpointer(
+                    checkpoint_dir,
+                    checkpoint_every,
+                    resumed=self._resume_from,
+                ).session_closed
+                if profiler is not None:
+                    session_closed = profiler.timed(
+                        'checkpoint',
+                        session_closed,
+                    )
+
+            # Create zipline and loop through simulated_trading.
+            # Each iteration returns a perf dictionary
             for perf in self.get_generator():
                 perfs.append(perf)
+                if session_closed is not None and 'daily_perf' in perf:
+                    session_closed(self, perf)
 
             # convert perf dict to pandas dataframe
             daily_stats = self._create_daily_stats(perfs)
@@ -631,9 +719,60 @@ class TradingAlgorithm(object):
             self.analyze(daily_stats)
         finally:
             self.data_portal = None
+            self._profiler = None
+            self._resume_from = None
 
+        if profile:
+            return daily_stats, profiler.report()
         return daily_stats
 
+    def _checkpoint_state(self):
+        """
+        The state needed to resume this algorithm after the current session.
+
+        Everything set up by ``initialize`` which doesn't change during the
+        simulation, like scheduled functions, trading controls and attached
+        pipelines, is left out because ``initialize`` is called again when
+        resuming.  The algorithm's context attributes and the plain values in
+        its script namespace must be picklable.
+        """
+        framework = self._framework_attributes
+        return {
+            'sim_params': sim_params_key(self.sim_params),
+            'context': {
+                name: value
+                for name, value in iteritems(vars(self))
+                if name not in framework
+            },
+            'namespace': {
+                name: value
+                for name, value in iteritems(self.namespace)
+                if not (name.startswith('__') or
+                        callable(value) or
+                        isinstance(value, ModuleType))
+            },
+            'recorded_vars': self._recorded_vars,
+            'blotter': self.blotter,
+            'perf_tracker': self.perf_tracker,
+            'pipeline_cache': self._pipeline_cache,
+        }
+
+    def _restore_checkpoint_state(self, state):
+        """
+        Replace the state of this algorithm with a ``state`` returned by
+        ``_checkpoint_state``.
+        """
+        vars(self).update(state['context'])
+        self.namespace.update(state['namespace'])
+        self._recorded_vars = state['recorded_vars']
+        self.blotter = state['blotter']
+        self.perf_tracker = state['perf_tracker']
+        self._pipeline_cache = state['pipeline_cache']
+
+        self.portfolio_needs_update = True
+        self.account_needs_update = True
+        self.performance_needs_update = True
+
     def _write_and_map_id_index_to_sids(self, identifiers, as_of_date):
         # Build new Assets for identifiers that can't be resolved as
         # sids/Assets
@@ -1357,6 +1496,214 @@ class TradingAlgorithm(object):
                                        stop_price=stop_price,
                                        style=style)
 
+    @api_method
+    @disallowed_in_before_trading_start(OrderInBeforeTradingStart())
+    def order_batch(self, assets, amounts, style=None):
+        """
+        Place orders for many assets at once.
+
+        This is equivalent to calling ``order(asset, amount, style=style)``
+        for each pair of ``assets`` and ``amounts``, except that every order
+        is checked against the trading controls before any of them is placed.
+
+        Parameters
+        ----------
+        assets : iterable[Asset]
+            The assets to order.
+        amounts : iterable[float]
+            The number of shares or contracts to order for each asset.
+        style : ExecutionStyle, optional
+            The execution style of every order.  Defaults to a market order.
+
+        Returns
+        -------
+        order_ids : list[str or None]
+            The id of the order placed for each asset, or None if no order
+            was placed, e.g. because the amount rounded to zero.
+        """
+        assets = list(assets)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if len(assets) != len(amounts):
+            raise ValueError(
+                "Got %d assets but %d amounts." % (len(assets), len(amounts))
+            )
+
+        orderable = self._can_order_assets(assets)
+        return self._order_batch(
+            assets,
+            np.where(orderable, amounts, 0.0),
+            style,
+        )
+
+    @api_method
+    @disallowed_in_before_trading_start(OrderInBeforeTradingStart())
+    def order_target_percents(self, weights, style=None):
+        """
+        Place orders to adjust the positions in many assets to target
+        percents of the current portfolio value.
+
+        This is equivalent to calling ``order_target_percent(asset, weight,
+        style=style)`` for each entry in ``weights``, but current prices and
+        positions are read once for all assets, and every order is checked
+        against the trading controls before any of them is placed.
+
+        Parameters
+        ----------
+        weights : pd.Series or dict[Asset -> float]
+            The target percent of the portfolio value for each asset,
+            expressed as a decimal (0.50 means 50%).
+        style : ExecutionStyle, optional
+            The execution style of every order.  Defaults to a market order.
+
+        Returns
+        -------
+        order_ids : list[str or None]
+            The id of the order placed for each asset in ``weights``, or None
+            if no order was placed.
+        """
+        weights = pd.Series(weights, dtype=np.float64)
+        assets = list(weights.index)
+        orderable = self._can_order_assets(assets)
+
+        amounts = np.zeros(len(assets))
+        amounts[orderable] = self._calculate_order_target_amounts(
+            [asset for asset, ok in zip(assets, orderable) if ok],
+            weights.values[orderable] * self.portfolio.portfolio_value,
+        )
+        return self._order_batch(assets, amounts, style)
+
+    def _can_order_assets(self, assets):
+        """
+        Compute a mask of the entries in ``assets`` that can be ordered.
+        """
+        return np.array(
+            [self._can_order_asset(asset) for asset in assets],
+            dtype=bool,
+        )
+
+    def _calculate_order_target_amounts(self, assets, target_values):
+        """
+        Vectorized version of the share counts that ``order_target_value``
+        would order for each of ``assets``.
+        """
+        normalized_date = normalize_date(self.datetime)
+        for asset in assets:
+            if normalized_date < asset.start_date:
+                raise CannotOrderDelistedAsset(
+                    msg="Cannot order {0}, as it started trading on"
+                        " {1}.".format(asset.symbol, asset.start_date)
+                )
+            elif normalized_date > asset.end_date:
+                raise CannotOrderDelistedAsset(
+                    msg="Cannot order {0}, as it stopped trading on"
+                        " {1}.".format(asset.symbol, asset.end_date)
+                )
+
+        last_prices = np.asarray(
+            self.trading_client.current_data.current(assets, "price"),
+            dtype=np.float64,
+        )
+        no_price = np.isnan(last_prices)
+        if no_price.any():
+            raise CannotOrderDelistedAsset(
+                msg="Cannot order {0} on {1} as there is no last "
+                    "price for the security.".format(
+                        assets[no_price.argmax()].symbol,
+                        self.datetime,
+                    )
+            )
+
+        # Don't order assets whose value we can't infer.
+        zero_price = np.abs(last_prices) <= 10e-7
+        if self.logger:
+            for loc in np.flatnonzero(zero_price):
+                self.logger.debug(
+                    "Price of 0 for {psid}; can't infer value".format(
+                        psid=assets[loc],
+                    )
+                )
+
+        value_multipliers = np.array(
+            [
+                asset.multiplier if isinstance(asset, Future) else 1
+                for asset in assets
+            ],
+            dtype=np.float64,
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            target_amounts = np.where(
+                zero_price,
+                0.0,
+                target_values / (last_prices * value_multipliers),
+            )
+
+        positions = self.portfolio.positions
+        current_amounts = np.array(
+            [positions[asset].amount for asset in assets],
+            dtype=np.float64,
+        )
+        return target_amounts - current_amounts
+
+    def _order_batch(self, assets, amounts, style):
+        """
+        Validate and place an order for ``amounts[i]`` shares of
+        ``assets[i]`` for each ``i``, skipping orders for zero shares.
+        """
+        if not self.initialized:
+            raise OrderDuringInitialize(
+                msg="order() can only be called from within handle_data()"
+            )
+
+        # Truncate to the integer share count that's either within .0001 of
+        # amount or closer to zero, as in ``order``.
+        rounded = np.round(amounts)
+        amounts = np.where(
+            np.abs(amounts - rounded) <= 1e-4,
+            rounded,
+            amounts,
+        ).astype(np.int64)
+
+        locs = np.flatnonzero(amounts)
+        order_assets = [assets[loc] for loc in locs]
+        order_amounts = amounts[locs]
+
+        # Raises a TradingControlViolation before any orders are placed.
+        self._validate_batch(order_assets, order_amounts)
+        dt = self.get_datetime()
+        for control in self.trading_controls:
+            control.record_many(order_assets, order_amounts, dt)
+
+        style = self.__convert_order_params_for_blotter(None, None, style)
+        order_ids = [None] * len(assets)
+        placed = self.blotter.batch_order([
+            (asset, amount, style)
+            for asset, amount in zip(order_assets, order_amounts.tolist())
+        ])
+        for loc, order_id in zip(locs, placed):
+            order_ids[loc] = order_id
+        return order_ids
+
+    def _validate_batch(self, assets, amounts):
+        """
+        Check a batch of orders against every registered trading control,
+        raising a TradingControlViolation for the first failed order.
+        """
+        portfolio = self.updated_portfolio()
+        dt = self.get_datetime()
+        current_data = self.trading_client.current_data
+        for control in self.trading_controls:
+            failed, reasons = control.validate_many(assets,
+                                                    amounts,
+                                                    portfolio,
+                                                    dt,
+                                                    current_data)
+            if failed.any():
+                loc = failed.argmax()
+                raise TradingControlViolation(asset=assets[loc],
+                                              amount=amounts[loc],
+                                              datetime=dt,
+                                              constraint=reasons[loc])
+
     @error_keywords(sid='Keyword argument `sid` is no longer supported for '
                         'get_open_orders. Use `asset` instead.')
     @api_method
@@ -1552,9 +1899,14 @@ class TradingAlgorithm(object):
         if self._pipelines:
             raise NotImplementedError("Multiple pipelines are not supported.")
         if chunksize is None:
-            # Make the first chunk smaller to get more immediate results:
-            # (one week, then every half year)
-            chunks = iter(chain([5], repeat(126)))
+            if isinstance(self.engine, IncrementalPipelineEngine):
+                # Compute a single day at a time; the engine keeps its own
+                # state between days.
+                chunks = iter(repeat(0))
+            else:
+                # Make the first chunk smaller to get more immediate results:
+                # (one week, then every half year)
+                chunks = iter(chain([5], repeat(126)))
         else:
             chunks = iter(repeat(int(chunksize)))
         self._pipelines[name] = pipeline, chunks
@@ -1613,31 +1965,27 @@ class TradingAlgorithm(object):
             )
             self._pipeline_cache = CachedObject(data, valid_until)
 
-        # Now that we have a cached result, try to return the data for today.
-        try:
-            return data.loc[today]
-        except KeyError:
-            # This happens if no assets passed the pipeline screen on a given
-            # day.
-            return pd.DataFrame(index=[], columns=data.columns)
+        # Now that we have a cached result, return the data for today.  Only
+        # the rows for today are converted into a DataFrame.
+        return data.for_date(today)
 
     def _run_pipeline(self, pipeline, start_date, chunksize):
         """
         Compute `pipeline`, providing values for at least `start_date`.
 
-        Produces a DataFrame containing data for days between `start_date` and
-        `end_date`, where `end_date` is defined by:
+        Produces a PipelineResult containing data for days between
+        `start_date` and `end_date`, where `end_date` is defined by:
 
             `end_date = min(start_date + chunksize trading days,
                             simulation_end)`
 
         Returns
         -------
-        (data, valid_until) : tuple (pd.DataFrame, pd.Timestamp)
+        (data, valid_until) : tuple (PipelineResult, pd.Timestamp)
 
         See Also
         --------
-        PipelineEngine.run_pipeline
+        PipelineEngine.run_pipeline_columnar
         """
         days = self.trading_environment.trading_days
 
@@ -1650,8 +1998,10 @@ class TradingAlgorithm(object):
         end_loc = min(start_date_loc + chunksize, days.get_loc(sim_end))
         end_date = days[end_loc]
 
-        return \
-            self.engine.run_pipeline(pipeline, start_date, end_date), end_date
+        return (
+            self.engine.run_pipeline_columnar(pipeline, start_date, end_date),
+            end_date,
+        )
 
     ##################
     # End Pipeline API
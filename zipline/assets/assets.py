@@ -20,7 +20,7 @@ from logbook import Logger
 import numpy as np
 import pandas as pd
 from pandas import isnull
-from six import with_metaclass, string_types, viewkeys
+from six import itervalues, with_metaclass, string_types, viewkeys
 from six.moves import map as imap
 import sqlalchemy as sa
 
@@ -78,6 +78,115 @@ def _convert_asset_timestamp_fields(dict_):
     return dict_
 
 
+class _PreloadedAssets(object):
+    """
+    An in-memory, columnar copy of an asset table.
+
+    Each column of the table is stored as an array sorted by sid, and
+    ``Asset`` objects are only constructed the first time they are requested.
+
+    Parameters
+    ----------
+    asset_tbl : sqlalchemy.Table
+        The table to read.
+    asset_type : type
+        Type of asset to be constructed.
+    """
+    def __init__(self, asset_tbl, asset_type):
+        self.asset_type = asset_type
+
+        names = [column.name for column in asset_tbl.columns]
+        rows = sa.select([asset_tbl]).order_by(
+            asset_tbl.c.sid.asc(),
+        ).execute().fetchall()
+
+        columns = []
+        for i, name in enumerate(names):
+            values = [row[i] for row in rows]
+            if name == 'sid':
+                self.sids = np.array(values, dtype=np.int64)
+                continue
+            elif name in _asset_timestamp_fields:
+                values = pd.to_datetime(
+                    np.array(
+                        [pd.NaT.value if v is None else v for v in values],
+                        dtype=np.int64,
+                    ),
+                    utc=True,
+                )
+            else:
+                values = np.array(values, dtype=object)
+            columns.append((name, values))
+
+        self._columns = columns
+        self._timestamp_fields = _asset_timestamp_fields.intersection(names)
+        self._assets = np.empty(len(rows), dtype=object)
+        self._built = np.zeros(len(rows), dtype=bool)
+
+    def __len__(self):
+        return len(self.sids)
+
+    def locate(self, sids):
+        """
+        Find the positions of ``sids`` in this table.
+
+        Parameters
+        ----------
+        sids : np.ndarray[int64]
+
+        Returns
+        -------
+        locs : np.ndarray[intp]
+            The position of each sid, or 0 where the sid wasn't found.
+        found : np.ndarray[bool]
+            Whether each sid was found.
+        """
+        table_sids = self.sids
+        if not len(table_sids):
+            return (
+                np.zeros(len(sids), dtype=np.intp),
+                np.zeros(len(sids), dtype=bool),
+            )
+        locs = table_sids.searchsorted(sids)
+        locs[locs == len(table_sids)] = 0
+        return locs, table_sids[locs] == sids
+
+    def assets_at(self, locs, cache):
+        """
+        Get the assets at positions ``locs``, constructing any that haven't
+        been requested before.
+
+        Parameters
+        ----------
+        locs : np.ndarray[intp]
+            Positions in this table.
+        cache : dict[int -> Asset]
+            Cache of already constructed assets.  Newly constructed assets are
+            added to it.
+
+        Returns
+        -------
+        assets : np.ndarray[object]
+        """
+        assets = self._assets
+        timestamp_fields = self._timestamp_fields
+        for loc in np.unique(locs[~self._built[locs]]):
+            sid = int(self.sids[loc])
+            try:
+                asset = cache[sid]
+            except KeyError:
+                kwargs = {'sid': sid}
+                for name, values in self._columns:
+                    value = values[loc]
+                    if name in timestamp_fields and isnull(value):
+                        value = None
+                    kwargs[name] = value
+                asset = cache[sid] = self.asset_type(**kwargs)
+            assets[loc] = asset
+            self._built[loc] = True
+        return assets[locs]
+
+
 class AssetFinder(object):
     """
     An AssetFinder is an interface to a database of Asset metadata written by
@@ -91,6 +200,10 @@ class AssetFinder(object):
     engine : str or SQLAlchemy.engine
         An engine with a connection to the asset database to use, or a string
         that can be parsed by SQLAlchemy as a URI.
+    preload : bool, optional
+        If True, read the equities and futures tables into memory up front
+        with ``preload``, so that retrieving assets by sid never queries the
+        database.  Defaults to False.
 
     See Also
     --------
@@ -100,7 +213,7 @@ class AssetFinder(object):
     # reference to an AssetFinder.
     PERSISTENT_TOKEN = "<AssetFinder>"
 
-    def __init__(self, engine):
+    def __init__(self, engine, preload=False):
         if isinstance(engine, str):
             engine = sa.create_engine('sqlite:///' + engine)
 
@@ -121,11 +234,20 @@ class AssetFinder(object):
         #
         # The caches are read through, i.e. accessing an asset through
         # retrieve_asset will populate the cache on first retrieval.
-        self._caches = (self._asset_cache, self._asset_type_cache) = {}, {}
+        self._caches = (
+            self._asset_cache,
+            self._asset_type_cache,
+            self._future_chain_cache,
+        ) = {}, {}, {}
 
         # Populated on first call to `lifetimes`.
         self._asset_lifetimes = None
 
+        # Map from asset type to _PreloadedAssets, populated by `preload`.
+        self._preloaded = None
+        if preload:
+            self.preload()
+
     def _reset_caches(self):
         """
         Reset our asset caches.
@@ -137,6 +259,23 @@ class AssetFinder(object):
         # should be calling this.
         for cache in self._caches:
             cache.clear()
+        if self._preloaded is not None:
+            self.preload()
+
+    def preload(self):
+        """
+        Read the equities and futures tables into memory.
+
+        Afterwards, ``retrieve_all`` and the methods built on it look up sids
+        in sorted arrays instead of querying the database, and construct each
+        Asset the first time it is requested.  Call this again to pick up
+        changes to the underlying assets db.
+        """
+        self._preloaded = {
+            Equity: _PreloadedAssets(self.equities, Equity),
+            Future: _PreloadedAssets(self.futures_contracts, Future),
+        }
+        self._future_chain_cache.clear()
 
     def lookup_asset_types(self, sids):
         """
@@ -223,6 +362,9 @@ class AssetFinder(object):
         SidsNotFound
             When a requested sid is not found and default_none=False.
         """
+        if self._preloaded is not None:
+            return self._retrieve_all_preloaded(sids, default_none)
+
         hits, missing, failures = {}, set(), []
         for sid in sids:
             try:
@@ -267,6 +409,30 @@ class AssetFinder(object):
 
         return [hits[sid] for sid in sids]
 
+    def _retrieve_all_preloaded(self, sids, default_none):
+        """
+        Implementation of ``retrieve_all`` for preloaded asset finders.
+        """
+        if not isinstance(sids, np.ndarray):
+            sids = list(sids)
+        sids = np.asarray(sids, dtype=np.int64)
+        out = np.empty(len(sids), dtype=object)
+        missing = np.ones(len(sids), dtype=bool)
+
+        for preloaded in itervalues(self._preloaded):
+            locs, found = preloaded.locate(sids)
+            if found.any():
+                out[found] = preloaded.assets_at(
+                    locs[found],
+                    self._asset_cache,
+                )
+                missing &= ~found
+
+        if missing.any() and not default_none:
+            raise SidsNotFound(sids=np.unique(sids[missing]).tolist())
+
+        return out.tolist()
+
     def retrieve_equities(self, sids):
         """
         Retrieve Equity objects for a list of sids.
@@ -352,6 +518,22 @@ class AssetFinder(object):
             return {}
 
         cache = self._asset_cache
+
+        if self._preloaded is not None:
+            preloaded = self._preloaded[asset_type]
+            sids = np.unique(np.asarray(list(sids), dtype=np.int64))
+            locs, found = preloaded.locate(sids)
+            misses = tuple(sids[~found].tolist())
+            if misses:
+                if asset_type == Equity:
+                    raise EquitiesNotFound(sids=misses)
+                else:
+                    raise FutureContractsNotFound(sids=misses)
+            return dict(zip(
+                sids.tolist(),
+                preloaded.assets_at(locs, cache),
+            ))
+
         hits = {}
 
         for assets in group_into_chunks(sids):
@@ -527,6 +709,136 @@ class AssetFinder(object):
                     options=self._get_equities_from_candidates(candidates)
                 )
 
+    def lookup_symbols_as_of(self, symbols, as_of_dates):
+        """
+        Vectorized version of ``lookup_symbol`` for many (symbol, date) pairs.
+
+        Each pair is resolved with the same rules as
+        ``lookup_symbol(symbol, as_of_date)``, but the equities table is read
+        once and all pairs are matched against it with a single sort and
+        search instead of issuing queries per pair.
+
+        Parameters
+        ----------
+        symbols : array-like of str
+            The symbols to resolve.
+        as_of_dates : array-like of datetime-like
+            The date on which to resolve each symbol.  Must be the same length
+            as ``symbols``.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            The sid of the equity that held each symbol on each date, or -1
+            where no equity matched.
+
+        See Also
+        --------
+        AssetFinder.lookup_symbol
+        """
+        symbols = np.asarray(symbols, dtype=object)
+        dates = pd.DatetimeIndex(as_of_dates).normalize().asi8
+        if len(symbols) != len(dates):
+            raise ValueError(
+                "Got %d symbols but %d dates." % (len(symbols), len(dates))
+            )
+        out = np.full(len(symbols), -1, dtype=np.int64)
+        if not len(symbols):
+            return out
+
+        equities_cols = self.equities.c
+        rows = sa.select((
+            equities_cols.sid,
+            equities_cols.company_symbol,
+            equities_cols.share_class_symbol,
+            equities_cols.start_date,
+            equities_cols.end_date,
+        )).execute().fetchall()
+        if not rows:
+            return out
+
+        # Assign an integer code to each (company, share class) pair.
+        codes = {}
+        eq_codes = np.array(
+            [codes.setdefault((r[1], r[2]), len(codes)) for r in rows],
+            dtype=np.int64,
+        )
+        eq_sids = np.array([r[0] for r in rows], dtype=np.int64)
+        eq_starts = np.array([r[3] for r in rows], dtype=np.int64)
+        eq_ends = np.array([r[4] for r in rows], dtype=np.int64)
+
+        # Missing symbols are labelled -1 by factorize, which indexes the
+        # trailing -1 code.
+        symbol_idx, unique_symbols = pd.factorize(symbols)
+        query_codes = np.array(
+            [
+                codes.get(split_delimited_symbol(symbol)[:2], -1)
+                if isinstance(symbol, string_types) else -1
+                for symbol in unique_symbols
+            ] + [-1],
+            dtype=np.int64,
+        )[symbol_idx]
+
+        # Rank dates so that (code, date) pairs can be packed into a single
+        # sortable int64 key.
+        all_dates = np.unique(np.hstack([eq_starts, dates]))
+        ndates = len(all_dates)
+        eq_keys = eq_codes * ndates + all_dates.searchsorted(eq_starts)
+        query_keys = query_codes * ndates + all_dates.searchsorted(dates)
+
+        # Sort equities by (code, start_date, end_date).  For each query, the
+        # last equity at or before the query's key is the one with the same
+        # code and the latest start_date on or before the query date.
+        order = np.lexsort((eq_ends, eq_keys))
+        eq_keys = eq_keys[order]
+        eq_codes = eq_codes[order]
+        eq_sids = eq_sids[order]
+        eq_ends = eq_ends[order]
+        latest = eq_keys.searchsorted(query_keys, side='right') - 1
+
+        # Running maximum of end_date, and the location at which it occurs,
+        # within each code.
+        all_ends = np.unique(eq_ends)
+        nends = len(all_ends)
+        packed_ends = eq_codes * nends + all_ends.searchsorted(eq_ends)
+        running_max = np.maximum.accumulate(packed_ends)
+        max_end_loc = np.maximum.accumulate(
+            np.where(
+                packed_ends == running_max,
+                np.arange(len(packed_ends)),
+                0,
+            ),
+        )
+        max_ends = eq_ends[max_end_loc]
+
+        found = (query_codes != -1) & (latest != -1)
+        found[found] &= eq_codes[latest[found]] == query_codes[found]
+        locs = latest[found]
+        found_dates = dates[found]
+
+        # If the most recently started equity is still alive, it's the
+        # match.  Otherwise, if no equity with the symbol is alive, take the
+        # one that ended most recently.
+        alive = eq_ends[locs] >= found_dates
+        none_alive = max_ends[locs] < found_dates
+        out[found] = np.where(
+            alive,
+            eq_sids[locs],
+            np.where(none_alive, eq_sids[max_end_loc[locs]], -1),
+        )
+
+        # The remaining pairs have an older equity that is still alive while
+        # a later-starting one has already ended.  These are rare, so fall
+        # back to the scalar lookup.
+        ambiguous = np.flatnonzero(found)[~(alive | none_alive)]
+        for i in ambiguous:
+            out[i] = self.lookup_symbol(
+                symbols[i],
+                pd.Timestamp(dates[i], tz='UTC'),
+            ).sid
+
+        return out
+
     def lookup_future_symbol(self, symbol):
         """ Return the Future object for a given symbol.
 
@@ -583,84 +895,100 @@ class AssetFinder(object):
             root symbol.
         """
 
-        fc_cols = self.futures_contracts.c
+        roll_dates, rolling_contracts, all_contracts = (
+            self._future_chain_index(root_symbol)
+        )
 
         if as_of_date is pd.NaT:
             # If the as_of_date is NaT, get all contracts for this
             # root symbol.
-            sids = list(map(
-                itemgetter('sid'),
-                sa.select((fc_cols.sid,)).where(
-                    (fc_cols.root_symbol == root_symbol),
-                ).order_by(
-                    fc_cols.notice_date.asc(),
-                ).execute().fetchall()))
-        else:
-            as_of_date = as_of_date.value
+            return list(all_contracts)
 
-            sids = list(map(
-                itemgetter('sid'),
-                sa.select((fc_cols.sid,)).where(
-                    (fc_cols.root_symbol == root_symbol) &
-
-                    # Filter to contracts that are still valid. If both
-                    # exist, use the one that comes first in time (i.e.
-                    # the lower value). If either notice_date or
-                    # expiration_date is NaT, use the other. If both are
-                    # NaT, the contract cannot be included in any chain.
-                    sa.case(
-                        [
-                            (
-                                fc_cols.notice_date == pd.NaT.value,
-                                fc_cols.expiration_date >= as_of_date
-                            ),
-                            (
-                                fc_cols.expiration_date == pd.NaT.value,
-                                fc_cols.notice_date >= as_of_date
-                            )
-                        ],
-                        else_=(
-                            sa.func.min(
-                                fc_cols.notice_date,
-                                fc_cols.expiration_date
-                            ) >= as_of_date
-                        )
-                    )
-                ).order_by(
-                    # If both dates exist sort using minimum of
-                    # expiration_date and notice_date
-                    # else if one is NaT use the other.
-                    sa.case(
-                        [
-                            (
-                                fc_cols.expiration_date == pd.NaT.value,
-                                fc_cols.notice_date
-                            ),
-                            (
-                                fc_cols.notice_date == pd.NaT.value,
-                                fc_cols.expiration_date
-                            )
-                        ],
-                        else_=(
-                            sa.func.min(
-                                fc_cols.notice_date,
-                                fc_cols.expiration_date
-                            )
-                        )
-                    ).asc()
-                ).execute().fetchall()
-            ))
+        # Contracts stay in the chain through their roll date, so the chain
+        # starts at the first contract rolling on or after as_of_date.
+        start = roll_dates.searchsorted(as_of_date.value)
+        return rolling_contracts[start:].tolist()
 
-        if not sids:
-            # Check if root symbol exists.
-            count = sa.select((sa.func.count(fc_cols.sid),)).where(
-                fc_cols.root_symbol == root_symbol,
-            ).scalar()
-            if count == 0:
-                raise RootSymbolNotFound(root_symbol=root_symbol)
+    def _future_chain_index(self, root_symbol):
+        """
+        Get the contracts for ``root_symbol``, sorted for chain lookups.
+
+        The index is read from the database on first access and cached.
+
+        Parameters
+        ----------
+        root_symbol : str
+            Root symbol of the desired future.
+
+        Returns
+        -------
+        roll_dates : np.ndarray[int64]
+            The sorted roll dates, as nanoseconds since the epoch, of the
+            contracts that can be in a chain.  A contract's roll date is the
+            earlier of its notice_date and expiration_date.  If either is
+            NaT, the other is used.  If both are NaT, the contract cannot be
+            included in any chain.
+        rolling_contracts : np.ndarray[object]
+            The Future for each entry in ``roll_dates``.
+        all_contracts : tuple[Future]
+            Every contract for ``root_symbol``, sorted by notice_date.
+
+        Raises
+        ------
+        RootSymbolNotFound
+            Raised when there are no contracts for ``root_symbol``.
+        """
+        try:
+            return self._future_chain_cache[root_symbol]
+        except KeyError:
+            pass
+
+        fc_cols = self.futures_contracts.c
+        rows = sa.select((
+            fc_cols.sid,
+            fc_cols.notice_date,
+            fc_cols.expiration_date,
+        )).where(
+            fc_cols.root_symbol == root_symbol,
+        ).order_by(
+            fc_cols.sid.asc(),
+        ).execute().fetchall()
+
+        if not rows:
+            raise RootSymbolNotFound(root_symbol=root_symbol)
+
+        nat = pd.NaT.value
+        sids = [row[0] for row in rows]
+        notice_dates = np.array(
+            [nat if row[1] is None else row[1] for row in rows],
+            dtype=np.int64,
+        )
+        expiration_dates = np.array(
+            [nat if row[2] is None else row[2] for row in rows],
+            dtype=np.int64,
+        )
+        roll_dates = np.where(
+            notice_dates == nat,
+            expiration_dates,
+            np.where(
+                expiration_dates == nat,
+                notice_dates,
+                np.minimum(notice_dates, expiration_dates),
+            ),
+        )
 
         contracts = self.retrieve_futures_contracts(sids)
-        return [contracts[sid] for sid in sids]
+        contracts = np.array([contracts[sid] for sid in sids], dtype=object)
+
+        rolling = np.flatnonzero(roll_dates != nat)
+        rolling = rolling[roll_dates[rolling].argsort(kind='mergesort')]
+
+        index = self._future_chain_cache[root_symbol] = (
+            roll_dates[rolling],
+            contracts[rolling],
+            tuple(contracts[notice_dates.argsort(kind='mergesort')]),
+        )
+        return index
 
     def lookup_expired_futures(self, start, end):
         if not isinstance(start, pd.Timestamp):
@@ -955,8 +1283,11 @@ class AssetFinderCachedEquities(AssetFinder):
     finder one must manually call the ``rehash_equities`` method.
     """
 
-    def __init__(self, engine):
-        super(AssetFinderCachedEquities, self).__init__(engine)
+    def __init__(self, engine, preload=False):
+        super(AssetFinderCachedEquities, self).__init__(
+            engine,
+            preload=preload,
+        )
         self._fuzzy_symbol_cache = {}
         self._company_share_class_cache = {}
 
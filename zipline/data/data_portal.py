@@ -14,7 +14,6 @@
 # limitations under the License.
 from operator import mul
 
-import bcolz
 from logbook import Logger
 
 import numpy as np
@@ -24,6 +23,7 @@ from six import iteritems
 from six.moves import reduce
 
 from zipline.assets import Asset, Future, Equity
+from zipline.data.minute_bars import SessionMinuteBarCache
 from zipline.data.us_equity_pricing import NoDataOnDate
 from zipline.data.us_equity_loader import (
     USEquityDailyHistoryLoader,
@@ -31,6 +31,7 @@ from zipline.data.us_equity_loader import (
 )
 
 from zipline.utils import tradingcalendar
+from zipline.utils.calendar_index import NANOS_IN_MINUTE
 from zipline.utils.math_utils import (
     nansum,
     nanmean,
@@ -426,6 +427,32 @@ class DailyHistoryAggregator(object):
         return np.array(volumes)
 
 
+def _merge_extra_source_column(values, locs, new_values, identifiers):
+    """
+    Add the columns of ``new_values``, one for each of ``identifiers``, to
+    the (days x identifiers) array ``values``, replacing the columns of
+    identifiers already in ``locs``.
+
+    Returns
+    -------
+    values : np.ndarray
+        The merged array.
+    locs : dict
+        The column of each identifier in ``values``.
+    """
+    locs = dict(locs)
+    for identifier in identifiers:
+        locs.setdefault(identifier, len(locs))
+
+    merged = np.empty(
+        (len(values), len(locs)),
+        dtype=np.result_type(values, new_values),
+    )
+    merged[:, :values.shape[1]] = values
+    merged[:, [locs[identifier] for identifier in identifiers]] = new_values
+    return merged, locs
+
+
 class DataPortal(object):
     def __init__(self,
                  env,
@@ -440,15 +467,6 @@ class DataPortal(object):
 
         self._asset_finder = env.asset_finder
 
-        self._carrays = {
-            'open': {},
-            'high': {},
-            'low': {},
-            'close': {},
-            'volume': {},
-            'sid': {},
-        }
-
         self._adjustment_reader = adjustment_reader
 
         # caches of sid -> adjustment list
@@ -460,9 +478,14 @@ class DataPortal(object):
         self._asset_start_dates = {}
         self._asset_end_dates = {}
 
-        # Handle extra sources, like Fetcher.
-        self._augmented_sources_map = {}
-        self._extra_source_df = None
+        # Handle extra sources, like Fetcher.  Each column of an extra source
+        # is stored as a dense (days x identifiers) array, already forward
+        # filled, so that reads are plain array lookups.
+        self._extra_source_columns = {}
+        self._extra_source_locs = {}
+        self._extra_source_day_locs = {}
+        self._extra_source_assets = None
+        self._extra_source_has_data = None
 
         self._equity_daily_reader = equity_daily_reader
         if self._equity_daily_reader is not None:
@@ -477,7 +500,14 @@ class DataPortal(object):
 
         self._first_trading_day = None
 
+        # The current session's minute bars, which serve the minute spot
+        # value and last traded reads.
+        self._equity_minute_bars = None
+
         if self._equity_minute_reader is not None:
+            self._equity_minute_bars = SessionMinuteBarCache(
+                self._equity_minute_reader,
+            )
             self._equity_daily_aggregator = DailyHistoryAggregator(
                 self.env.open_and_closes.market_open,
                 self._equity_minute_reader)
@@ -526,11 +556,13 @@ class DataPortal(object):
         # We then take each child df and reindex it to the simulation's date
         # range by forward-filling missing values. this makes reads simpler.
         #
-        # Finally, we store the data. For each column, we store a mapping in
-        # self.augmented_sources_map from the column to a dictionary of
-        # asset -> df.  In other words,
-        # self.augmented_sources_map['days_to_cover']['AAPL'] gives us the df
-        # holding that data.
+        # Finally, we store the data. For each column, we stack the child dfs
+        # into a single (days x assets) array in self._extra_source_columns,
+        # and store the position of each asset's column in
+        # self._extra_source_locs.  In other words,
+        # self._extra_source_columns['days_to_cover'][
+        #     day_loc, self._extra_source_locs['days_to_cover']['AAPL']
+        # ] gives us AAPL's value for that day.
         source_date_index = self.env.days_in_range(
             start=sim_params.period_start,
             end=sim_params.period_end
@@ -545,11 +577,8 @@ class DataPortal(object):
         for group_name in group_names:
             group_dict[group_name] = grouped_by_sid.get_group(group_name)
 
-        # This will be the dataframe which we query to get fetcher assets at
-        # any given time. Get's overwritten every time there's a new fetcher
-        # call
-        extra_source_df = pd.DataFrame()
-
+        identifiers = []
+        reindexed = []
         for identifier, df in iteritems(group_dict):
             # Before reindexing, save the earliest and latest dates
             earliest_date = df.index[0]
@@ -569,61 +598,111 @@ class DataPortal(object):
                 self._asset_start_dates[identifier] = earliest_date
                 self._asset_end_dates[identifier] = latest_date
 
-            for col_name in df.columns.difference(['sid']):
-                if col_name not in self._augmented_sources_map:
-                    self._augmented_sources_map[col_name] = {}
+            identifiers.append(identifier)
+            reindexed.append(df)
 
-                self._augmented_sources_map[col_name][identifier] = df
-
-            # Append to extra_source_df the reindexed dataframe for the single
-            # sid
-            extra_source_df = extra_source_df.append(df)
-
-        self._extra_source_df = extra_source_df
+        if not identifiers:
+            return
 
-    def _open_minute_file(self, field, asset):
-        sid_str = str(int(asset))
+        # Stack each column of the per-sid frames side by side into one
+        # (days x identifiers) array, along with the column of each
+        # identifier in that array.  A column already read by an earlier
+        # call keeps its other identifiers.
+        self._extra_source_day_locs = {
+            day: i for i, day in enumerate(source_date_index)
+        }
+        for col_name in source_df.columns.difference(['sid']):
+            values = pd.concat(
+                [df[col_name] for df in reindexed],
+                axis=1,
+            ).values
+            if col_name in self._extra_source_columns:
+                values, locs = _merge_extra_source_column(
+                    self._extra_source_columns[col_name],
+                    self._extra_source_locs[col_name],
+                    values,
+                    identifiers,
+                )
+            else:
+                locs = {
+                    identifier: i for i, identifier in enumerate(identifiers)
+                }
+            self._extra_source_columns[col_name] = values
+            self._extra_source_locs[col_name] = locs
+
+        # An identifier is a fetcher asset on each day on or after the first
+        # day for which it has data.  Only real assets are fetcher assets.
+        # These get overwritten every time there's a new fetcher call.
+        is_asset = np.array(
+            [isinstance(identifier, Asset) for identifier in identifiers],
+            dtype=bool,
+        )
+        self._extra_source_assets = np.array(identifiers, dtype=object)
+        self._extra_source_has_data = pd.concat(
+            [df['sid'] for df in reindexed],
+            axis=1,
+        ).notnull().values & is_asset
 
-        try:
-            carray = self._carrays[field][sid_str]
-        except KeyError:
-            carray = self._carrays[field][sid_str] = \
-                self._get_ctable(asset)[field]
+    def get_extra_source_values(self, assets, field, dt):
+        """
+        Get the values of the extra source (e.g. Fetcher) column ``field``
+        for many assets at once.
 
-        return carray
+        Parameters
+        ----------
+        assets : list[Asset or str]
+            The identifiers whose values are desired.
+        field : str
+            The extra source column to read.
+        dt : pd.Timestamp
+            The timestamp for the desired values.
 
-    def _get_ctable(self, asset):
-        sid = int(asset)
+        Returns
+        -------
+        values : np.ndarray
+            The forward-filled value of ``field`` for each asset on the day of
+            ``dt``, or NaN for assets without data.
+        """
+        row = self._extra_source_day_locs.get(normalize_date(dt))
+        locs = self._extra_source_locs.get(field, {})
+        cols = np.array([locs.get(asset, -1) for asset in assets],
+                        dtype=np.int64)
+        missing = cols == -1
+        if row is None or missing.all():
+            return np.full(len(assets), np.nan)
+
+        values = self._extra_source_columns[field][row, cols]
+        if missing.any():
+            if values.dtype.kind != 'f':
+                values = values.astype(object)
+            values[missing] = np.nan
+        return values
+
+    def prefetch_minute_session(self, session, assets):
+        """
+        Read the minute bars of ``session`` for ``assets`` into memory, so
+        that reads of the session's bars don't go to the minute reader.
 
-        if isinstance(asset, Future):
-            if self._future_minute_reader.sid_path_func is not None:
-                path = self._future_minute_reader.sid_path_func(
-                    self._future_minute_reader.rootdir, sid
-                )
-            else:
-                path = "{0}/{1}.bcolz".format(
-                    self._future_minute_reader.rootdir, sid)
-        elif isinstance(asset, Equity):
-            if self._equity_minute_reader.sid_path_func is not None:
-                path = self._equity_minute_reader.sid_path_func(
-                    self._equity_minute_reader.rootdir, sid
-                )
-            else:
-                path = "{0}/{1}.bcolz".format(
-                    self._equity_minute_reader.rootdir, sid)
+        The assets requested during the previous session are read as well.
+        Other assets are read as they are requested.
 
-        else:
-            # TODO: Figure out if assets should be allowed if neither, and
-            # why this code path is being hit.
-            if self._equity_minute_reader.sid_path_func is not None:
-                path = self._equity_minute_reader.sid_path_func(
-                    self._equity_minute_reader.rootdir, sid
-                )
-            else:
-                path = "{0}/{1}.bcolz".format(
-                    self._equity_minute_reader.rootdir, sid)
+        Parameters
+        ----------
+        session : pd.Timestamp
+            The session that is starting.
+        assets : iterable[Asset]
+            The assets that are likely to be read during the session, e.g.
+            the assets with positions or open orders.
+        """
+        if self._equity_minute_bars is None:
+            return
 
-        return bcolz.open(path, mode='r')
+        market_open, _ = self.env.get_open_and_close(session)
+        self._equity_minute_bars.start_session(
+            market_open,
+            [asset for asset in assets
+             if isinstance(asset, Equity) and asset.end_date >= session],
+        )
 
     def get_last_traded_dt(self, asset, dt, data_frequency):
         """
@@ -633,7 +712,7 @@ class DataPortal(object):
         If there is a trade on the dt, the answer is dt provided.
         """
         if data_frequency == 'minute':
-            return self._equity_minute_reader.get_last_traded_dt(asset, dt)
+            return self._equity_minute_bars.get_last_traded_dt(asset, dt)
         elif data_frequency == 'daily':
             return self._equity_daily_reader.get_last_traded_dt(asset, dt)
 
@@ -674,13 +753,15 @@ class DataPortal(object):
         -------
         The value of the desired field at the desired time.
         """
-        if self._is_extra_source(asset, field, self._augmented_sources_map):
-            day = normalize_date(dt)
+        if self._is_extra_source(asset, field, self._extra_source_columns):
+            row = self._extra_source_day_locs.get(normalize_date(dt))
+            if row is None:
+                return np.NaN
 
             try:
-                return \
-                    self._augmented_sources_map[field][asset].loc[day, field]
-            except KeyError:
+                col = self._extra_source_locs[field][asset]
+                return self._extra_source_columns[field][row, col]
+            except (KeyError, TypeError):
                 return np.NaN
 
         if field not in BASE_FIELDS:
@@ -705,7 +786,7 @@ class DataPortal(object):
                     asset, field, dt)
             else:
                 if field == "last_traded":
-                    return self._equity_minute_reader.get_last_traded_dt(
+                    return self._equity_minute_bars.get_last_traded_dt(
                         asset, dt
                     )
                 elif field == "price":
@@ -821,7 +902,7 @@ class DataPortal(object):
             # because we want the new value as of midnight (fetcher only works
             # on a daily basis, all timestamps are on midnight)
             if self._is_extra_source(asset, field,
-                                     self._augmented_sources_map):
+                                     self._extra_source_columns):
                 spot_value = self.get_spot_value(asset, field, perspective_dt,
                                                  data_frequency)
             else:
@@ -835,38 +916,17 @@ class DataPortal(object):
         return spot_value
 
     def _get_minute_spot_value_future(self, asset, column, dt):
-        # Futures bcolz files have 1440 bars per day (24 hours), 7 days a week.
-        # The file attributes contain the "start_dt" and "last_dt" fields,
-        # which represent the time period for this bcolz file.
-
-        # The start_dt is midnight of the first day that this future started
-        # trading.
-
-        # figure out the # of minutes between dt and this asset's start_dt
-        start_date = self._get_asset_start_date(asset)
-        minute_offset = int((dt - start_date).total_seconds() / 60)
-
-        if minute_offset < 0:
-            # asking for a date that is before the asset's start date, no dice
-            return 0.0
-
-        # then just index into the bcolz carray at that offset
-        carray = self._open_minute_file(column, asset)
-        result = carray[minute_offset]
-
-        # if there's missing data, go backwards until we run out of file
-        while result == 0 and minute_offset > 0:
-            minute_offset -= 1
-            result = carray[minute_offset]
-
-        if column != 'volume':
-            # FIXME switch to a futures reader
-            return result * 0.001
-        else:
-            return result
+        if column == 'price':
+            column = 'close'
+        return self._future_minute_reader.get_value(
+            int(asset),
+            dt,
+            column,
+            self._get_asset_start_date(asset),
+        )
 
     def _get_minute_spot_value(self, asset, column, dt, ffill=False):
-        result = self._equity_minute_reader.get_value(
+        result = self._equity_minute_bars.get_value(
             asset.sid, dt, column
         )
 
@@ -879,14 +939,14 @@ class DataPortal(object):
 
         # we are looking for price, and didn't find one. have to go hunting.
         last_traded_dt = \
-            self._equity_minute_reader.get_last_traded_dt(asset, dt)
+            self._equity_minute_bars.get_last_traded_dt(asset, dt)
 
         if last_traded_dt is pd.NaT:
             # no last traded dt, bail
             return np.nan
 
         # get the value as of the last traded dt
-        result = self._equity_minute_reader.get_value(
+        result = self._equity_minute_bars.get_value(
             asset.sid,
             last_traded_dt,
             column
@@ -974,24 +1034,31 @@ class DataPortal(object):
                                 index=days_for_window,
                                 columns=None)
 
-        future_data = []
-        eq_assets = []
-
-        for asset in assets:
-            if isinstance(asset, Future):
-                future_data.append(self._get_history_daily_window_future(
-                    asset, days_for_window, end_dt, field_to_use
-                ))
-            else:
-                eq_assets.append(asset)
-        eq_data = self._get_history_daily_window_equities(
-            eq_assets, days_for_window, end_dt, field_to_use
-        )
-        if future_data:
-            # TODO: This case appears to be uncovered by testing.
-            data = np.concatenate(eq_data, np.array(future_data).T)
+        future_locs = [
+            loc for loc, asset in enumerate(assets)
+            if isinstance(asset, Future)
+        ]
+        if not future_locs:
+            data = self._get_history_daily_window_equities(
+                assets, days_for_window, end_dt, field_to_use
+            )
         else:
-            data = eq_data
+            data = np.empty((len(days_for_window), len(assets)),
+                            dtype=np.float64)
+            for loc in future_locs:
+                data[:, loc] = self._get_history_daily_window_future(
+                    assets[loc], days_for_window, end_dt, field_to_use
+                )
+
+            eq_locs = sorted(set(range(len(assets))) - set(future_locs))
+            if eq_locs:
+                data[:, eq_locs] = self._get_history_daily_window_equities(
+                    [assets[loc] for loc in eq_locs],
+                    days_for_window,
+                    end_dt,
+                    field_to_use,
+                )
+
         return pd.DataFrame(
             data,
             index=days_for_window,
@@ -1001,59 +1068,57 @@ class DataPortal(object):
     def _get_history_daily_window_future(self, asset, days_for_window,
                                          end_dt, column):
         # Since we don't have daily bcolz files for futures (yet), use minute
-        # bars to calculate the daily values.
-        data = []
-        data_groups = []
-
-        # get all the minutes for the days NOT including today
-        for day in days_for_window[:-1]:
-            minutes = self.env.market_minutes_for_day(day)
-
-            values_for_day = np.zeros(len(minutes), dtype=np.float64)
-
-            for idx, minute in enumerate(minutes):
-                minute_val = self._get_minute_spot_value_future(
-                    asset, column, minute
-                )
-
-                values_for_day[idx] = minute_val
-
-            data_groups.append(values_for_day)
-
-        # get the minutes for today
-        last_day_minutes = pd.date_range(
-            start=self.env.get_open_and_close(end_dt)[0],
-            end=end_dt,
-            freq="T"
+        # bars to calculate the daily values.  The minutes of every day in the
+        # window are read at once and then reduced day by day.
+        calendar_index = self.env.calendar_index
+        start_idx = calendar_index.session_index(days_for_window[0].value)
+        stop_idx = start_idx + len(days_for_window) - 1
+
+        # All the minutes for the days NOT including today, followed by the
+        # minutes of today up to end_dt.
+        last_day_minutes = np.arange(
+            self.env.get_open_and_close(end_dt)[0].value,
+            end_dt.value + 1,
+            NANOS_IN_MINUTE,
+        )
+        minutes = np.hstack([
+            calendar_index.minutes_for_sessions(start_idx, stop_idx),
+            last_day_minutes,
+        ])
+        counts = np.hstack([
+            calendar_index.minutes_per_session[start_idx:stop_idx],
+            len(last_day_minutes),
+        ])
+
+        values = self._future_minute_reader.load_raw_window(
+            int(asset),
+            minutes,
+            column,
+            self._get_asset_start_date(asset),
         )
 
-        values_for_last_day = np.zeros(len(last_day_minutes), dtype=np.float64)
-
-        for idx, minute in enumerate(last_day_minutes):
-            minute_val = self._get_minute_spot_value_future(
-                asset, column, minute
-            )
-
-            values_for_last_day[idx] = minute_val
-
-        data_groups.append(values_for_last_day)
-
-        for group in data_groups:
-            if len(group) == 0:
-                continue
-
-            if column == 'volume':
-                data.append(np.sum(group))
-            elif column == 'open':
-                data.append(group[0])
-            elif column == 'close':
-                data.append(group[-1])
-            elif column == 'high':
-                data.append(np.amax(group))
-            elif column == 'low':
-                data.append(np.amin(group))
+        # Days without any minutes, i.e. today if end_dt is before the open,
+        # are NaN.
+        out = np.full(len(counts), np.nan)
+        has_minutes = counts > 0
+        if not has_minutes.any():
+            return out
+
+        starts = (np.cumsum(counts) - counts)[has_minutes]
+        if column == 'volume':
+            out[has_minutes] = np.add.reduceat(values, starts)
+        elif column == 'open':
+            out[has_minutes] = values[starts]
+        elif column == 'close':
+            out[has_minutes] = values[np.hstack([starts[1:], len(values)]) - 1]
+        elif column == 'high':
+            out[has_minutes] = np.maximum.reduceat(values, starts)
+        elif column == 'low':
+            out[has_minutes] = np.minimum.reduceat(values, starts)
+        else:
+            raise ValueError("Invalid field: {0}".format(column))
 
-        return data
+        return out
 
     def _get_history_daily_window_equities(
             self, assets, days_for_window, end_dt, field_to_use):
@@ -1243,32 +1308,45 @@ class DataPortal(object):
         A numpy array with requested values.
         """
         if isinstance(assets, Future):
-            return self._get_minute_window_for_future([assets], field,
+            return self._get_minute_window_for_future(assets, field,
                                                       minutes_for_window)
-        else:
+
+        future_locs = [
+            loc for loc, asset in enumerate(assets)
+            if isinstance(asset, Future)
+        ]
+        if not future_locs:
             # TODO: Make caller accept assets.
             window = self._get_minute_window_for_equities(assets, field,
                                                           minutes_for_window)
             return window
 
-    def _get_minute_window_for_future(self, asset, field, minutes_for_window):
-        # THIS IS TEMPORARY.  For now, we are only exposing futures within
-        # equity trading hours (9:30 am to 4pm, Eastern).  The easiest way to
-        # do this is to simply do a spot lookup for each desired minute.
-        return_data = np.zeros(len(minutes_for_window), dtype=np.float64)
-        for idx, minute in enumerate(minutes_for_window):
-            return_data[idx] = \
-                self._get_minute_spot_value_future(asset, field, minute)
-
-        # Note: an improvement could be to find the consecutive runs within
-        # minutes_for_window, and use them to read the underlying ctable
-        # more efficiently.
+        window = np.empty((len(minutes_for_window), len(assets)),
+                          dtype=np.float64)
+        for loc in future_locs:
+            window[:, loc] = self._get_minute_window_for_future(
+                assets[loc], field, minutes_for_window,
+            )
 
-        # Once futures are on 24-hour clock, then we can just grab all the
-        # requested minutes in one shot from the ctable.
+        eq_locs = sorted(set(range(len(assets))) - set(future_locs))
+        if eq_locs:
+            window[:, eq_locs] = self._get_minute_window_for_equities(
+                [assets[loc] for loc in eq_locs],
+                field,
+                minutes_for_window,
+            )
+        return window
 
-        # no adjustments for futures, yay.
-        return return_data
+    def _get_minute_window_for_future(self, asset, field, minutes_for_window):
+        # Futures minute files have a bar for every minute of every day, so
+        # the whole window is read with one lookup.  No adjustments for
+        # futures, yay.
+        return self._future_minute_reader.load_raw_window(
+            int(asset),
+            pd.DatetimeIndex(minutes_for_window).asi8,
+            field,
+            self._get_asset_start_date(asset),
+        )
 
     def _get_minute_window_for_equities(
             self, assets, field, minutes_for_window):
@@ -1587,8 +1665,8 @@ class DataPortal(object):
 
     def contains(self, asset, field):
         return field in BASE_FIELDS or \
-            (field in self._augmented_sources_map and
-             asset in self._augmented_sources_map[field])
+            (field in self._extra_source_locs and
+             asset in self._extra_source_locs[field])
 
     def get_fetcher_assets(self, dt):
         """
@@ -1601,20 +1679,16 @@ class DataPortal(object):
         """
         # return a list of assets for the current date, as defined by the
         # fetcher source
-        if self._extra_source_df is None:
+        if self._extra_source_has_data is None:
             return []
 
-        day = normalize_date(dt)
-
-        if day in self._extra_source_df.index:
-            assets = self._extra_source_df.loc[day]['sid']
-        else:
+        row = self._extra_source_day_locs.get(normalize_date(dt))
+        if row is None:
             return []
 
-        if isinstance(assets, pd.Series):
-            return [x for x in assets if isinstance(x, Asset)]
-        else:
-            return [assets] if isinstance(assets, Asset) else []
+        return list(
+            self._extra_source_assets[self._extra_source_has_data[row]]
+        )
 
     @weak_lru_cache(20)
     def _get_minute_count_for_transform(self, ending_minute, days_count):
@@ -11,6 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bcolz
+from cachetools import LRUCache
+import numpy as np
+
+from zipline.utils.calendar_index import NANOS_IN_MINUTE
+
+# Futures prices are stored as integers in thousandths.
+FUTURE_PRICE_ADJUSTMENT_FACTOR = 0.001
 
 
 class FutureDailyReader(object):
@@ -21,7 +29,145 @@ class FutureDailyReader(object):
 
 
 class FutureMinuteReader(object):
+    """
+    Reader for futures minute bars.
 
-    def __init__(self, rootdir, sid_path_func=None):
+    Each contract is stored in its own bcolz ctable, with a bar for every
+    minute of the day, 24 hours a day, 7 days a week, starting at midnight of
+    the first day the contract is tracked.  The position of a minute in the
+    ctable is therefore its distance from that midnight, in minutes.
+
+    Minutes without a trade are stored as zeros.  Reads forward fill them with
+    the most recent non-zero bar, using an index into each column that is
+    computed the first time the column is read.  Columns are kept in memory
+    until ``cache_size`` is reached, and then the least recently read
+    columns are dropped, so a backtest rolling through many contracts
+    doesn't keep every contract it has read.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the ctables.
+    sid_path_func : callable[(str, int) -> str], optional
+        Function computing the path of a contract's ctable from ``rootdir``
+        and its sid.  Defaults to ``{rootdir}/{sid}.bcolz``.
+    cache_size : int, optional
+        The number of bytes of columns to keep in memory.  Defaults to 512MB,
+        about 60 contract-years of one price field.
+    """
+    def __init__(self, rootdir, sid_path_func=None, cache_size=512 << 20):
         self.rootdir = rootdir
         self.sid_path_func = sid_path_func
+
+        # Cache of (sid, field) -> (values, last_nonzero).
+        self._columns = LRUCache(
+            maxsize=cache_size,
+            getsizeof=lambda column: column[0].nbytes + column[1].nbytes,
+        )
+
+    def _ctable_path(self, sid):
+        if self.sid_path_func is not None:
+            return self.sid_path_func(self.rootdir, sid)
+        return "{0}/{1}.bcolz".format(self.rootdir, sid)
+
+    def _column(self, sid, field):
+        """
+        Load a column of a contract's bars into memory.
+
+        Returns
+        -------
+        values : np.ndarray
+            The bars, with prices scaled by
+            ``FUTURE_PRICE_ADJUSTMENT_FACTOR``.
+        last_nonzero : np.ndarray[intp]
+            The position of the last non-zero bar at or before each position,
+            or 0 if there is no such bar.
+        """
+        try:
+            return self._columns[sid, field]
+        except KeyError:
+            pass
+
+        values = bcolz.open(self._ctable_path(sid), mode='r')[field][:]
+        last_nonzero = np.maximum.accumulate(
+            np.where(values != 0, np.arange(len(values)), 0),
+        )
+        if field != 'volume':
+            values = values * FUTURE_PRICE_ADJUSTMENT_FACTOR
+
+        column = values, last_nonzero
+        try:
+            self._columns[sid, field] = column
+        except ValueError:
+            # The column is larger than the whole cache.
+            pass
+        return column
+
+    def get_value(self, sid, dt, field, start_dt):
+        """
+        Retrieve the value of a field for a contract at a minute, forward
+        filling over minutes without a trade.
+
+        Parameters
+        ----------
+        sid : int
+            The contract's sid.
+        dt : pd.Timestamp
+            The minute to read.
+        field : str
+            One of 'open', 'high', 'low', 'close' or 'volume'.
+        start_dt : pd.Timestamp
+            The midnight at which the contract's ctable starts.
+
+        Returns
+        -------
+        value : float
+            The value of ``field`` at ``dt``, or 0.0 if ``dt`` is before
+            ``start_dt``.
+        """
+        position = (dt.value - start_dt.value) // NANOS_IN_MINUTE
+        if position < 0:
+            return 0.0
+
+        values, last_nonzero = self._column(sid, field)
+        if not len(values):
+            return 0.0
+        return values[last_nonzero[min(position, len(values) - 1)]]
+
+    def load_raw_window(self, sid, minutes, field, start_dt):
+        """
+        Retrieve the values of a field for a contract at many minutes.
+
+        This is equivalent to calling ``get_value`` for each minute, but reads
+        all of the minutes with a single fancy index.
+
+        Parameters
+        ----------
+        sid : int
+            The contract's sid.
+        minutes : np.ndarray[int64]
+            The minutes to read, as nanoseconds since the epoch.
+        field : str
+            One of 'open', 'high', 'low', 'close' or 'volume'.
+        start_dt : pd.Timestamp
+            The midnight at which the contract's ctable starts.
+
+        Returns
+        -------
+        values : np.ndarray[float64]
+            The value of ``field`` at each minute, or 0.0 for minutes before
+            ``start_dt``.
+        """
+        out = np.zeros(len(minutes), dtype=np.float64)
+        values, last_nonzero = self._column(sid, field)
+        if not len(values):
+            return out
+
+        positions = (
+            np.asarray(minutes, dtype=np.int64) - start_dt.value
+        ) // NANOS_IN_MINUTE
+        started = positions >= 0
+        out[started] = values[
+            last_nonzero[np.minimum(positions[started], len(values) - 1)]
+        ]
+        return out
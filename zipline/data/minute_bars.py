@@ -21,6 +21,7 @@ from bcolz import ctable
 from intervaltree import IntervalTree
 import numpy as np
 import pandas as pd
+from six import iteritems
 
 from zipline.data._minute_bar_internal import (
     minute_value,
@@ -882,3 +883,159 @@ class BcolzMinuteBarReader(object):
                 out *= self._ohlc_inverse
             results.append(out)
         return results
+
+
+class SessionMinuteBarCache(object):
+    """
+    The minute bars of one session for the assets in play, held in memory.
+
+    A minute simulation reads the current session's bars for the same assets
+    many times per minute, through ``BarData.current``, ``can_trade``,
+    ``is_stale``, slippage and the last sale prices of the positions.  Each of
+    those reads would otherwise go to the bcolz carrays one value at a time.
+
+    :meth:`start_session` reads an (assets x minutes) block of the session's
+    raw bars per field.  Assets read for the first time later in the session
+    are added to the blocks as they are requested.  The assets requested
+    during a session are read again at the start of the next one.
+
+    :meth:`get_value` and :meth:`get_last_traded_dt` return exactly what the
+    reader's methods of the same names do.  Reads outside of the current
+    session are passed through to the reader.
+
+    Parameters
+    ----------
+    reader : BcolzMinuteBarReader
+        The reader to read bars from.
+    """
+    FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, reader):
+        self._reader = reader
+
+        # The position in the carrays of the session's first minute.
+        self._start_pos = None
+        self._blocks = {}
+        self._rows = {}
+        self._num_rows = 0
+        self._requested = set()
+
+        self._last_dt_value = None
+        self._last_dt_offset = None
+
+    def start_session(self, market_open, sids):
+        """
+        Read the bars of the session opening at ``market_open`` for ``sids``
+        and for the sids requested during the previous session.
+        """
+        sids = sorted(set(map(int, sids)) | self._requested)
+
+        self._start_pos = self._reader._find_position_of_minute(market_open)
+        self._blocks = {
+            field: np.zeros(
+                (max(len(sids), 1), US_EQUITIES_MINUTES_PER_DAY),
+                dtype=np.uint32,
+            )
+            for field in self.FIELDS
+        }
+        self._rows = {}
+        self._num_rows = 0
+        self._requested = set()
+        self._last_dt_value = None
+
+        for sid in sids:
+            self._add(sid)
+
+    def _add(self, sid):
+        row = self._num_rows
+        blocks = self._blocks
+        if row == len(blocks['volume']):
+            for field, block in iteritems(blocks):
+                grown = np.zeros(
+                    (2 * len(block), US_EQUITIES_MINUTES_PER_DAY),
+                    dtype=np.uint32,
+                )
+                grown[:row] = block
+                blocks[field] = grown
+
+        start = self._start_pos
+        stop = start + US_EQUITIES_MINUTES_PER_DAY
+        for field in self.FIELDS:
+            values = self._reader._open_minute_file(field, sid)[start:stop]
+            blocks[field][row, :len(values)] = values
+
+        self._rows[sid] = row
+        self._num_rows += 1
+        return row
+
+    def _offset(self, dt):
+        """
+        The offset of ``dt`` into the current session, or None if ``dt`` is
+        not in the current session.
+        """
+        if self._last_dt_value == dt.value:
+            return self._last_dt_offset
+
+        offset = None
+        if self._start_pos is not None:
+            offset = self._reader._find_position_of_minute(dt) - \
+                self._start_pos
+            if not 0 <= offset < US_EQUITIES_MINUTES_PER_DAY:
+                offset = None
+
+        self._last_dt_value = dt.value
+        self._last_dt_offset = offset
+        return offset
+
+    def _row(self, sid):
+        self._requested.add(sid)
+        try:
+            return self._rows[sid]
+        except KeyError:
+            return self._add(sid)
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the pricing info for the given sid, dt, and field.
+
+        See Also
+        --------
+        BcolzMinuteBarReader.get_value
+        """
+        offset = self._offset(dt)
+        if offset is None:
+            return self._reader.get_value(sid, dt, field)
+
+        # Find the row first, since adding the sid can replace the blocks.
+        row = self._row(int(sid))
+        value = self._blocks[field][row, offset]
+        if value == 0:
+            if field == 'volume':
+                return 0
+            else:
+                return np.nan
+        if field != 'volume':
+            value *= self._reader._ohlc_inverse
+        return value
+
+    def get_last_traded_dt(self, asset, dt):
+        """
+        The last minute at or before ``dt`` in which ``asset`` traded.
+
+        See Also
+        --------
+        BcolzMinuteBarReader.get_last_traded_dt
+        """
+        offset = self._offset(dt)
+        if offset is not None and dt >= asset.start_date:
+            row = self._row(int(asset))
+            volumes = self._blocks['volume'][row, :offset + 1]
+            traded = np.flatnonzero(volumes)
+            if len(traded):
+                return self._reader._pos_to_minute(
+                    self._start_pos + traded[-1],
+                )
+
+        # The asset didn't trade earlier in the session, so we have to search
+        # the sessions before it.
+        return self._reader.get_last_traded_dt(asset, dt)
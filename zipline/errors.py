@@ -617,3 +617,41 @@ class HistoryWindowStartsBeforeData(ZiplineError):
         "History window extends before {first_trading_day}. To use this "
         "history window, start the backtest on or after {suggested_start_day}."
         )
+
+
+class ShardHandoffMismatch(ZiplineError):
+    """
+    Raised by run_sharded if a shard ends with positions or open orders, so
+    the next shard, which starts from cash, doesn't continue from it.
+    """
+    msg = (
+        "The shard starting on {start} does not pick up where the shard "
+        "before it left off. The shard before it ended with positions "
+        "{positions}, worth {ending_value}, and {open_orders} open orders, "
+        "but every shard starts from cash."
+    )
+
+
+class ShardModelNotProportional(ZiplineError):
+    """
+    Raised by run_sharded if an algorithm's commission or slippage model
+    doesn't scale with the size of its orders, so its shards can't be
+    rescaled to continue from one another.
+    """
+    msg = (
+        "The shard starting on {start} can't be rescaled, because the "
+        "algorithm uses {model}, whose costs are not proportional to the "
+        "size of its orders. Use PerDollar or PerShare with "
+        "min_trade_cost=None, and FixedSlippage, to run it sharded."
+    )
+
+
+class CheckpointMismatch(ZiplineError):
+    """
+    Raised when resuming from a checkpoint written by a simulation which
+    doesn't match the one being resumed.
+    """
+    msg = (
+        "The checkpoint at {path} was written with {field}={checkpointed!r}, "
+        "but the simulation resuming it has {field}={actual!r}."
+    )
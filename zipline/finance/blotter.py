@@ -118,6 +118,23 @@ class Blotter(object):
 
         return order.id
 
+    def batch_order(self, order_arg_lists):
+        """
+        Place a batch of orders.
+
+        Parameters
+        ----------
+        order_arg_lists : iterable[tuple]
+            Tuples of args that ``order`` expects.
+
+        Returns
+        -------
+        order_ids : list[str or None]
+            The id of each order placed, in the same order as
+            ``order_arg_lists``.  None for orders that weren't placed.
+        """
+        return [self.order(*order_args) for order_args in order_arg_lists]
+
     def cancel(self, order_id, relay_status=True):
         if order_id not in self.orders:
             return
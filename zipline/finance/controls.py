@@ -14,6 +14,7 @@
 # limitations under the License.
 import abc
 
+import numpy as np
 import pandas as pd
 
 from six import with_metaclass
@@ -57,12 +58,81 @@ class TradingControl(with_metaclass(abc.ABCMeta)):
         """
         raise NotImplementedError
 
-    def fail(self, asset, amount, datetime, metadata=None):
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data):
         """
-        Raise a TradingControlViolation with information about the failure.
+        Check a batch of orders against this TradingControl.
+
+        TradingAlgorithm calls this method *exactly once* on each registered
+        TradingControl object before placing a batch of orders.  The default
+        implementation calls ``validate`` for each order.  Subclasses should
+        override it with an implementation that checks every order at once.
+
+        Parameters
+        ----------
+        assets : list[Asset]
+            The assets being ordered.
+        amounts : np.ndarray[int64]
+            The number of shares ordered for each asset.
+        portfolio : zipline.protocol.Portfolio
+            The algorithm's current portfolio.
+        algo_datetime : pd.Timestamp
+            The current simulation time.
+        algo_current_data : BarData
+            The data for the current bar.
+
+        Returns
+        -------
+        failed : np.ndarray[bool]
+            Mask of the orders that violate this TradingControl.
+        reasons : list[str or None]
+            A description of the violated constraint for each failed order,
+            and None for orders that pass.
+        """
+        failed = np.zeros(len(assets), dtype=bool)
+        reasons = [None] * len(assets)
+        for i, (asset, amount) in enumerate(zip(assets, amounts)):
+            try:
+                self.validate(asset,
+                              amount,
+                              portfolio,
+                              algo_datetime,
+                              algo_current_data)
+            except TradingControlViolation as e:
+                failed[i] = True
+                reasons[i] = e.kwargs['constraint']
+        return failed, reasons
+
+    def record_many(self, assets, amounts, algo_datetime):
+        """
+        Record a batch of orders that passed every registered TradingControl.
+
+        TradingAlgorithm calls this method once on each registered
+        TradingControl object after a batch passed ``validate_many`` on all
+        of them, and before the orders are placed.  Controls that count the
+        orders they allow should count them here rather than in
+        ``validate_many``, since a later control may still reject the batch.
+        The default implementation does nothing.
+
+        Parameters
+        ----------
+        assets : list[Asset]
+            The assets being ordered.
+        amounts : np.ndarray[int64]
+            The number of shares ordered for each asset.
+        algo_datetime : pd.Timestamp
+            The current simulation time.
+        """
+        pass
 
-        If dynamic information should be displayed as well, pass it in via
-        `metadata`.
+    def _constraint(self, metadata=None):
+        """
+        Describe the constraint imposed by this control, along with any
+        dynamic information about a failure.
         """
         constraint = repr(self)
         if metadata:
@@ -70,16 +140,56 @@ class TradingControl(with_metaclass(abc.ABCMeta)):
                 constraint=constraint,
                 metadata=metadata
             )
+        return constraint
+
+    def _reasons(self, failed):
+        """
+        Build the ``reasons`` returned by ``validate_many`` for orders that
+        failed without any dynamic information.
+        """
+        constraint = self._constraint()
+        return [constraint if f else None for f in failed]
+
+    def fail(self, asset, amount, datetime, metadata=None):
+        """
+        Raise a TradingControlViolation with information about the failure.
+
+        If dynamic information should be displayed as well, pass it in via
+        `metadata`.
+        """
         raise TradingControlViolation(asset=asset,
                                       amount=amount,
                                       datetime=datetime,
-                                      constraint=constraint)
+                                      constraint=self._constraint(metadata))
 
     def __repr__(self):
         return "{name}({attrs})".format(name=self.__class__.__name__,
                                         attrs=self.__fail_args)
 
 
+def _position_amounts(portfolio, assets):
+    """
+    Get the number of shares held of each of ``assets``.
+    """
+    positions = portfolio.positions
+    return np.array(
+        [positions[asset].amount for asset in assets],
+        dtype=np.int64,
+    )
+
+
+def _current_prices(algo_current_data, assets):
+    """
+    Get the current price of each of ``assets``.
+    """
+    if not len(assets):
+        return np.empty(0, dtype=np.float64)
+    return np.asarray(
+        algo_current_data.current(assets, "price"),
+        dtype=np.float64,
+    )
+
+
 class MaxOrderCount(TradingControl):
     """
     TradingControl representing a limit on the number of orders that can be
@@ -113,6 +223,34 @@ class MaxOrderCount(TradingControl):
             self.fail(asset, amount, algo_datetime)
         self.orders_placed += 1
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      _portfolio,
+                      algo_datetime,
+                      _algo_current_data):
+        """
+        Fail the orders beyond the first ``self.max_count`` placed today.
+        """
+        algo_date = algo_datetime.date()
+
+        # Reset order count if it's a new day.
+        if self.current_date and self.current_date != algo_date:
+            self.orders_placed = 0
+        self.current_date = algo_date
+
+        # The orders are counted by record_many, once every control has
+        # passed them.
+        remaining = max(self.max_count - self.orders_placed, 0)
+        failed = np.arange(len(assets)) >= remaining
+        return failed, self._reasons(failed)
+
+    def record_many(self, assets, amounts, algo_datetime):
+        """
+        Count a batch of orders towards today's orders.
+        """
+        self.orders_placed += len(assets)
+
 
 class RestrictedListOrder(TradingControl):
     """
@@ -142,6 +280,26 @@ class RestrictedListOrder(TradingControl):
         if asset in self.restricted_list:
             self.fail(asset, amount, _algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      _portfolio,
+                      _algo_datetime,
+                      _algo_current_data):
+        """
+        Fail the orders for assets in the restricted_list.
+        """
+        restricted_list = self.restricted_list
+        contains_many = getattr(restricted_list, 'contains_many', None)
+        if contains_many is not None:
+            failed = contains_many(assets, _algo_datetime)
+        else:
+            failed = np.array(
+                [asset in restricted_list for asset in assets],
+                dtype=bool,
+            )
+        return failed, self._reasons(failed)
+
 
 class MaxOrderSize(TradingControl):
     """
@@ -199,6 +357,29 @@ class MaxOrderSize(TradingControl):
         if too_much_value:
             self.fail(asset, amount, _algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      _algo_datetime,
+                      algo_current_data):
+        """
+        Fail the orders whose magnitude exceeds either self.max_shares or
+        self.max_notional.
+        """
+        failed = _applies_to(self.asset, assets)
+        amounts = np.asarray(amounts)
+
+        violated = np.zeros(len(assets), dtype=bool)
+        if self.max_shares is not None:
+            violated |= np.abs(amounts) > self.max_shares
+        if self.max_notional is not None:
+            order_values = amounts * _current_prices(algo_current_data, assets)
+            violated |= np.abs(order_values) > self.max_notional
+
+        failed &= violated
+        return failed, self._reasons(failed)
+
 
 class MaxPositionSize(TradingControl):
     """
@@ -261,6 +442,34 @@ class MaxPositionSize(TradingControl):
         if too_much_value:
             self.fail(asset, amount, algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data):
+        """
+        Fail the orders that would cause the magnitude of our position to be
+        greater in shares than self.max_shares or greater in dollar value than
+        self.max_notional.
+        """
+        failed = _applies_to(self.asset, assets)
+        shares_post_order = (
+            _position_amounts(portfolio, assets) + np.asarray(amounts)
+        )
+
+        violated = np.zeros(len(assets), dtype=bool)
+        if self.max_shares is not None:
+            violated |= np.abs(shares_post_order) > self.max_shares
+        if self.max_notional is not None:
+            values_post_order = (
+                shares_post_order * _current_prices(algo_current_data, assets)
+            )
+            violated |= np.abs(values_post_order) > self.max_notional
+
+        failed &= violated
+        return failed, self._reasons(failed)
+
 
 class LongOnly(TradingControl):
     """
@@ -280,6 +489,20 @@ class LongOnly(TradingControl):
         if portfolio.positions[asset].amount + amount < 0:
             self.fail(asset, amount, _algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      _algo_datetime,
+                      _algo_current_data):
+        """
+        Fail the orders that would leave us holding negative shares.
+        """
+        failed = (
+            _position_amounts(portfolio, assets) + np.asarray(amounts) < 0
+        )
+        return failed, self._reasons(failed)
+
 
 class AssetDateBounds(TradingControl):
     """
@@ -320,6 +543,60 @@ class AssetDateBounds(TradingControl):
                 }
                 self.fail(asset, amount, algo_datetime, metadata=metadata)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data):
+        """
+        Fail the orders for assets whose end_date has passed, or whose
+        start_date hasn't been reached.
+        """
+        normalized_algo_dt = pd.Timestamp(algo_datetime).normalize().value
+        start_dates = _normalized_dates(assets, 'start_date')
+        end_dates = _normalized_dates(assets, 'end_date')
+        nonzero = np.asarray(amounts) != 0
+
+        # NaT compares as the minimum int64, so missing dates never fail.
+        too_early = nonzero & (normalized_algo_dt < start_dates)
+        too_late = nonzero & ~too_early & (
+            (end_dates != pd.NaT.value) & (normalized_algo_dt > end_dates)
+        )
+
+        failed = too_early | too_late
+        reasons = [None] * len(assets)
+        for loc in np.flatnonzero(too_early):
+            reasons[loc] = self._constraint({
+                'asset_start_date': pd.Timestamp(start_dates[loc], tz='UTC'),
+            })
+        for loc in np.flatnonzero(too_late):
+            reasons[loc] = self._constraint({
+                'asset_end_date': pd.Timestamp(end_dates[loc], tz='UTC'),
+            })
+        return failed, reasons
+
+
+def _applies_to(control_asset, assets):
+    """
+    Mask of the entries in ``assets`` covered by a control restricted to
+    ``control_asset``, or by a control covering every asset if
+    ``control_asset`` is None.
+    """
+    if control_asset is None:
+        return np.ones(len(assets), dtype=bool)
+    return np.array([asset == control_asset for asset in assets], dtype=bool)
+
+
+def _normalized_dates(assets, attr):
+    """
+    Get the ``attr`` date of each of ``assets``, normalized to midnight, as
+    int64 nanoseconds.  Missing dates are NaT.
+    """
+    return pd.DatetimeIndex(
+        [getattr(asset, attr) for asset in assets],
+    ).normalize().asi8
+
 
 class AccountControl(with_metaclass(abc.ABCMeta)):
     """
@@ -0,0 +1,330 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Append-only columnar logs of the transactions and order updates recorded by
+a ``PerformancePeriod``.
+
+Each log row is written into a chunk of a numpy record array, so a
+period's fills cost a few dozen bytes each instead of a Python object with a
+``__dict__``.  Rows are only turned back into the dicts found in perf
+messages when a period is emitted, and the logs are cleared when the period
+rolls over.
+
+Datetimes are stored as int64 UTC nanoseconds and read back as UTC
+``pd.Timestamp`` objects.  Missing values are stored as NaT or NaN and read
+back as None.
+"""
+import numpy as np
+import pandas as pd
+from pandas.tslib import iNaT
+from six.moves import range
+
+
+NaN = float('nan')
+
+
+def _dt_value(dt):
+    return iNaT if dt is None else pd.Timestamp(dt).value
+
+
+def _dt(value):
+    return None if value == iNaT else pd.Timestamp(value, tz='UTC')
+
+
+def _float(value):
+    return NaN if value is None else value
+
+
+def _optional(value):
+    return None if value != value else value
+
+
+class RecordLog(object):
+    """
+    An append-only table with the fields of ``dtype``, stored as a list of
+    record arrays of ``chunksize`` rows each.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        The fields of each row.
+    chunksize : int, optional
+        The number of rows in each chunk.
+    """
+    def __init__(self, dtype, chunksize=4096):
+        self.dtype = np.dtype(dtype)
+        self.chunksize = chunksize
+        self._chunks = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def append(self, row):
+        """
+        Append ``row``, a tuple with a value for each field of the log.
+        """
+        chunk, offset = divmod(self._len, self.chunksize)
+        if chunk == len(self._chunks):
+            self._chunks.append(np.empty(self.chunksize, dtype=self.dtype))
+        self._chunks[chunk][offset] = row
+        self._len += 1
+
+    def clear(self):
+        """
+        Drop every row.
+        """
+        self._chunks = []
+        self._len = 0
+
+    def records(self, start=0):
+        """
+        The rows from ``start`` to the end of the log, as one record array.
+        """
+        stop = self._len
+        size = self.chunksize
+        pieces = [
+            self._chunks[chunk][
+                max(start - chunk * size, 0):min(stop - chunk * size, size)
+            ]
+            for chunk in range(start // size, (stop + size - 1) // size)
+        ]
+        if not pieces:
+            return np.empty(0, dtype=self.dtype)
+        if len(pieces) == 1:
+            return pieces[0]
+        return np.concatenate(pieces)
+
+
+class _DatedLog(object):
+    """
+    A ``RecordLog`` of rows with a ``dt`` field, which can be read for one
+    dt without scanning the whole log.
+
+    Rows are recorded as the simulation advances, so their dts almost always
+    arrive in order.  The log keeps the position of the first row of the
+    latest run of rows with the same dt, which are the rows read when a
+    minute is emitted.
+    """
+    dtype = None
+
+    def __init__(self, chunksize=4096):
+        self._log = RecordLog(self.dtype, chunksize)
+        self.clear()
+
+    def __len__(self):
+        return len(self._log)
+
+    def clear(self):
+        """
+        Drop every row, e.g. when a period rolls over.
+        """
+        self._log.clear()
+        # sid -> Asset, for the assets in the log.
+        self._assets = {}
+        # The dt of the last row, and the position of the first row in the
+        # run of rows with that dt at the end of the log.
+        self._last_dt = iNaT
+        self._last_dt_start = 0
+        # Whether the dts of the rows are in order, so that no row before
+        # _last_dt_start can have _last_dt.
+        self._dts_sorted = True
+
+    def _append(self, sid, dt_value, row):
+        self._assets[int(sid)] = sid
+        if dt_value != self._last_dt:
+            if dt_value < self._last_dt:
+                self._dts_sorted = False
+            self._last_dt = dt_value
+            self._last_dt_start = len(self._log)
+        self._log.append(row)
+
+    def records(self, dt=None):
+        """
+        The rows of the log as a record array, only including the rows at
+        ``dt`` if it is given.
+        """
+        if dt is None:
+            return self._log.records()
+
+        value = _dt_value(dt)
+        if self._dts_sorted:
+            if value == self._last_dt:
+                return self._log.records(self._last_dt_start)
+            if value > self._last_dt:
+                return self._log.records(len(self._log))
+
+        records = self._log.records()
+        return records[records['dt'] == value]
+
+
+class TransactionLog(_DatedLog):
+    """
+    The transactions executed in a performance period.
+    """
+    dtype = np.dtype([
+        ('sid', np.int64),
+        ('amount', np.int64),
+        ('dt', np.int64),
+        ('price', np.float64),
+        ('order_id', object),
+        ('commission', np.float64),
+    ])
+
+    def append(self, txn):
+        """
+        Record ``txn``.
+        """
+        sid = txn.sid
+        dt_value = _dt_value(txn.dt)
+        self._append(sid, dt_value, (
+            int(sid),
+            txn.amount,
+            dt_value,
+            txn.price,
+            txn.order_id,
+            _float(txn.commission),
+        ))
+
+    def to_dicts(self, dt=None):
+        """
+        The transactions in the format of ``Transaction.to_dict``, only
+        including the transactions at ``dt`` if it is given.
+        """
+        assets = self._assets
+        return [
+            {
+                'sid': assets[sid],
+                'amount': amount,
+                'dt': _dt(dt_value),
+                'price': price,
+                'order_id': order_id,
+                'commission': _optional(commission),
+            }
+            for sid, amount, dt_value, price, order_id, commission in
+            self.records(dt).tolist()
+        ]
+
+
+class OrderLog(_DatedLog):
+    """
+    The states of the orders recorded in a performance period, in the order
+    they were recorded.
+
+    Only the orders that were open when they were last recorded are kept as
+    ``Order`` objects.  They can still change, e.g. when they are cancelled
+    at the end of the day, and are read from the object itself.  Orders
+    that were filled, cancelled or rejected can't change any more, so they
+    are read from the log.
+    """
+    dtype = np.dtype([
+        ('id', object),
+        ('dt', np.int64),
+        ('reason', object),
+        ('created', np.int64),
+        ('sid', np.int64),
+        ('amount', np.int64),
+        ('filled', np.int64),
+        ('commission', np.float64),
+        ('status', np.int8),
+        ('stop', np.float64),
+        ('limit', np.float64),
+        ('stop_reached', np.bool_),
+        ('limit_reached', np.bool_),
+        ('broker_order_id', object),
+    ])
+
+    def clear(self):
+        super(OrderLog, self).clear()
+        # order id -> Order, for the orders that were open when they were
+        # last recorded.
+        self._open_orders = {}
+
+    def append(self, order):
+        """
+        Record the current state of ``order``.
+        """
+        sid = order.sid
+        dt_value = _dt_value(order.dt)
+        self._append(sid, dt_value, (
+            order.id,
+            dt_value,
+            order.reason,
+            _dt_value(order.created),
+            int(sid),
+            order.amount,
+            order.filled,
+            _float(order.commission),
+            order.status,
+            _float(order.stop),
+            _float(order.limit),
+            order.stop_reached,
+            order.limit_reached,
+            order.broker_order_id,
+        ))
+
+        if order.open:
+            self._open_orders[order.id] = order
+        else:
+            self._open_orders.pop(order.id, None)
+
+    def to_dicts(self, dt=None):
+        """
+        The latest state of each order in the format of ``Order.to_dict``,
+        ordered by when each order was last recorded.  Only the states
+        recorded with an order dt of ``dt`` are included if it is given.
+        """
+        rows = self.records(dt).tolist()
+
+        # Keep the last row for each order.
+        seen = set()
+        latest = []
+        for row in reversed(rows):
+            if row[0] not in seen:
+                seen.add(row[0])
+                latest.append(row)
+        latest.reverse()
+
+        open_orders = self._open_orders
+        assets = self._assets
+        dicts = []
+        for (id_, dt_value, reason, created, sid, amount, filled, commission,
+             status, stop, limit, stop_reached, limit_reached,
+             broker_order_id) in latest:
+            try:
+                dicts.append(open_orders[id_].to_dict())
+                continue
+            except KeyError:
+                pass
+
+            dct = {
+                'id': id_,
+                'dt': _dt(dt_value),
+                'reason': reason,
+                'created': _dt(created),
+                'sid': assets[sid],
+                'amount': amount,
+                'filled': filled,
+                'commission': _optional(commission),
+                'stop': _optional(stop),
+                'limit': _optional(limit),
+                'stop_reached': stop_reached,
+                'limit_reached': limit_reached,
+                'status': status,
+            }
+            if broker_order_id is not None:
+                dct['broker_order_id'] = broker_order_id
+            dicts.append(dct)
+        return dicts
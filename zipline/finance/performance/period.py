@@ -78,15 +78,10 @@ import numpy as np
 from collections import namedtuple
 from zipline.assets import Future
 
-try:
-    # optional cython based OrderedDict
-    from cyordereddict import OrderedDict
-except ImportError:
-    from collections import OrderedDict
-
-from six import itervalues, iteritems
+from six import iteritems
 
 import zipline.protocol as zp
+from zipline.finance.performance.ledger import OrderLog, TransactionLog
 
 log = logbook.Logger('Performance')
 TRADE_TYPE = zp.DATASOURCE_TYPE.TRADE
@@ -161,6 +156,11 @@ class PerformancePeriod(object):
         # start, or when the price at execution.
         self._payout_last_sale_prices = {}
 
+        # Append-only logs of the transactions and order updates of the
+        # period, cleared at each rollover.
+        self.transaction_log = TransactionLog()
+        self.order_log = OrderLog()
+
         # rollover initializes a number of self's attributes:
         self.rollover()
         self.keep_transactions = keep_transactions
@@ -199,9 +199,8 @@ class PerformancePeriod(object):
         self.starting_cash = self.ending_cash
         self.period_cash_flow = 0.0
         self.pnl = 0.0
-        self.processed_transactions = {}
-        self.orders_by_modified = {}
-        self.orders_by_id = OrderedDict()
+        self.transaction_log.clear()
+        self.order_log.clear()
 
         payout_assets = self._payout_last_sale_prices.keys()
 
@@ -264,19 +263,7 @@ class PerformancePeriod(object):
 
     def record_order(self, order):
         if self.keep_orders:
-            try:
-                dt_orders = self.orders_by_modified[order.dt]
-                if order.id in dt_orders:
-                    del dt_orders[order.id]
-            except KeyError:
-                self.orders_by_modified[order.dt] = dt_orders = OrderedDict()
-            dt_orders[order.id] = order
-            # to preserve the order of the orders by modified date
-            # we delete and add back. (ordered dictionary is sorted by
-            # first insertion date).
-            if order.id in self.orders_by_id:
-                del self.orders_by_id[order.id]
-            self.orders_by_id[order.id] = order
+            self.order_log.append(order)
 
     def handle_execution(self, txn):
         self.period_cash_flow += self._calculate_execution_cash_flow(txn)
@@ -299,10 +286,7 @@ class PerformancePeriod(object):
                 self._payout_last_sale_prices[asset] = txn.price
 
         if self.keep_transactions:
-            try:
-                self.processed_transactions[txn.dt].append(txn)
-            except KeyError:
-                self.processed_transactions[txn.dt] = [txn]
+            self.transaction_log.append(txn)
 
     def _calculate_execution_cash_flow(self, txn):
         """
@@ -380,31 +364,16 @@ class PerformancePeriod(object):
 
         # we want the key to be absent, not just empty
         if self.keep_transactions:
-            if dt:
+            rval['transactions'] = self.transaction_log.to_dicts(
                 # Only include transactions for given dt
-                try:
-                    transactions = [x.to_dict()
-                                    for x in self.processed_transactions[dt]]
-                except KeyError:
-                    transactions = []
-            else:
-                transactions = \
-                    [y.to_dict()
-                     for x in itervalues(self.processed_transactions)
-                     for y in x]
-            rval['transactions'] = transactions
+                dt or None,
+            )
 
         if self.keep_orders:
-            if dt:
+            rval['orders'] = self.order_log.to_dicts(
                 # only include orders modified as of the given dt.
-                try:
-                    orders = [x.to_dict()
-                              for x in itervalues(self.orders_by_modified[dt])]
-                except KeyError:
-                    orders = []
-            else:
-                orders = [x.to_dict() for x in itervalues(self.orders_by_id)]
-            rval['orders'] = orders
+                dt or None,
+            )
 
         return rval
 
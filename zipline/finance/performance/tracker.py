@@ -62,6 +62,7 @@ from __future__ import division
 import logbook
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.tools import normalize_date
 
@@ -105,15 +106,15 @@ class PerformanceTracker(object):
             asset_finder=env.asset_finder,
             data_frequency=self.sim_params.data_frequency)
 
+        # The benchmark's return from the start of the current day through the
+        # current dt, set by the simulation before each market close or
+        # minute close.
         if self.emission_rate == 'daily':
-            self.all_benchmark_returns = pd.Series(
-                index=self.trading_days)
+            self.todays_benchmark_return = np.nan
             self.cumulative_risk_metrics = \
                 risk.RiskMetricsCumulative(self.sim_params, self.env)
         elif self.emission_rate == 'minute':
-            self.all_benchmark_returns = pd.Series(index=pd.date_range(
-                self.sim_params.first_open, self.sim_params.last_close,
-                freq='Min'))
+            self.todays_benchmark_return = 0.0
 
             self.cumulative_risk_metrics = \
                 risk.RiskMetricsCumulative(self.sim_params, self.env,
@@ -204,6 +205,22 @@ class PerformanceTracker(object):
         self._account = self.cumulative_performance.as_account()
         self.account_needs_update = False
 
+    @property
+    def todays_transactions(self):
+        """
+        The transactions of the current session, as a record array with the
+        fields of ``TransactionLog.dtype``.
+        """
+        return self.todays_performance.transaction_log.records()
+
+    @property
+    def todays_order_updates(self):
+        """
+        Every recorded state of the orders of the current session, as a
+        record array with the fields of ``OrderLog.dtype``.
+        """
+        return self.todays_performance.order_log.records()
+
     def to_dict(self, emission_type=None):
         """
         Creates a dictionary representing the state of this tracker.
@@ -323,13 +340,9 @@ class PerformanceTracker(object):
         todays_date = normalize_date(dt)
         account = self.get_account(False)
 
-        bench_returns = self.all_benchmark_returns.loc[todays_date:dt]
-        # cumulative returns
-        bench_since_open = (1. + bench_returns).prod() - 1
-
         self.cumulative_risk_metrics.update(todays_date,
                                             self.todays_performance.returns,
-                                            bench_since_open,
+                                            self.todays_benchmark_return,
                                             account.leverage)
 
         minute_packet = self.to_dict(emission_type='minute')
@@ -353,12 +366,10 @@ class PerformanceTracker(object):
         completed_date = self.day
         account = self.get_account(False)
 
-        benchmark_value = self.all_benchmark_returns[completed_date]
-
         self.cumulative_risk_metrics.update(
             completed_date,
             self.todays_performance.returns,
-            benchmark_value,
+            self.todays_benchmark_return,
             account.leverage)
 
         daily_packet = self._handle_market_close(
@@ -324,6 +324,17 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
         return {k: (None if check_entry(k, v) else v)
                 for k, v in iteritems(rval)}
 
+    def __getstate__(self):
+        # The treasury curves belong to the TradingEnvironment, so there's no
+        # need to write a copy of them into every checkpoint.
+        state = self.__dict__.copy()
+        del state['treasury_curves']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.treasury_curves = self.env.treasury_curves
+
     def __repr__(self):
         statements = []
         for metric in self.METRIC_NAMES:
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import bisect
 import logbook
 import datetime
 
@@ -25,6 +24,7 @@ from sqlalchemy import create_engine
 from zipline.assets import AssetDBWriter, AssetFinder
 from zipline.data.loader import load_market_data
 from zipline.utils import tradingcalendar
+from zipline.utils.calendar_index import CalendarIndex
 from zipline.errors import (
     NoFurtherDataError
 )
@@ -104,6 +104,16 @@ class TradingEnvironment(object):
         self.open_and_closes = env_trading_calendar.open_and_closes.loc[
             self.trading_days]
 
+        self.calendar_index = CalendarIndex(
+            self.trading_days.asi8,
+            self.open_and_closes.market_open.values.astype(
+                'datetime64[ns]'
+            ).view(np.int64),
+            self.open_and_closes.market_close.values.astype(
+                'datetime64[ns]'
+            ).view(np.int64),
+        )
+
         self.bm_symbol = bm_symbol
         if not load:
             load = load_market_data
@@ -159,37 +169,28 @@ class TradingEnvironment(object):
         return pd.Timestamp(dt, tz=self.exchange_tz).tz_convert('UTC')
 
     def is_market_hours(self, test_date):
-        if not self.is_trading_day(test_date):
-            return False
-
-        mkt_open, mkt_close = self.get_open_and_close(test_date)
-        return test_date >= mkt_open and test_date <= mkt_close
+        return self.calendar_index.is_market_minute(
+            pd.Timestamp(test_date).value,
+        )
 
     def is_trading_day(self, test_date):
-        dt = self.normalize_date(test_date)
-        return (dt in self.trading_days)
+        return self.calendar_index.is_session(pd.Timestamp(test_date).value)
 
     def next_trading_day(self, test_date):
-        dt = self.normalize_date(test_date)
-        delta = datetime.timedelta(days=1)
-
-        while dt <= self.last_trading_day:
-            dt += delta
-            if dt in self.trading_days:
-                return dt
-
-        return None
+        idx = self.calendar_index.next_session_index(
+            pd.Timestamp(test_date).value,
+        )
+        if idx == len(self.trading_days):
+            return None
+        return self.trading_days[idx]
 
     def previous_trading_day(self, test_date):
-        dt = self.normalize_date(test_date)
-        delta = datetime.timedelta(days=-1)
-
-        while self.first_trading_day < dt:
-            dt += delta
-            if dt in self.trading_days:
-                return dt
-
-        return None
+        idx = self.calendar_index.previous_session_index(
+            pd.Timestamp(test_date).value,
+        )
+        if idx < 0:
+            return None
+        return self.trading_days[idx]
 
     def add_trading_days(self, n, date):
         """
@@ -221,12 +222,14 @@ class TradingEnvironment(object):
         return self.trading_days[idx]
 
     def days_in_range(self, start, end):
-        start_date = self.normalize_date(start)
-        end_date = self.normalize_date(end)
-
-        mask = ((self.trading_days >= start_date) &
-                (self.trading_days <= end_date))
-        return self.trading_days[mask]
+        calendar_index = self.calendar_index
+        start_idx = calendar_index.previous_session_index(
+            pd.Timestamp(start).value,
+        ) + 1
+        stop_idx = calendar_index.session_index_at_or_before(
+            pd.Timestamp(end).value,
+        ) + 1
+        return self.trading_days[start_idx:max(start_idx, stop_idx)]
 
     def opens_in_range(self, start, end):
         return self.open_and_closes.market_open.loc[start:end]
@@ -238,28 +241,17 @@ class TradingEnvironment(object):
         """
         Get all market minutes for the days between start and end, inclusive.
         """
-        start_date = self.normalize_date(start)
-        end_date = self.normalize_date(end)
-
-        o_and_c = self.open_and_closes[
-            self.open_and_closes.index.slice_indexer(start_date, end_date)]
-
-        opens = o_and_c.market_open
-        closes = o_and_c.market_close
-
-        one_min = pd.Timedelta(1, unit='m')
-
-        all_minutes = []
-        for i in range(0, len(o_and_c.index)):
-            market_open = opens[i]
-            market_close = closes[i]
-            day_minutes = np.arange(market_open, market_close + one_min,
-                                    dtype='datetime64[m]')
-            all_minutes.append(day_minutes)
-
-        # Concatenate all minutes and truncate minutes before start/after end.
+        calendar_index = self.calendar_index
+        start_idx = calendar_index.previous_session_index(
+            pd.Timestamp(start).value,
+        ) + 1
+        stop_idx = calendar_index.session_index_at_or_before(
+            pd.Timestamp(end).value,
+        ) + 1
         return pd.DatetimeIndex(
-            np.concatenate(all_minutes), copy=False, tz='UTC',
+            calendar_index.minutes_for_sessions(start_idx, stop_idx),
+            copy=False,
+            tz='UTC',
         )
 
     def next_open_and_close(self, start_date):
@@ -329,9 +321,14 @@ class TradingEnvironment(object):
         return self.previous_open_and_close(start)[1]
 
     def get_open_and_close(self, day):
-        index = self.open_and_closes.index.get_loc(day.date())
-        todays_minutes = self.open_and_closes.iloc[index]
-        return todays_minutes[0], todays_minutes[1]
+        calendar_index = self.calendar_index
+        index = calendar_index.session_index(pd.Timestamp(day.date()).value)
+        if index == -1:
+            raise KeyError(day)
+        return (
+            pd.Timestamp(calendar_index.opens[index], tz='UTC'),
+            pd.Timestamp(calendar_index.closes[index], tz='UTC'),
+        )
 
     def market_minutes_for_day(self, stamp):
         market_open, market_close = self.get_open_and_close(stamp)
@@ -360,6 +357,17 @@ class TradingEnvironment(object):
             raise ValueError("market_minute_window starting at "
                              "non-market time {minute}".format(minute=start))
 
+        if step in (1, -1):
+            try:
+                minutes = self.calendar_index.minute_window(
+                    pd.Timestamp(start).value, count, step,
+                )
+            except IndexError:
+                raise NoFurtherDataError(
+                    msg='Cannot get %d minutes starting at %s' % (count, start)
+                )
+            return pd.DatetimeIndex(minutes, copy=False, tz='UTC')
+
         all_minutes = []
 
         current_day_minutes = self.market_minutes_for_day(start)
@@ -394,16 +402,18 @@ class TradingEnvironment(object):
         )
 
     def trading_day_distance(self, first_date, second_date):
-        first_date = self.normalize_date(first_date)
-        second_date = self.normalize_date(second_date)
+        calendar_index = self.calendar_index
 
-        # TODO: May be able to replace the following with searchsorted.
-        # Find leftmost item greater than or equal to day
-        i = bisect.bisect_left(self.trading_days, first_date)
-        if i == len(self.trading_days):  # nothing found
+        # Find the first session on or after each day.
+        i = calendar_index.previous_session_index(
+            pd.Timestamp(first_date).value,
+        ) + 1
+        if i == len(calendar_index):  # nothing found
             return None
-        j = bisect.bisect_left(self.trading_days, second_date)
-        if j == len(self.trading_days):
+        j = calendar_index.previous_session_index(
+            pd.Timestamp(second_date).value,
+        ) + 1
+        if j == len(calendar_index):
             return None
 
         return j - i
@@ -413,11 +423,9 @@ class TradingEnvironment(object):
         Return the index of the given @dt, or the index of the preceding
         trading day if the given dt is not in the trading calendar.
         """
-        ndt = self.normalize_date(dt)
-        if ndt in self.trading_days:
-            return self.trading_days.searchsorted(ndt)
-        else:
-            return self.trading_days.searchsorted(ndt) - 1
+        return self.calendar_index.session_index_at_or_before(
+            pd.Timestamp(dt).value,
+        )
 
 
 class SimulationParameters(object):
@@ -29,11 +29,34 @@ cpdef enum:
     MINUTE_END = 3
 
 cdef class MinuteSimulationClock:
+    """
+    Clock emitting the market minutes of each trading day.
+
+    Minutes are computed from ``market_opens`` and ``market_closes`` one day
+    at a time, so only the current day's minutes are ever boxed as
+    ``pd.Timestamp``.  The current minute is also available as raw
+    nanoseconds in ``current_minute``.
+
+    Parameters
+    ----------
+    trading_days : pd.DatetimeIndex
+        The days to simulate.
+    market_opens : np.ndarray[int64]
+        The first minute, in nanoseconds, of each day in ``trading_days``.
+    market_closes : np.ndarray[int64]
+        The last minute, in nanoseconds, of each day in ``trading_days``.
+    all_trading_days : pd.DatetimeIndex
+        All the days in the trading calendar.
+    minute_emission : bool, optional
+        Whether to emit MINUTE_END after every bar instead of DAY_END after
+        the last bar of each day.
+    """
     cdef object trading_days
     cdef object all_trading_days
     cdef bool minute_emission
     cdef np.int64_t[:] market_opens, market_closes
-    cdef public dict minutes_by_day, minutes_to_day
+    cdef public np.int64_t current_minute
+    cdef public np.intp_t current_day_index
 
     def __init__(self,
                  trading_days,
@@ -46,7 +69,8 @@ cdef class MinuteSimulationClock:
         self.market_closes = market_closes
         self.trading_days = trading_days
         self.all_trading_days = all_trading_days
-        self.minutes_by_day = self.calc_minutes_by_day()
+        self.current_minute = 0
+        self.current_day_index = -1
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -59,24 +83,19 @@ cdef class MinuteSimulationClock:
                          market_closes[i] + _nanos_in_minute,
                          _nanos_in_minute)
 
-    cpdef calc_minutes_by_day(self):
-        minutes_by_day = {}
-        for day_idx, day in enumerate(self.trading_days):
-            minutes = pd.to_datetime(
-                self.market_minutes(day_idx), utc=True, box=True)
-            minutes_by_day[day] = minutes
-        return minutes_by_day
-
     def __iter__(self):
-
         minute_emission = self.minute_emission
 
-        for day in self.trading_days:
+        for day_idx, day in enumerate(self.trading_days):
+            self.current_day_index = day_idx
             yield day, DAY_START
 
-            minutes = self.minutes_by_day[day]
+            # Only box the current day's minutes.
+            minute_values = self.market_minutes(day_idx)
+            minutes = pd.to_datetime(minute_values, utc=True, box=True)
 
-            for minute in minutes:
+            for minute_idx, minute in enumerate(minutes):
+                self.current_minute = minute_values[minute_idx]
                 yield minute, BAR
                 if minute_emission:
                     yield minute, MINUTE_END
@@ -28,6 +28,20 @@ from zipline.gens.sim_engine import (
 
 log = Logger('Trade Simulation')
 
+# The data portal methods whose calls are counted when profiling.
+PROFILED_DATA_PORTAL_READS = (
+    'get_adjusted_value',
+    'get_adjustments',
+    'get_fetcher_assets',
+    'get_history_window',
+    'get_last_traded_dt',
+    'get_simple_transform',
+    'get_splits',
+    'get_spot_value',
+    'get_stock_dividends',
+    'prefetch_minute_session',
+)
+
 
 class AlgorithmSimulator(object):
 
@@ -37,7 +51,7 @@ class AlgorithmSimulator(object):
     }
 
     def __init__(self, algo, sim_params, data_portal, clock, benchmark_source,
-                 universe_func):
+                 universe_func, profiler=None):
 
         # ==============
         # Simulation
@@ -70,6 +84,9 @@ class AlgorithmSimulator(object):
 
         self.benchmark_source = benchmark_source
 
+        # A SimulationProfiler, or None if the run isn't being profiled.
+        self.profiler = profiler
+
         # =============
         # Logging Setup
         # =============
@@ -97,6 +114,11 @@ class AlgorithmSimulator(object):
         Main generator work loop.
         """
         algo = self.algo
+        profiler = self.profiler
+        if profiler is not None:
+            # This has to happen before the closures below bind the methods
+            # they call as default arguments.
+            self._instrument(profiler)
 
         def every_bar(dt_to_use, current_data=self.current_data,
                       handle_data=algo.event_manager.handle_data):
@@ -141,8 +163,13 @@ class AlgorithmSimulator(object):
             self.algo.account_needs_update = True
             self.algo.performance_needs_update = True
 
+        minute_data = self.sim_params.data_frequency == 'minute'
+
         def once_a_day(midnight_dt, current_data=self.current_data,
                        data_portal=self.data_portal):
+            if profiler is not None:
+                profiler.start_session(midnight_dt)
+
             # Get the positions before updating the date so that prices are
             # fetched for trading close instead of midnight
             positions = algo.perf_tracker.position_tracker.positions
@@ -170,18 +197,26 @@ class AlgorithmSimulator(object):
                     algo.blotter.process_splits(splits)
                     perf_tracker.position_tracker.handle_splits(splits)
 
+            if minute_data:
+                data_portal.prefetch_minute_session(
+                    midnight_dt,
+                    assets_we_care_about,
+                )
+
             # call before trading start
             algo.before_trading_start(current_data)
 
         def handle_benchmark(date, benchmark_source=self.benchmark_source):
-            algo.perf_tracker.all_benchmark_returns[date] = \
-                benchmark_source.get_value(date)
+            algo.perf_tracker.todays_benchmark_return = \
+                benchmark_source.get_return_since_open(date)
 
         def on_exit():
             self.benchmark_source = self.current_data = self.data_portal = None
 
         with ExitStack() as stack:
             stack.callback(on_exit)
+            if profiler is not None:
+                stack.callback(profiler.stop)
             stack.enter_context(self.processor)
             stack.enter_context(ZiplineAPI(self.algo))
 
@@ -216,6 +251,63 @@ class AlgorithmSimulator(object):
         risk_message = algo.perf_tracker.handle_simulation_end()
         yield risk_message
 
+    def _instrument(self, profiler):
+        """
+        Wrap the methods that make up each phase of the simulation so that
+        ``profiler`` times them.  The wrappers are removed when the profiler
+        is stopped.
+        """
+        algo = self.algo
+        perf_tracker = algo.perf_tracker
+        instrument = profiler.instrument
+
+        instrument(algo.blotter, 'get_transactions', 'get_transactions')
+        instrument(perf_tracker, 'process_transaction', 'process_transaction')
+        instrument(perf_tracker, 'process_order', 'process_order')
+        instrument(algo.event_manager, 'handle_data', 'handle_data')
+        instrument(algo, 'before_trading_start', 'before_trading_start')
+        instrument(algo, '_run_pipeline', 'pipeline')
+        instrument(
+            perf_tracker.position_tracker,
+            'sync_last_sale_prices',
+            'sync_last_sale_prices',
+        )
+        instrument(
+            perf_tracker.cumulative_risk_metrics,
+            'update',
+            'risk_update',
+        )
+        instrument(self, '_get_daily_message', 'perf_packet')
+        instrument(self, '_get_minute_message', 'perf_packet')
+        instrument(self, '_cleanup_expired_assets', 'cleanup_expired_assets')
+        instrument(self.benchmark_source, 'get_return_since_open', 'benchmark')
+
+        for method in PROFILED_DATA_PORTAL_READS:
+            instrument(
+                self.data_portal,
+                method,
+                'data_portal.' + method,
+                timed=False,
+            )
+
+        # Every event other than the one that calls ``handle_data`` comes from
+        # ``schedule_function``.
+        events = algo.event_manager._events
+        handle_data = algo.handle_data.__func__
+        originals = {}
+        for i, event in enumerate(events):
+            if event.callback is not handle_data:
+                events[i] = event._replace(callback=profiler.timed(
+                    'scheduled_functions',
+                    event.callback,
+                ))
+                originals[id(events[i])] = event
+
+        def restore_events():
+            events[:] = [originals.get(id(event), event) for event in events]
+
+        profiler.on_stop(restore_events)
+
     def _cleanup_expired_assets(self, dt, position_assets):
         """
         Clear out any assets that have expired before starting a new sim day.
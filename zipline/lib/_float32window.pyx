@@ -0,0 +1,5 @@
+"""
+float32 specialization of AdjustedArrayWindow
+"""
+from numpy cimport float32_t as ctype
+include "_windowtemplate.pxi"
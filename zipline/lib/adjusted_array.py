@@ -19,6 +19,7 @@ from zipline.errors import (
 )
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     uint8_dtype,
@@ -26,6 +27,7 @@ from zipline.utils.numpy_utils import (
 from zipline.utils.memoize import lazyval
 
 # These class names are all the same because of our bootleg templating system.
+from ._float32window import AdjustedArrayWindow as Float32Window
 from ._float64window import AdjustedArrayWindow as Float64Window
 from ._int64window import AdjustedArrayWindow as Int64Window
 from ._uint8window import AdjustedArrayWindow as UInt8Window
@@ -59,19 +61,23 @@ def can_represent_dtype(dtype):
 
 
 CONCRETE_WINDOW_TYPES = {
+    float32_dtype: Float32Window,
     float64_dtype: Float64Window,
     int64_dtype: Int64Window,
     uint8_dtype: UInt8Window,
 }
 
 
-def _normalize_array(data):
+def _normalize_array(data, column_dtype=None):
     """
     Coerce buffer data for an AdjustedArray into a standard scalar
     representation, returning the coerced array and a numpy dtype object to use
     as a view type when providing public view into the data.
 
-    - float* data is coerced to float64 with viewtype float64.
+    - float* data is coerced to float32 with viewtype float32 if
+      ``column_dtype`` is float32, so that single-precision columns use half
+      the memory of float64 columns.
+    - other float* data is coerced to float64 with viewtype float64.
     - int32, int64, and uint32 are converted to int64 with viewtype int64.
     - datetime[*] data is coerced to int64 with a viewtype of datetime64[ns].
     - bool_ data is coerced to uint8 with a viewtype of bool_.
@@ -79,6 +85,8 @@ def _normalize_array(data):
     Parameters
     ----------
     data : np.ndarray
+    column_dtype : np.dtype, optional
+        The dtype of the column ``data`` was loaded for.
 
     Returns
     -------
@@ -88,6 +96,8 @@ def _normalize_array(data):
     if data_dtype == bool_:
         return data.astype(uint8), dtype(bool_)
     elif data_dtype in FLOAT_DTYPES:
+        if column_dtype == float32_dtype:
+            return data.astype(float32), float32_dtype
         return data.astype(float64), dtype(float64)
     elif data_dtype in INT_DTYPES:
         return data.astype(int64), dtype(int64)
@@ -127,6 +137,10 @@ class AdjustedArray(object):
     missing_value : object
         A value to use to fill missing data in yielded windows.
         Should be a value coercible to `data.dtype`.
+    column_dtype : np.dtype, optional
+        The dtype of the column the data was loaded for.  Float data is only
+        kept as float32 if this is float32, otherwise it is coerced to
+        float64.
 
     """
     __slots__ = (
@@ -137,8 +151,9 @@ class AdjustedArray(object):
         '__weakref__',
     )
 
-    def __init__(self, data, mask, adjustments, missing_value):
-        self._data, self._viewtype = _normalize_array(data)
+    def __init__(self, data, mask, adjustments, missing_value,
+                 column_dtype=None):
+        self._data, self._viewtype = _normalize_array(data, column_dtype)
 
         self.adjustments = adjustments
         self.missing_value = missing_value
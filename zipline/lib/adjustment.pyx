@@ -2,13 +2,18 @@
 from cpython cimport Py_EQ
 
 from pandas import isnull, Timestamp
-from numpy cimport float64_t, uint8_t, int64_t
+from numpy cimport float32_t, float64_t, uint8_t, int64_t
 from numpy import datetime64, float64
 # Purely for readability. There aren't C-level declarations for these types.
 ctypedef object Int64Index_t
 ctypedef object DatetimeIndex_t
 ctypedef object Timestamp_t
 
+# Float adjustments can be applied to single or double precision data.
+ctypedef fused float_t:
+    float32_t
+    float64_t
+
 # Adjustment kinds.
 cpdef enum AdjustmentKind:
     MULTIPLY = 0
@@ -250,7 +255,10 @@ cdef class Adjustment:
 
 cdef class Float64Adjustment(Adjustment):
     """
-    Base class for adjustments that operate on Float64 data.
+    Base class for adjustments that operate on floating point data.
+
+    ``mutate`` accepts either float64 or float32 arrays.  The adjustment's
+    value is always stored as a float64.
     """
     cdef:
         readonly float64_t value
@@ -314,7 +322,7 @@ cdef class Float64Multiply(Float64Adjustment):
            [  6.,  28.,  32.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    def mutate(self, float_t[:, :] data):
         cdef Py_ssize_t row, col
 
         # last_col + 1 because last_col should also be affected.
@@ -352,7 +360,7 @@ cdef class Float64Overwrite(Float64Adjustment):
            [ 6.,  0.,  0.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    def mutate(self, float_t[:, :] data):
         cdef Py_ssize_t row, col
 
         # last_col + 1 because last_col should also be affected.
@@ -390,7 +398,7 @@ cdef class Float64Add(Float64Adjustment):
            [ 6.,  8.,  9.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    def mutate(self, float_t[:, :] data):
         cdef Py_ssize_t row, col
 
         # last_col + 1 because last_col should also be affected.
@@ -1,5 +1,7 @@
 import numpy as np
 
+from zipline.utils.math_utils import nanmean, nanstd
+
 
 def naive_grouped_rowwise_apply(data, group_labels, func, out=None):
     """
@@ -43,3 +45,186 @@ def naive_grouped_rowwise_apply(data, group_labels, func, out=None):
             locs = (label_row == label)
             out_row[locs] = func(row[locs])
     return out
+
+
+# Map from a row-wise transform function to a function computing the same
+# transform over every group of every row at once.
+_VECTORIZED_GROUPED_TRANSFORMS = {}
+
+
+def vectorized_grouped_transform(rowwise_func):
+    """
+    Register a vectorized implementation of a grouped row-wise transform.
+
+    The decorated function is called as ``func(data, group_ids, ngroups,
+    out)``, where ``group_ids`` is an array of the same shape as ``data``
+    assigning each location a dense integer id in ``range(ngroups)`` unique to
+    its (row, group label) pair, and must write the result of applying
+    ``rowwise_func`` to each group into ``out``.
+
+    Parameters
+    ----------
+    rowwise_func : function[ndarray[ndim=1]] -> function[ndarray[ndim=1]]
+        The function whose grouped application is being implemented.  Passing
+        this function to ``grouped_rowwise_apply`` will dispatch to the
+        decorated function.
+    """
+    def decorator(vectorized_func):
+        _VECTORIZED_GROUPED_TRANSFORMS[rowwise_func] = vectorized_func
+        return vectorized_func
+    return decorator
+
+
+def grouped_row_ids(group_labels):
+    """
+    Assign a dense integer id to each distinct (row, label) pair in
+    ``group_labels``.
+
+    Parameters
+    ----------
+    group_labels : ndarray[ndim=2, dtype=int64]
+        Labels to use to bucket each row.
+
+    Returns
+    -------
+    group_ids, ngroups : (ndarray[ndim=2, dtype=int64], int)
+        An array of ids in ``range(ngroups)`` with the same shape as
+        ``group_labels``, and the number of possible ids.
+
+    Example
+    -------
+    >>> labels = np.array([[5, 5, 7],
+    ...                    [7, 5, 7]])
+    >>> ids, ngroups = grouped_row_ids(labels)
+    >>> ids
+    array([[0, 0, 1],
+           [3, 2, 3]])
+    >>> ngroups
+    4
+    """
+    nrows = group_labels.shape[0]
+    _, label_ids = np.unique(group_labels, return_inverse=True)
+    nlabels = label_ids.max() + 1 if label_ids.size else 0
+    group_ids = (
+        label_ids.reshape(group_labels.shape) +
+        np.arange(nrows)[:, np.newaxis] * nlabels
+    )
+    ngroups = nrows * nlabels
+
+    # With many distinct labels most (row, label) pairs don't occur.  Compact
+    # the ids so that per-group arrays stay no larger than the input.
+    if ngroups > group_ids.size:
+        _, group_ids = np.unique(group_ids, return_inverse=True)
+        group_ids = group_ids.reshape(group_labels.shape)
+        ngroups = group_ids.max() + 1 if group_ids.size else 0
+
+    return group_ids, ngroups
+
+
+def grouped_nancounts_and_means(data, group_ids, ngroups):
+    """
+    Compute the number of non-nan values and the nanmean of each group.
+
+    Parameters
+    ----------
+    data : ndarray[ndim=2, dtype=float64]
+        Data to aggregate.
+    group_ids : ndarray[ndim=2, dtype=int64]
+        Dense group ids, as produced by ``grouped_row_ids``.
+    ngroups : int
+        Number of possible group ids.
+
+    Returns
+    -------
+    counts, means : (ndarray[ndim=1], ndarray[ndim=1])
+        Arrays of length ``ngroups``.  Groups with no non-nan values have a
+        mean of nan.
+    """
+    ids = group_ids.ravel()
+    notnan = ~np.isnan(data.ravel())
+    counts = np.bincount(ids, weights=notnan, minlength=ngroups)
+    sums = np.bincount(
+        ids,
+        weights=np.where(notnan, data.ravel(), 0.0),
+        minlength=ngroups,
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return counts, sums / counts
+
+
+def demean(row):
+    return row - nanmean(row)
+
+
+def zscore(row):
+    return (row - nanmean(row)) / nanstd(row)
+
+
+@vectorized_grouped_transform(demean)
+def _grouped_demean(data, group_ids, ngroups, out):
+    _, means = grouped_nancounts_and_means(data, group_ids, ngroups)
+    np.subtract(data, means[group_ids], out=out)
+    return out
+
+
+@vectorized_grouped_transform(zscore)
+def _grouped_zscore(data, group_ids, ngroups, out):
+    counts, means = grouped_nancounts_and_means(data, group_ids, ngroups)
+    deviations = data - means[group_ids]
+    squared = np.where(np.isnan(deviations), 0.0, deviations * deviations)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stds = np.sqrt(
+            np.bincount(
+                group_ids.ravel(),
+                weights=squared.ravel(),
+                minlength=ngroups,
+            ) / counts
+        )
+        np.divide(deviations, stds[group_ids], out=out)
+    return out
+
+
+def grouped_rowwise_apply(data, group_labels, func, out=None):
+    """
+    Apply ``func`` to each group of each row of ``data``.
+
+    This is equivalent to ``naive_grouped_rowwise_apply``, but dispatches to
+    a vectorized implementation if one has been registered for ``func`` with
+    ``vectorized_grouped_transform``.
+
+    Parameters
+    ----------
+    data : ndarray[ndim=2]
+        Input array over which to apply a grouped function.
+    group_labels : ndarray[ndim=2, dtype=int64]
+        Labels to use to bucket inputs from array.
+        Should be the same shape as array.
+    func : function[ndarray[ndim=1]] -> function[ndarray[ndim=1]]
+        Function to apply to pieces of each row in array.
+    out : ndarray, optional
+        Array into which to write output.  If not supplied, a new array of the
+        same shape as ``data`` is allocated and returned.
+
+    Example
+    -------
+    >>> data = np.array([[1., 2., 3.],
+    ...                  [2., 3., 4.],
+    ...                  [5., 6., 7.]])
+    >>> labels = np.array([[0, 0, 1],
+    ...                    [0, 1, 0],
+    ...                    [1, 0, 2]])
+    >>> grouped_rowwise_apply(data, labels, demean)
+    array([[-0.5,  0.5,  0. ],
+           [-1. ,  0. ,  1. ],
+           [ 0. ,  0. ,  0. ]])
+    """
+    try:
+        vectorized = _VECTORIZED_GROUPED_TRANSFORMS[func]
+    except KeyError:
+        return naive_grouped_rowwise_apply(data, group_labels, func, out=out)
+
+    if out is None:
+        out = np.empty_like(data)
+
+    group_ids, ngroups = grouped_row_ids(group_labels)
+    return vectorized(data, group_ids, ngroups, out)
@@ -1,17 +1,118 @@
 """
 Algorithms for computing quantiles on numpy arrays.
 """
-from numpy.lib import apply_along_axis
-from pandas import qcut
+from numbers import Integral
+
+from numpy import (
+    arange,
+    asarray,
+    errstate,
+    float64,
+    floor,
+    isnan,
+    linspace,
+    maximum,
+    minimum,
+    nan,
+    sort,
+    where,
+    zeros,
+)
+
+
+def _partition_bounds(nbins_or_partition_bounds):
+    """
+    Coerce an argument to ``quantiles`` into an array of partition bounds in
+    the interval [0, 1].
+    """
+    if isinstance(nbins_or_partition_bounds, Integral):
+        return linspace(0, 1, nbins_or_partition_bounds + 1)
+    return asarray(nbins_or_partition_bounds, dtype=float64)
+
+
+def _rowwise_bin_edges(sorted_data, counts, bounds):
+    """
+    Compute the value at each of ``bounds`` for each row of ``sorted_data``.
+
+    This uses the same linear interpolation as ``pandas.Series.quantile``,
+    which is what ``pandas.qcut`` uses to find its bin edges.
+
+    Parameters
+    ----------
+    sorted_data : np.ndarray[float64, ndim=2]
+        Data sorted along each row, with nans at the end of each row.
+    counts : np.ndarray[int64, ndim=1]
+        Number of non-nan values in each row of ``sorted_data``.
+    bounds : np.ndarray[float64, ndim=1]
+        Partition bounds in the interval [0, 1].
+
+    Returns
+    -------
+    edges : np.ndarray[float64, ndim=2]
+        Array of shape ``(len(sorted_data), len(bounds))``.  Rows with no
+        non-nan values are filled with nan.
+    """
+    last = maximum(counts - 1, 0)[:, None]
+    positions = bounds[None, :] * last
+    lower = floor(positions).astype(int)
+    upper = minimum(lower + 1, last)
+    fraction = positions - lower
+
+    rows = arange(len(sorted_data))[:, None]
+    lower_values = sorted_data[rows, lower]
+    upper_values = sorted_data[rows, upper]
+    with errstate(invalid='ignore'):
+        edges = where(
+            fraction == 0,
+            lower_values,
+            lower_values + (upper_values - lower_values) * fraction,
+        )
+    edges[counts == 0] = nan
+    return edges
 
 
 def quantiles(data, nbins_or_partition_bounds):
     """
     Compute rowwise array quantiles on an input.
+
+    Each row is binned independently, producing the same buckets as
+    ``pandas.qcut(row, nbins_or_partition_bounds, labels=False)``, but
+    without calling into pandas once per row.
+
+    Parameters
+    ----------
+    data : np.ndarray[ndim=2]
+        The data to bin.  Nans are ignored when computing bin edges.
+    nbins_or_partition_bounds : int or array-like
+        Either the number of equally-sized bins to compute, or an array of
+        partition bounds in the interval [0, 1].
+
+    Returns
+    -------
+    out : np.ndarray[float64, ndim=2]
+        Array of the same shape as ``data`` containing the bucket of each
+        value.  Locations that were nan in ``data``, or that fell outside the
+        requested partition bounds, are nan.
+
+    Notes
+    -----
+    ``pandas.qcut`` raises if a row's bin edges aren't unique.  Here, a value
+    equal to a repeated edge is assigned to the lowest bucket whose upper
+    edge is greater than or equal to the value.
     """
-    return apply_along_axis(
-        qcut,
-        1,
-        data,
-        q=nbins_or_partition_bounds, labels=False,
-    )
+    data = asarray(data, dtype=float64)
+    bounds = _partition_bounds(nbins_or_partition_bounds)
+
+    missing = isnan(data)
+    counts = data.shape[1] - missing.sum(axis=1)
+    edges = _rowwise_bin_edges(sort(data, axis=1), counts, bounds)
+
+    # Buckets are closed on the right and the lowest bucket is also closed on
+    # the left, so a value's bucket is the number of interior edges strictly
+    # less than it.
+    out = zeros(data.shape, dtype=float64)
+    with errstate(invalid='ignore'):
+        for i in range(1, len(bounds) - 1):
+            out += data > edges[:, i:i + 1]
+        out[missing | (data < edges[:, :1]) | (data > edges[:, -1:])] = nan
+    return out
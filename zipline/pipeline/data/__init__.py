@@ -7,7 +7,7 @@ from .dividends import (
 )
 from .earnings import EarningsCalendar
 from .consensus_estimates import ConsensusEstimates
-from .equity_pricing import USEquityPricing
+from .equity_pricing import USEquityPricing, USEquityPricingFloat32
 from .dataset import DataSet, Column, BoundColumn
 
 __all__ = [
@@ -23,4 +23,5 @@ __all__ = [
     'ConsensusEstimates',
     'ShareBuybackAuthorizations',
     'USEquityPricing',
+    'USEquityPricingFloat32',
 ]
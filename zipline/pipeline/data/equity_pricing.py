@@ -1,7 +1,7 @@
 """
 Dataset representing OHLCV data.
 """
-from zipline.utils.numpy_utils import float64_dtype
+from zipline.utils.numpy_utils import float32_dtype, float64_dtype
 
 from .dataset import Column, DataSet
 
@@ -15,3 +15,20 @@ class USEquityPricing(DataSet):
     low = Column(float64_dtype)
     close = Column(float64_dtype)
     volume = Column(float64_dtype)
+
+
+class USEquityPricingFloat32(DataSet):
+    """
+    Dataset representing daily trading prices and volumes as single precision
+    floats.
+
+    The columns have the same names as the columns of
+    :class:`USEquityPricing`, so any loader that can load
+    :class:`USEquityPricing` can load this dataset.  Windows of float32 data
+    use half the memory of float64 windows, at the cost of precision.
+    """
+    open = Column(float32_dtype)
+    high = Column(float32_dtype)
+    low = Column(float32_dtype)
+    close = Column(float32_dtype)
+    volume = Column(float32_dtype)
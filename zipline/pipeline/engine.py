@@ -8,10 +8,12 @@ from abc import (
 from uuid import uuid4
 
 from six import (
+    get_unbound_function,
     iteritems,
+    itervalues,
     with_metaclass,
 )
-from numpy import array
+from numpy import empty, int64
 from pandas import (
     DataFrame,
     date_range,
@@ -22,12 +24,39 @@ from toolz.curried.operator import getitem
 
 from zipline.lib.adjusted_array import ensure_ndarray
 from zipline.errors import NoFurtherDataError
-from zipline.utils.numpy_utils import repeat_first_axis, repeat_last_axis
 from zipline.utils.pandas_utils import explode
 
+from .mixins import CustomTermMixin
+from .result import PipelineResult
 from .term import AssetExists, LoadableTerm
 
 
+def _window_keys(term, graph):
+    """
+    Get the ``(input, window_length, offset)`` triple describing each window
+    read by the windowed term ``term``.
+
+    Terms with equal triples read identical windows, so they can share a
+    single AdjustedArrayWindow.
+    """
+    offsets = graph.offset
+    return [
+        (input_, term.window_length, offsets[term, input_])
+        for input_ in term.inputs
+    ]
+
+
+def _computes_rowwise(term):
+    """
+    Whether ``term`` computes its output one row at a time via
+    ``CustomTermMixin._compute_row``.
+    """
+    return isinstance(term, CustomTermMixin) and (
+        get_unbound_function(type(term)._compute) is
+        get_unbound_function(CustomTermMixin._compute)
+    )
+
+
 class PipelineEngine(with_metaclass(ABCMeta)):
 
     @abstractmethod
@@ -62,6 +91,29 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_pipeline")
 
+    @abstractmethod
+    def run_pipeline_columnar(self, pipeline, start_date, end_date):
+        """
+        Compute values for `pipeline` between `start_date` and `end_date`,
+        without building a DataFrame of the results.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Returns
+        -------
+        result : zipline.pipeline.result.PipelineResult
+            The computed results.  ``result.to_frame()`` is equivalent to the
+            result of ``run_pipeline``.
+        """
+        raise NotImplementedError("run_pipeline_columnar")
+
 
 class NoOpPipelineEngine(PipelineEngine):
     """
@@ -75,6 +127,19 @@ class NoOpPipelineEngine(PipelineEngine):
             columns=sorted(pipeline.columns.keys()),
         )
 
+    def run_pipeline_columnar(self, pipeline, start_date, end_date):
+        dates = date_range(start=start_date, end=end_date, freq='D')
+        return PipelineResult(
+            data={
+                name: empty((len(dates), 0), dtype=term.dtype)
+                for name, term in iteritems(pipeline.columns)
+            },
+            mask=empty((len(dates), 0), dtype=bool),
+            dates=dates,
+            assets=empty(0, dtype=int64),
+            asset_finder=None,
+        )
+
 
 class SimplePipelineEngine(object):
     """
@@ -110,6 +175,18 @@ class SimplePipelineEngine(object):
         """
         Compute a pipeline.
 
+        See Also
+        --------
+        PipelineEngine.run_pipeline
+        """
+        return self.run_pipeline_columnar(
+            pipeline, start_date, end_date,
+        ).to_frame()
+
+    def run_pipeline_columnar(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline, returning its results as a PipelineResult.
+
         Parameters
         ----------
         pipeline : zipline.pipeline.Pipeline
@@ -134,24 +211,19 @@ class SimplePipelineEngine(object):
            the results in a a dictionary to that they can be fed into future
            terms.
 
-        3. For each date, determine the number of assets passing
-           pipeline.screen.  The sum, N, of all these values is the total
-           number of rows in our output frame, so we pre-allocate an output
-           array of length N for each factor in `terms`.
-
-        4. Fill in the arrays allocated in (3) by copying computed values from
-           our output cache into the corresponding rows.
-
-        5. Stick the values computed in (4) into a DataFrame and return it.
+        3. Wrap the computed values of the pipeline's columns, along with the
+           values of pipeline.screen, in a PipelineResult and return it.
+           Rows for the assets passing the screen are only selected when the
+           result is sliced by date or converted to a DataFrame.
 
         Step 0 is performed by ``Pipeline.to_graph``.
         Step 1 is performed in ``SimplePipelineEngine._compute_root_mask``.
         Step 2 is performed in ``SimplePipelineEngine.compute_chunk``.
-        Steps 3, 4, and 5 are performed in ``SimplePiplineEngine._to_narrow``.
+        Step 3 is performed in ``SimplePiplineEngine._to_narrow``.
 
         See Also
         --------
-        PipelineEngine.run_pipeline
+        PipelineEngine.run_pipeline_columnar
         """
         if end_date < start_date:
             raise ValueError(
@@ -286,6 +358,113 @@ class SimplePipelineEngine(object):
             out.append(input_data)
         return out
 
+    @staticmethod
+    def _lockstep_group(term, workspace, graph):
+        """
+        Find the windowed terms that can be computed in lockstep with
+        ``term``.
+
+        These are the terms, not yet computed but with all of their
+        dependencies available in ``workspace``, that read a window in common
+        with ``term`` or with another term in the group.  All terms in the
+        group have the same number of extra rows as ``term``.
+
+        Returns
+        -------
+        group : list[ComputableTerm]
+            The terms in the group, beginning with ``term``.
+        """
+        if not (term.windowed and _computes_rowwise(term)):
+            return [term]
+
+        extra_rows = graph.extra_rows
+        candidates = {
+            other: set(_window_keys(other, graph))
+            for other in graph
+            if other.windowed
+            and other is not term
+            and other not in workspace
+            and _computes_rowwise(other)
+            and extra_rows[other] == extra_rows[term]
+            and all(dep in workspace for dep in other.dependencies)
+        }
+
+        group = [term]
+        keys = set(_window_keys(term, graph))
+        found = True
+        while found:
+            found = False
+            for other, other_keys in list(iteritems(candidates)):
+                if keys & other_keys:
+                    group.append(other)
+                    keys |= other_keys
+                    del candidates[other]
+                    found = True
+        return group
+
+    def _compute_in_lockstep(self, terms, workspace, graph, dates, assets):
+        """
+        Compute windowed terms that read some of the same windows, stepping
+        one window per distinct ``(input, window_length, offset)`` and passing
+        it to every term that reads it.
+
+        This copies each input, and applies its adjustments, once rather than
+        once per term.
+
+        Parameters
+        ----------
+        terms : list[ComputableTerm]
+            Terms returned by ``_lockstep_group``.
+        workspace : dict
+            Map from term -> output, containing all dependencies of ``terms``.
+        graph : zipline.pipeline.graph.TermGraph
+        dates : pd.DatetimeIndex
+            Row labels for our root mask.
+        assets : pd.Int64Index
+            Column labels for our root mask.
+
+        Returns
+        -------
+        results : dict
+            Map from each term in ``terms`` to its output.
+        """
+        windows = {}
+        term_keys = {}
+        for term in terms:
+            keys = term_keys[term] = _window_keys(term, graph)
+            for key in keys:
+                if key not in windows:
+                    input_, window_length, offset = key
+                    windows[key] = workspace[input_].traverse(
+                        window_length=window_length,
+                        offset=offset,
+                    )
+
+        masks = {}
+        out = {}
+        for term in terms:
+            # All terms in the group have the same extra rows, and therefore
+            # the same dates.
+            mask, mask_dates = self._mask_and_dates_for_term(
+                term, workspace, graph, dates,
+            )
+            masks[term] = mask
+            out[term] = term._allocate_output(mask)
+
+        for idx, date in enumerate(mask_dates):
+            current = {key: next(window) for key, window in iteritems(windows)}
+            for term in terms:
+                with term.ctx:
+                    term._compute_row(
+                        out[term],
+                        idx,
+                        date,
+                        assets,
+                        masks[term][idx],
+                        [current[key] for key in term_keys[term]],
+                    )
+        return out
+
     def get_loader(self, term):
         return self._get_loader(term)
 
@@ -348,6 +527,15 @@ class SimplePipelineEngine(object):
                 )
                 workspace.update(loaded)
             else:
+                group = self._lockstep_group(term, workspace, graph)
+                if len(group) > 1:
+                    workspace.update(
+                        self._compute_in_lockstep(
+                            group, workspace, graph, dates, assets,
+                        ),
+                    )
+                    continue
+
                 workspace[term] = term._compute(
                     self._inputs_for_term(term, workspace, graph),
                     mask_dates,
@@ -365,7 +553,7 @@ class SimplePipelineEngine(object):
 
     def _to_narrow(self, data, mask, dates, assets):
         """
-        Convert raw computed pipeline results into a DataFrame for public APIs.
+        Wrap raw computed pipeline results for public APIs.
 
         Parameters
         ----------
@@ -373,49 +561,17 @@ class SimplePipelineEngine(object):
             Dict mapping column names to computed results.
         mask : ndarray[bool, ndim=2]
             Mask array of values to keep.
-        dates : ndarray[datetime64, ndim=1]
+        dates : pd.DatetimeIndex
             Row index for arrays `data` and `mask`
-        assets : ndarray[int64, ndim=2]
+        assets : ndarray[int64, ndim=1]
             Column index for arrays `data` and `mask`
 
         Returns
         -------
-        results : pd.DataFrame
-            The indices of `results` are as follows:
-
-            index : two-tiered MultiIndex of (date, asset).
-                Contains an entry for each (date, asset) pair corresponding to
-                a `True` value in `mask`.
-            columns : Index of str
-                One column per entry in `data`.
-
-        If mask[date, asset] is True, then result.loc[(date, asset), colname]
-        will contain the value of data[colname][date, asset].
-        """
-        if not mask.any():
-            # Manually handle the empty DataFrame case. This is a workaround
-            # to pandas failing to tz_localize an empty dataframe with a
-            # MultiIndex. It also saves us the work of applying a known-empty
-            # mask to each array.
-            #
-            # Slicing `dates` here to preserve pandas metadata.
-            empty_dates = dates[:0]
-            empty_assets = array([], dtype=object)
-            return DataFrame(
-                data={
-                    name: array([], dtype=arr.dtype)
-                    for name, arr in iteritems(data)
-                },
-                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
-            )
-
-        resolved_assets = array(self._finder.retrieve_all(assets))
-        dates_kept = repeat_last_axis(dates.values, len(assets))[mask]
-        assets_kept = repeat_first_axis(resolved_assets, len(dates))[mask]
-        return DataFrame(
-            data={name: arr[mask] for name, arr in iteritems(data)},
-            index=MultiIndex.from_arrays([dates_kept, assets_kept]),
-        ).tz_localize('UTC', level=0)
+        results : zipline.pipeline.result.PipelineResult
+            The results, which resolve assets and build DataFrames on demand.
+        """
+        return PipelineResult(data, mask, dates, assets, self._finder)
 
     def _validate_compute_chunk_params(self, dates, assets, initial_workspace):
         """
@@ -444,3 +600,288 @@ class SimplePipelineEngine(object):
                     implied=implied_shape,
                 )
             )
+
+
+class _IncrementalState(object):
+    """
+    Per-pipeline state retained by an IncrementalPipelineEngine between calls.
+
+    Parameters
+    ----------
+    pipeline : zipline.pipeline.Pipeline
+        The pipeline for which this state was built.
+    graph : zipline.pipeline.graph.TermGraph
+        The dependency graph of ``pipeline``.
+    screen_name : str
+        Name under which the pipeline's screen is stored in ``graph.outputs``.
+    dates : pd.DatetimeIndex
+        Row labels for the root mask, including extra rows.
+    assets : pd.Int64Index
+        Column labels for the root mask.
+    workspace : dict
+        Map from term -> output for the root mask and all loadable terms.
+    windows : dict
+        Map from ``(input, window_length, offset)`` -> AdjustedArrayWindow,
+        shared by every windowed term reading that window.
+    window_keys : dict
+        Map from windowed term -> list of keys into ``windows``, one per
+        input.
+    """
+    __slots__ = (
+        'pipeline',
+        'graph',
+        'screen_name',
+        'dates',
+        'assets',
+        'workspace',
+        'windows',
+        'window_keys',
+        'next_row',
+    )
+
+    def __init__(self,
+                 pipeline,
+                 graph,
+                 screen_name,
+                 dates,
+                 assets,
+                 workspace,
+                 windows,
+                 window_keys,
+                 next_row):
+        self.pipeline = pipeline
+        self.graph = graph
+        self.screen_name = screen_name
+        self.dates = dates
+        self.assets = assets
+        self.workspace = workspace
+        self.windows = windows
+        self.window_keys = window_keys
+        self.next_row = next_row
+
+    def row_for(self, pipeline, date):
+        """
+        Get the root mask row for ``date``, or None if this state can't be
+        stepped forward to ``date``.
+        """
+        if pipeline is not self.pipeline:
+            return None
+        dates = self.dates
+        row = dates.searchsorted(date)
+        if row < self.next_row or row >= len(dates) or dates[row] != date:
+            return None
+        return row
+
+
+class IncrementalPipelineEngine(SimplePipelineEngine):
+    """
+    PipelineEngine that computes single-day pipelines incrementally.
+
+    Loadable terms are loaded once for a block of ``prefetch_length`` days,
+    and each windowed term keeps its ``AdjustedArrayWindow`` iterators between
+    calls.  Requesting the next session only steps those windows forward by
+    one row and computes the newest row of every term, so the cost of a
+    single-day ``run_pipeline`` call does not scale with window lengths or
+    with the size of the prefetched block.
+
+    Requests spanning more than one day, requests that move backwards in
+    time, and requests past the end of the prefetched block fall back to (or
+    rebuild the state with) the chunked algorithm of ``SimplePipelineEngine``.
+
+    Parameters
+    ----------
+    get_loader : callable
+        A function that is given a loadable term and returns a PipelineLoader
+        to use to retrieve raw data for that term.
+    calendar : DatetimeIndex
+        Array of dates to consider as trading days when computing a range
+        between a fixed start and end.
+    asset_finder : zipline.assets.AssetFinder
+        An AssetFinder instance.  We depend on the AssetFinder to determine
+        which assets are in the top-level universe at any point in time.
+    prefetch_length : int, optional
+        Number of days past the requested date for which to load raw data when
+        (re)building incremental state.  Default is 126.
+    """
+    __slots__ = (
+        '_prefetch_length',
+        '_state',
+    )
+
+    def __init__(self,
+                 get_loader,
+                 calendar,
+                 asset_finder,
+                 prefetch_length=126):
+        super(IncrementalPipelineEngine, self).__init__(
+            get_loader,
+            calendar,
+            asset_finder,
+        )
+        self._prefetch_length = prefetch_length
+        self._state = None
+
+    def run_pipeline_columnar(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline, returning its results as a PipelineResult.
+
+        If ``start_date == end_date``, the result is computed incrementally
+        from state retained by previous calls.  Otherwise this is equivalent
+        to ``SimplePipelineEngine.run_pipeline_columnar``.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline_columnar
+        """
+        parent = super(IncrementalPipelineEngine, self)
+        if start_date != end_date:
+            return parent.run_pipeline_columnar(
+                pipeline, start_date, end_date,
+            )
+
+        state = self._state
+        row = None if state is None else state.row_for(pipeline, start_date)
+        if row is None:
+            state = self._state = self._build_state(pipeline, start_date)
+            if state is None:
+                return parent.run_pipeline_columnar(
+                    pipeline, start_date, end_date,
+                )
+            row = state.row_for(pipeline, start_date)
+
+        outputs = self._compute_row(state, row)
+        screen_values = outputs.pop(state.screen_name)
+        return self._to_narrow(
+            outputs,
+            screen_values,
+            state.dates[row:row + 1],
+            state.assets,
+        )
+
+    def _build_state(self, pipeline, start_date):
+        """
+        Load raw data and create windows for ``pipeline`` for a block of
+        dates beginning at ``start_date``.
+
+        Returns None if ``pipeline`` can't be computed incrementally, which
+        is the case when a computed term needs extra rows.
+        """
+        screen_name = uuid4().hex
+        graph = pipeline.to_graph(screen_name, self._root_mask_term)
+        graph_extra_rows = graph.extra_rows
+        for term in graph:
+            if graph_extra_rows[term] and not (
+                isinstance(term, LoadableTerm)
+                or term is self._root_mask_term
+            ):
+                return None
+
+        calendar = self._calendar
+        extra_rows = graph_extra_rows[self._root_mask_term]
+        start_idx = calendar.get_loc(start_date)
+        end_date = calendar[
+            min(start_idx + self._prefetch_length, len(calendar) - 1)
+        ]
+        root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
+        dates, assets, root_mask_values = explode(root_mask)
+
+        self._validate_compute_chunk_params(
+            dates,
+            assets,
+            {self._root_mask_term: root_mask_values},
+        )
+        workspace = {self._root_mask_term: root_mask_values}
+
+        get_loader = self.get_loader
+        loader_group_key = juxt(get_loader, getitem(graph_extra_rows))
+        loader_groups = groupby(loader_group_key, graph.loadable_terms)
+        for term in graph.loadable_terms:
+            if term in workspace:
+                continue
+            mask, mask_dates = self._mask_and_dates_for_term(
+                term, workspace, graph, dates
+            )
+            to_load = sorted(
+                loader_groups[loader_group_key(term)],
+                key=lambda t: t.dataset
+            )
+            workspace.update(
+                get_loader(term).load_adjusted_array(
+                    to_load, mask_dates, assets, mask,
+                ),
+            )
+
+        window_keys = {
+            term: _window_keys(term, graph)
+            for term in graph
+            if term.windowed
+        }
+        windows = {}
+        for keys in itervalues(window_keys):
+            for key in keys:
+                if key not in windows:
+                    input_, window_length, offset = key
+                    windows[key] = workspace[input_].traverse(
+                        window_length=window_length,
+                        offset=offset,
+                    )
+
+        return _IncrementalState(
+            pipeline=pipeline,
+            graph=graph,
+            screen_name=screen_name,
+            dates=dates,
+            assets=assets,
+            workspace=workspace,
+            windows=windows,
+            window_keys=window_keys,
+            next_row=extra_rows,
+        )
+
+    def _compute_row(self, state, row):
+        """
+        Compute the outputs of ``state.graph`` for the single root mask row
+        ``row``, stepping any windows forward to that row.
+        """
+        graph = state.graph
+        graph_extra_rows = graph.extra_rows
+        root_extra_rows = graph_extra_rows[self._root_mask_term]
+        loaded = state.workspace
+        assets = state.assets
+        dates = state.dates[row:row + 1]
+
+        # Skip windows over any rows that were never requested.
+        skipped = row - state.next_row
+        for window in itervalues(state.windows):
+            for _ in range(skipped):
+                next(window)
+        state.next_row = row + 1
+
+        # Step each shared window once for this row.
+        current = {
+            key: next(window) for key, window in iteritems(state.windows)
+        }
+
+        workspace = {}
+        for term in graph.ordered():
+            if term in loaded:
+                # Loaded arrays start `extra_rows` rows before the root mask
+                # row for which this term is first needed.
+                loc = row - (root_extra_rows - graph_extra_rows[term])
+                workspace[term] = ensure_ndarray(loaded[term])[loc:loc + 1]
+                continue
+
+            mask = workspace[term.mask]
+            if term.windowed:
+                inputs = [
+                    iter((current[key],)) for key in state.window_keys[term]
+                ]
+            else:
+                inputs = [workspace[input_] for input_ in term.inputs]
+            workspace[term] = term._compute(inputs, dates, assets, mask)
+            assert workspace[term].shape == mask.shape
+
+        return {
+            name: workspace[term]
+            for name, term in iteritems(graph.outputs)
+        }
@@ -9,7 +9,11 @@ from numpy import inf, where
 from toolz import curry
 
 from zipline.errors import UnknownRankMethod
-from zipline.lib.normalize import naive_grouped_rowwise_apply
+from zipline.lib.normalize import (
+    demean as demean_row,
+    grouped_rowwise_apply,
+    zscore as zscore_row,
+)
 from zipline.lib.rank import masked_rankdata_2d
 from zipline.pipeline.classifiers import Classifier, Everything, Quantiles
 from zipline.pipeline.mixins import (
@@ -43,11 +47,11 @@ from zipline.pipeline.filters import (
     NullFilter,
 )
 from zipline.utils.input_validation import expect_types
-from zipline.utils.math_utils import nanmean, nanstd
 from zipline.utils.numpy_utils import (
     bool_dtype,
     coerce_to_dtype,
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
 )
@@ -392,7 +396,12 @@ float64_only = restrict_to_dtype(
 )
 
 
-FACTOR_DTYPES = frozenset([datetime64ns_dtype, float64_dtype, int64_dtype])
+FACTOR_DTYPES = frozenset([
+    datetime64ns_dtype,
+    float32_dtype,
+    float64_dtype,
+    int64_dtype,
+])
 
 
 class Factor(RestrictedDTypeMixin, ComputableTerm):
@@ -576,13 +585,8 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         --------
         :meth:`pandas.DataFrame.groupby`
         """
-        # This is a named function so that it has a __name__ for use in the
-        # graph repr of GroupedRowTransform.
-        def demean(row):
-            return row - nanmean(row)
-
         return GroupedRowTransform(
-            transform=demean,
+            transform=demean_row,
             factor=self,
             mask=mask,
             groupby=groupby,
@@ -642,13 +646,8 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         --------
         :meth:`pandas.DataFrame.groupby`
         """
-        # This is a named function so that it has a __name__ for use in the
-        # graph repr of GroupedRowTransform.
-        def zscore(row):
-            return (row - nanmean(row)) / nanstd(row)
-
         return GroupedRowTransform(
-            transform=zscore,
+            transform=zscore_row,
             factor=self,
             mask=mask,
             groupby=groupby,
@@ -961,7 +960,9 @@ class GroupedRowTransform(Factor):
     Parameters
     ----------
     transform : function[ndarray[ndim=1] -> ndarray[ndim=1]]
-        Function to apply over each row group.
+        Function to apply over each row group.  Transforms registered with
+        :func:`zipline.lib.normalize.vectorized_grouped_transform` are
+        computed for all rows and groups at once.
     factor : zipline.pipeline.Factor
         The factor providing baseline data to transform.
     mask : zipline.pipeline.Filter
@@ -1024,7 +1025,7 @@ class GroupedRowTransform(Factor):
 
         return where(
             group_labels != null_group_value,
-            naive_grouped_rowwise_apply(
+            grouped_rowwise_apply(
                 data=data,
                 group_labels=group_labels,
                 func=self._transform,
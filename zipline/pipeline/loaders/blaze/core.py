@@ -1052,6 +1052,7 @@ class BlazeLoader(dict):
                     sparse_deltas,
                 ),
                 column.missing_value,
+                column.dtype,
             )
 
 global_loader = BlazeLoader.global_instance()
@@ -89,6 +89,7 @@ class USEquityPricingLoader(PipelineLoader):
                 mask,
                 c_adjs,
                 c.missing_value,
+                c.dtype,
             )
         return out
 
@@ -172,5 +172,6 @@ class DataFrameLoader(PipelineLoader):
                 mask=(good_assets & good_dates[:, None]) & mask,
                 adjustments=self.format_adjustments(dates, assets),
                 missing_value=column.missing_value,
+                column_dtype=column.dtype,
             ),
         }
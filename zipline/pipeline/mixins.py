@@ -103,14 +103,12 @@ class CustomTermMixin(object):
         """
         raise NotImplementedError()
 
-    def _compute(self, windows, dates, assets, mask):
+    def _allocate_output(self, mask):
         """
-        Call the user's `compute` function on each window with a pre-built
-        output array.
+        Allocate an output array, of the same shape as ``mask``, filled with
+        our missing value.
         """
-        compute = self.compute
         missing_value = self.missing_value
-        params = self.params
         outputs = self.outputs
         if outputs is not NotSpecified:
             out = recarray(
@@ -121,22 +119,44 @@ class CustomTermMixin(object):
             out[:] = missing_value
         else:
             out = full_like(mask, missing_value, dtype=self.dtype)
+        return out
+
+    def _compute_row(self, out, idx, date, assets, col_mask, arrays):
+        """
+        Call the user's `compute` function on the windows ``arrays`` for a
+        single row of ``out``.
+        """
+        masked_out = out[idx][col_mask]
+        masked_assets = assets[col_mask]
+
+        self.compute(
+            date,
+            masked_assets,
+            masked_out,
+            *(array[:, col_mask] for array in arrays),
+            **self.params
+        )
+        out[idx][col_mask] = masked_out
+
+    def _compute(self, windows, dates, assets, mask):
+        """
+        Call the user's `compute` function on each window with a pre-built
+        output array.
+        """
+        compute_row = self._compute_row
+        out = self._allocate_output(mask)
         with self.ctx:
             # TODO: Consider pre-filtering columns that are all-nan at each
             # time-step?
             for idx, date in enumerate(dates):
-                col_mask = mask[idx]
-                masked_out = out[idx][col_mask]
-                masked_assets = assets[col_mask]
-
-                compute(
+                compute_row(
+                    out,
+                    idx,
                     date,
-                    masked_assets,
-                    masked_out,
-                    *(next(w)[:, col_mask] for w in windows),
-                    **params
+                    assets,
+                    mask[idx],
+                    [next(w) for w in windows],
                 )
-                out[idx][col_mask] = masked_out
         return out
 
     def short_repr(self):
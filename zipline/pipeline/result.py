@@ -0,0 +1,135 @@
+"""
+Columnar container for the results of a pipeline.
+"""
+from numpy import array
+from pandas import DataFrame, MultiIndex
+from six import iteritems
+
+from zipline.utils.numpy_utils import repeat_first_axis, repeat_last_axis
+
+
+class PipelineResult(object):
+    """
+    The results of a pipeline over a range of dates, stored as the dense
+    arrays computed by the engine.
+
+    Selecting the rows for a single date is cheap, which is the common case
+    in a simulation.  The (date, asset) indexed DataFrame returned by
+    ``PipelineEngine.run_pipeline`` is only built by :meth:`to_frame`.
+
+    Parameters
+    ----------
+    data : dict[str -> ndarray[ndim=2]]
+        Dict mapping column names to computed results.
+    mask : ndarray[bool, ndim=2]
+        Mask array of values to keep.
+    dates : pd.DatetimeIndex
+        Row index for arrays `data` and `mask`.
+    assets : ndarray[int64, ndim=1]
+        Column index for arrays `data` and `mask`.
+    asset_finder : zipline.assets.AssetFinder
+        Finder used to resolve the sids in `assets` to Asset objects.
+    """
+    __slots__ = ('_data', '_mask', '_dates', '_assets', '_finder')
+
+    def __init__(self, data, mask, dates, assets, asset_finder):
+        self._data = data
+        self._mask = mask
+        self._dates = dates
+        self._assets = assets
+        self._finder = asset_finder
+
+    @property
+    def dates(self):
+        """
+        The dates for which results were computed.
+        """
+        return self._dates
+
+    @property
+    def columns(self):
+        """
+        The names of the pipeline's columns.
+        """
+        return sorted(self._data)
+
+    def _retrieve_all(self, sids):
+        if not len(sids):
+            return []
+        return self._finder.retrieve_all(sids)
+
+    def for_date(self, dt):
+        """
+        Get the results for a single date.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            The date for which to get results.
+
+        Returns
+        -------
+        results : pd.DataFrame
+            A frame indexed by the assets that passed the pipeline's screen
+            on ``dt``, with one column per pipeline column.
+
+        Raises
+        ------
+        KeyError
+            Raised when ``dt`` isn't one of ``self.dates``.
+        """
+        row = self._dates.get_loc(dt)
+        row_mask = self._mask[row]
+        return DataFrame(
+            data={
+                name: arr[row][row_mask] for name, arr in iteritems(self._data)
+            },
+            index=self._retrieve_all(self._assets[row_mask]),
+            columns=self.columns,
+        )
+
+    def to_frame(self):
+        """
+        Convert the results into a DataFrame indexed by (date, asset).
+
+        Returns
+        -------
+        results : pd.DataFrame
+            The indices of `results` are as follows:
+
+            index : two-tiered MultiIndex of (date, asset).
+                Contains an entry for each (date, asset) pair corresponding to
+                a `True` value in `mask`.
+            columns : Index of str
+                One column per entry in `data`.
+
+        If mask[date, asset] is True, then result.loc[(date, asset), colname]
+        will contain the value of data[colname][date, asset].
+        """
+        data = self._data
+        mask = self._mask
+        dates = self._dates
+        if not mask.any():
+            # Manually handle the empty DataFrame case. This is a workaround
+            # to pandas failing to tz_localize an empty dataframe with a
+            # MultiIndex. It also saves us the work of applying a known-empty
+            # mask to each array.
+            #
+            # Slicing `dates` here to preserve pandas metadata.
+            empty_dates = dates[:0]
+            empty_assets = array([], dtype=object)
+            return DataFrame(
+                data={
+                    name: array([], dtype=arr.dtype)
+                    for name, arr in iteritems(data)
+                },
+                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
+            )
+
+        resolved_assets = array(self._retrieve_all(self._assets))
+        dates_kept = repeat_last_axis(dates.values, len(self._assets))[mask]
+        assets_kept = repeat_first_axis(resolved_assets, len(dates))[mask]
+        return DataFrame(
+            data={name: arr[mask] for name, arr in iteritems(data)},
+            index=MultiIndex.from_arrays([dates_kept, assets_kept]),
+        ).tz_localize('UTC', level=0)
@@ -12,12 +12,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
+import pandas as pd
 
 from zipline.errors import (
     InvalidBenchmarkAsset,
     BenchmarkAssetNotAvailableTooEarly,
     BenchmarkAssetNotAvailableTooLate
 )
+from zipline.utils.calendar_index import NANOS_IN_DAY
+from zipline.utils.munge import ffill
 
 
 class BenchmarkSource(object):
@@ -35,13 +39,22 @@ class BenchmarkSource(object):
 
             self._validate_benchmark()
 
-            self._precalculated_series = \
-                self._initialize_precalculated_series(
+            if self.emission_rate == "minute":
+                dts, returns = self._initialize_minute_returns(
+                    self.benchmark_asset,
+                    self.env,
+                    self.trading_days,
+                    self.data_portal
+                )
+            else:
+                precalculated_series = self._initialize_precalculated_series(
                     self.benchmark_asset,
                     self.env,
                     self.trading_days,
                     self.data_portal
                 )
+                dts = precalculated_series.index.asi8
+                returns = precalculated_series.values
         else:
             # get benchmark info from trading environment, which defaults to
             # downloading data from Yahoo.
@@ -50,23 +63,110 @@ class BenchmarkSource(object):
 
             if self.emission_rate == "minute":
                 # we need to take the env's benchmark returns, which are daily,
-                # and resample them to minute
-                minutes = env.minutes_for_days_in_range(
-                    start=trading_days[0],
-                    end=trading_days[-1]
-                )
+                # and repeat them for every minute of each day.  A session
+                # without a return has a return of 0 rather than the previous
+                # session's, which would compound it twice.
+                daily_series = daily_series.reindex(trading_days).fillna(0.0)
 
-                minute_series = daily_series.reindex(
-                    index=minutes,
-                    method="ffill"
-                )
+                calendar_index = env.calendar_index
+                start_idx = calendar_index.session_index(trading_days[0].value)
+                stop_idx = start_idx + len(trading_days)
 
-                self._precalculated_series = minute_series
+                dts = calendar_index.minutes_for_sessions(start_idx, stop_idx)
+                returns = np.repeat(
+                    daily_series.values,
+                    calendar_index.minutes_per_session[start_idx:stop_idx],
+                )
             else:
-                self._precalculated_series = daily_series
+                dts = daily_series.index.asi8
+                returns = daily_series.values
+
+        self._dts = dts
+        self._returns = returns = np.asarray(returns, dtype=np.float64)
+
+        if self.emission_rate == "minute":
+            self._returns_since_open = self._compound_by_day(dts, returns)
+        else:
+            self._returns_since_open = returns
+
+    @staticmethod
+    def _compound_by_day(dts, returns):
+        """
+        Compound ``returns`` from the start of each UTC day.
+
+        Missing returns are treated as 0.
+
+        Parameters
+        ----------
+        dts : np.ndarray[int64]
+            The sorted times of ``returns``, as nanoseconds since the epoch.
+        returns : np.ndarray[float64]
+            The return at each time in ``dts``.
+
+        Returns
+        -------
+        compounded : np.ndarray[float64]
+            The cumulative return from the first time on the same day through
+            each time in ``dts``.
+        """
+        growth = 1.0 + returns
+        growth[np.isnan(growth)] = 1.0
+
+        days = dts - dts % NANOS_IN_DAY
+        bounds = np.hstack([
+            0,
+            np.flatnonzero(days[1:] != days[:-1]) + 1,
+            len(dts),
+        ])
+
+        compounded = np.empty_like(growth)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            np.cumprod(growth[start:stop], out=compounded[start:stop])
+        compounded -= 1.0
+        return compounded
+
+    def _position(self, dt):
+        dts = self._dts
+        value = dt.value
+        idx = dts.searchsorted(value)
+        if idx == len(dts) or dts[idx] != value:
+            raise KeyError(dt)
+        return idx
 
     def get_value(self, dt):
-        return self._precalculated_series.loc[dt]
+        """
+        Look up the benchmark return at ``dt``.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            A trading day in daily mode, or a market minute in minute mode.
+
+        Returns
+        -------
+        return_ : float
+            The return over the period ending at ``dt``.
+        """
+        return self._returns[self._position(dt)]
+
+    def get_return_since_open(self, dt):
+        """
+        Look up the cumulative benchmark return over the day of ``dt``, up to
+        and including ``dt``.
+
+        In daily mode this is the same as ``get_value``.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            A trading day in daily mode, or a market minute in minute mode.
+
+        Returns
+        -------
+        return_ : float
+            The compounded return from the start of the day through ``dt``.
+        """
+        return self._returns_since_open[self._position(dt)]
 
     def _validate_benchmark(self):
         # check if this security has a stock dividend.  if so, raise an
@@ -132,55 +232,112 @@ class BenchmarkSource(object):
         A pd.Series, indexed by trading day, whose values represent the %
         change from close to close.
         """
-        if self.emission_rate == "minute":
-            minutes = env.minutes_for_days_in_range(self.trading_days[0],
-                                                    self.trading_days[-1])
+        start_date = self.benchmark_asset.start_date
+        if start_date < trading_days[0]:
+            # get the window of close prices for benchmark_sid from the
+            # last trading day of the simulation, going up to one day
+            # before the simulation start day (so that we can get the %
+            # change on day 1)
             benchmark_series = data_portal.get_history_window(
                 [asset],
-                minutes[-1],
-                bar_count=len(minutes) + 1,
-                frequency="1m",
+                trading_days[-1],
+                bar_count=len(trading_days) + 1,
+                frequency="1d",
                 field="price",
                 ffill=True
             )[asset]
-
             return benchmark_series.pct_change()[1:]
-        else:
-            start_date = self.benchmark_asset.start_date
-            if start_date < trading_days[0]:
-                # get the window of close prices for benchmark_sid from the
-                # last trading day of the simulation, going up to one day
-                # before the simulation start day (so that we can get the %
-                # change on day 1)
-                benchmark_series = data_portal.get_history_window(
-                    [asset],
-                    trading_days[-1],
-                    bar_count=len(trading_days) + 1,
-                    frequency="1d",
-                    field="price",
-                    ffill=True
-                )[asset]
-                return benchmark_series.pct_change()[1:]
-            elif start_date == trading_days[0]:
-                # Attempt to handle case where stock data starts on first
-                # day, in this case use the open to close return.
-                benchmark_series = data_portal.get_history_window(
-                    [asset],
-                    trading_days[-1],
-                    bar_count=len(trading_days),
-                    frequency="1d",
-                    field="price",
-                    ffill=True
-                )[asset]
-
-                # get a minute history window of the first day
-                first_open = data_portal.get_spot_value(
-                    asset, 'open', trading_days[0], 'daily')
-                first_close = data_portal.get_spot_value(
-                    asset, 'close', trading_days[0], 'daily')
-
-                first_day_return = (first_close - first_open) / first_open
-
-                returns = benchmark_series.pct_change()[:]
-                returns[0] = first_day_return
-                return returns
+        elif start_date == trading_days[0]:
+            # Attempt to handle case where stock data starts on first
+            # day, in this case use the open to close return.
+            benchmark_series = data_portal.get_history_window(
+                [asset],
+                trading_days[-1],
+                bar_count=len(trading_days),
+                frequency="1d",
+                field="price",
+                ffill=True
+            )[asset]
+
+            # get a minute history window of the first day
+            first_open = data_portal.get_spot_value(
+                asset, 'open', trading_days[0], 'daily')
+            first_close = data_portal.get_spot_value(
+                asset, 'close', trading_days[0], 'daily')
+
+            first_day_return = (first_close - first_open) / first_open
+
+            returns = benchmark_series.pct_change()[:]
+            returns[0] = first_day_return
+            return returns
+
+    @staticmethod
+    def _initialize_minute_returns(asset, env, trading_days, data_portal):
+        """
+        Internal method that precalculates the minutely benchmark returns for
+        use in the simulation, one session at a time.
+
+        Parameters
+        ----------
+        asset : Asset
+            The benchmark asset.
+        env : TradingEnvironment
+        trading_days : pd.DatetimeIndex
+            The sessions of the simulation.
+        data_portal : DataPortal
+
+        Returns
+        -------
+        dts : np.ndarray[int64]
+            Every market minute of ``trading_days``.
+        returns : np.ndarray[float64]
+            The % change of the benchmark's close from the minute before each
+            minute in ``dts``.
+
+        Notes
+        -----
+        Each session is read as a window of the session's minutes and the
+        last minute before it, adjusted as of the session's close, so the
+        return into the session's first minute accounts for the session's
+        splits and dividends.  Missing closes are forward filled within the
+        window.  The close before the window is only looked up if the window
+        starts with a missing close.
+        """
+        calendar_index = env.calendar_index
+        start_idx = calendar_index.session_index(trading_days[0].value)
+        stop_idx = start_idx + len(trading_days)
+        closes = calendar_index.closes[start_idx:stop_idx]
+        minutes_per_session = \
+            calendar_index.minutes_per_session[start_idx:stop_idx]
+
+        returns = np.empty(minutes_per_session.sum(), dtype=np.float64)
+        pos = 0
+        for close, count in zip(closes, minutes_per_session):
+            close = pd.Timestamp(close, tz='UTC')
+            window = data_portal.get_history_window(
+                [asset],
+                close,
+                bar_count=count + 1,
+                frequency="1m",
+                field="close",
+                ffill=False,
+            )
+            prices = np.array(window.values[:, 0])
+
+            if np.isnan(prices[0]):
+                # The benchmark didn't trade in the minute before the
+                # session, so look back to its last trade.
+                last_traded = data_portal.get_last_traded_dt(
+                    asset, window.index[0], 'minute',
+                )
+                if not pd.isnull(last_traded):
+                    prices[0] = data_portal.get_adjusted_value(
+                        asset, 'close', last_traded, close, 'minute',
+                    )
+
+            prices = ffill(prices)
+            returns[pos:pos + count] = prices[1:] / prices[:-1] - 1.0
+            pos += count
+
+        return calendar_index.minutes_for_sessions(start_idx, stop_idx), \
+            returns
@@ -331,25 +331,25 @@ class PandasCSV(object):
 
             # Fill any zero entries left in our sid column by doing a lookup
             # using both symbol and the row date.
-            conflict_rows = df[df['sid'] == 0]
-            for row_idx, row in conflict_rows.iterrows():
-                try:
-                    asset = self.finder.lookup_symbol(
-                        row[self.symbol_column],
-                        # Replacing tzinfo here is necessary because of the
-                        # timezone metadata bug described below.
-                        row['dt'].replace(tzinfo=pytz.utc),
-
-                        # It's possible that no asset comes back here if our
-                        # lookup date is from before any asset held the
-                        # requested symbol.  Mark such cases as NaN so that
-                        # they get dropped in the next step.
-                    ) or numpy.nan
-                except SymbolNotFound:
-                    asset = numpy.nan
-
-                # Assign the resolved asset to the cell
-                df.ix[row_idx, 'sid'] = asset
+            conflicts = (df['sid'] == 0).values
+            if conflicts.any():
+                # It's possible that no asset comes back here if our lookup
+                # date is from before any asset held the requested symbol.
+                # Mark such cases as NaN so that they get dropped in the next
+                # step.
+                sids = self.finder.lookup_symbols_as_of(
+                    df[self.symbol_column].values[conflicts],
+                    df['dt'].values[conflicts],
+                )
+                resolved = numpy.unique(sids[sids != -1])
+                assets = dict(
+                    zip(resolved, self.finder.retrieve_all(resolved)),
+                )
+                sid_column = df['sid'].values.astype(object)
+                sid_column[conflicts] = [
+                    assets.get(sid, numpy.nan) for sid in sids
+                ]
+                df['sid'] = sid_column
 
             # Filter out rows containing symbols that we failed to find.
             length_before_drop = len(df)
@@ -0,0 +1,206 @@
+"""
+On-disk cache for dates computed from trading calendar rules.
+
+Evaluating the ``rrule`` sets that define holidays and early closes takes a
+noticeable amount of time, and happens every time a trading calendar module
+is imported.  The results only change when the rules or the date range
+change, so we store them as int64 arrays keyed by a hash of both.
+
+The calendars' end dates move forward every day, so the dates are computed
+up to the end of the year holding ``end`` and trimmed, which keeps one cache
+entry valid for the rest of the year.
+"""
+from errno import EEXIST
+from glob import glob
+from hashlib import sha1
+import inspect
+import os
+from os.path import expanduser, join
+from tempfile import NamedTemporaryFile
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.offsets import YearEnd
+
+#: Bump this to invalidate every cached calendar, e.g. if the layout of the
+#: cache files changes.
+CALENDAR_CACHE_VERSION = 1
+
+
+def calendar_cache_dir(environ=None):
+    """
+    The directory holding cached calendar dates.
+
+    This is ``calendars`` under ``zipline.data.paths.cache_root()``.  We can't
+    import that here because ``zipline.data`` imports the trading calendars.
+
+    Parameters
+    ----------
+    environ : dict, optional
+        A dict to interpret as the os environment.
+
+    Returns
+    -------
+    cache_dir : str
+        Path to the calendar cache dir.
+    """
+    if environ is None:
+        environ = os.environ
+
+    root = environ.get('ZIPLINE_ROOT', None)
+    if root is None:
+        root = expanduser('~/.zipline')
+
+    return join(root, 'cache', 'calendars')
+
+
+def rules_key(name, rules, start, end):
+    """
+    Compute the cache key for dates computed by ``rules`` between ``start``
+    and ``end``.
+
+    Parameters
+    ----------
+    name : str
+        The name of the dates being cached, e.g. ``'nyse_early_closes'``.
+    rules : callable
+        The function computing the dates.
+    start, end : datetime
+        The bounds passed to ``rules``.  Only their dates are used, since
+        calendar rules are evaluated on whole days.
+
+    Returns
+    -------
+    key : str or None
+        A hex digest of the rules' source code, the bounds and the cache
+        version, or None if the source of ``rules`` isn't available.
+    """
+    try:
+        source = inspect.getsource(rules)
+    except (IOError, TypeError):
+        return None
+
+    hasher = sha1()
+    hasher.update(
+        repr((
+            CALENDAR_CACHE_VERSION,
+            name,
+            pd.Timestamp(start).normalize().value,
+            pd.Timestamp(end).normalize().value,
+        )).encode('utf-8'),
+    )
+    hasher.update(source.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def _read(path):
+    f = np.load(path)
+    try:
+        dates = pd.DatetimeIndex(f['values'])
+        tz = str(f['tz'])
+    finally:
+        f.close()
+
+    if tz:
+        dates = dates.tz_localize('UTC').tz_convert(tz)
+    return dates
+
+
+def _write(cache_dir, path, dates):
+    try:
+        os.makedirs(cache_dir)
+    except OSError as e:
+        if e.errno != EEXIST:
+            raise
+
+    # Write to a temporary file and move it into place so that readers in
+    # other processes never see a partially written file.
+    with NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+        np.savez(
+            f,
+            values=dates.values.astype('datetime64[ns]').view('int64'),
+            tz=np.array(str(dates.tz) if dates.tz is not None else ''),
+        )
+    os.rename(f.name, path)
+
+
+def _cache_end(end):
+    """
+    The last day of the year holding ``end``.
+    """
+    return pd.Timestamp(end).normalize() + YearEnd(0)
+
+
+def _trim(dates, end):
+    """
+    The dates in ``dates`` on or before ``end``.
+    """
+    end = pd.Timestamp(end)
+    if dates.tz is None and end.tz is not None:
+        end = end.tz_convert(None)
+    elif dates.tz is not None and end.tz is None:
+        end = end.tz_localize(dates.tz)
+    return dates[dates <= end]
+
+
+def cached_calendar_dates(name, rules, start, end, cache_dir=None):
+    """
+    Compute ``rules(start, end)``, reading the result from the on-disk cache
+    if it was computed by an earlier process.
+
+    Parameters
+    ----------
+    name : str
+        The name of the dates being cached, e.g. ``'nyse_early_closes'``.
+    rules : callable[(datetime, datetime) -> pd.DatetimeIndex]
+        The function computing the dates.
+    start, end : datetime
+        The bounds passed to ``rules``.
+    cache_dir : str, optional
+        The directory holding the cache.  Defaults to
+        ``calendar_cache_dir()``.
+
+    Returns
+    -------
+    dates : pd.DatetimeIndex
+        The result of ``rules(start, end)``.
+
+    Notes
+    -----
+    Errors reading or writing the cache are ignored, in which case the dates
+    are computed from ``rules``, and an unreadable cache file is removed.
+
+    The dates are computed up to the end of the year holding ``end``, so
+    ``rules`` must compute the same dates up to ``end`` whichever end it is
+    given, as calendar rules evaluated day by day do.
+    """
+    cache_end = _cache_end(end)
+    key = rules_key(name, rules, start, cache_end)
+    if key is None:
+        return rules(start, end)
+
+    if cache_dir is None:
+        cache_dir = calendar_cache_dir()
+    path = join(cache_dir, '%s-%s.npz' % (name, key))
+
+    try:
+        dates = _read(path)
+    except Exception:
+        # A missing file, or a corrupt one, e.g. from a full disk, which
+        # np.load can fail to read with any of several errors.
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+        dates = rules(start, cache_end)
+        try:
+            _write(cache_dir, path, dates)
+            # Remove entries for earlier rules or date ranges.
+            for stale in glob(join(cache_dir, '%s-*.npz' % name)):
+                if stale != path:
+                    os.remove(stale)
+        except (IOError, OSError):
+            pass
+
+    return _trim(dates, end)
@@ -0,0 +1,225 @@
+"""
+Integer-indexed trading calendar.
+"""
+from numpy import (
+    arange,
+    asarray,
+    cumsum,
+    int64,
+    repeat,
+    searchsorted,
+)
+
+NANOS_IN_MINUTE = 60000000000
+NANOS_IN_DAY = 24 * 60 * NANOS_IN_MINUTE
+
+
+class CalendarIndex(object):
+    """
+    A trading calendar stored as arrays of nanoseconds since the epoch.
+
+    All methods take and return raw int64 nanoseconds (or integer positions)
+    rather than ``pd.Timestamp`` objects, so they can be used on hot paths
+    without creating or comparing Timestamps.
+
+    Parameters
+    ----------
+    sessions : np.ndarray[int64]
+        The midnight UTC label of each trading session, sorted ascending.
+    opens : np.ndarray[int64]
+        The first market minute of each session.
+    closes : np.ndarray[int64]
+        The last market minute of each session.
+
+    Notes
+    -----
+    Minutes are numbered consecutively across sessions, so the first minute
+    of a session directly follows the last minute of the previous session.
+    ``minute_index`` and ``minute_at`` convert between a market minute and
+    its position in this numbering.
+    """
+    def __init__(self, sessions, opens, closes):
+        self.sessions = sessions = asarray(sessions, dtype=int64)
+        self.opens = opens = asarray(opens, dtype=int64)
+        self.closes = closes = asarray(closes, dtype=int64)
+
+        if not len(sessions) == len(opens) == len(closes):
+            raise ValueError(
+                "Got %d sessions, %d opens and %d closes." % (
+                    len(sessions), len(opens), len(closes),
+                ),
+            )
+
+        self.minutes_per_session = (closes - opens) // NANOS_IN_MINUTE + 1
+
+        # The position of the first minute of each session.
+        self.first_minute_positions = first_minute_positions = cumsum(
+            self.minutes_per_session,
+        ) - self.minutes_per_session
+        self.minute_count = (
+            int(first_minute_positions[-1] + self.minutes_per_session[-1])
+            if len(sessions) else 0
+        )
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def session_index(self, session):
+        """
+        Get the position of the session labelled ``session``.
+
+        Returns -1 if ``session`` isn't a session label.
+        """
+        sessions = self.sessions
+        idx = searchsorted(sessions, session)
+        if idx < len(sessions) and sessions[idx] == session:
+            return idx
+        return -1
+
+    def session_index_at_or_before(self, dt):
+        """
+        Get the position of the last session whose label is at or before the
+        day containing ``dt``.
+
+        Returns -1 if there is no such session.
+        """
+        return searchsorted(
+            self.sessions,
+            dt - dt % NANOS_IN_DAY,
+            side='right',
+        ) - 1
+
+    def is_session(self, dt):
+        """
+        Whether the day containing ``dt`` is a trading session.
+        """
+        return self.session_index(dt - dt % NANOS_IN_DAY) != -1
+
+    def next_session_index(self, dt):
+        """
+        Get the position of the first session after the day containing
+        ``dt``.
+
+        Returns ``len(self)`` if there is no such session.
+        """
+        return searchsorted(
+            self.sessions,
+            dt - dt % NANOS_IN_DAY,
+            side='right',
+        )
+
+    def previous_session_index(self, dt):
+        """
+        Get the position of the last session before the day containing
+        ``dt``.
+
+        Returns -1 if there is no such session.
+        """
+        return searchsorted(self.sessions, dt - dt % NANOS_IN_DAY) - 1
+
+    def session_index_for_minute(self, minute):
+        """
+        Get the position of the session during which ``minute`` occurs.
+
+        Returns -1 if ``minute`` isn't a market minute.
+        """
+        idx = searchsorted(self.opens, minute, side='right') - 1
+        if idx >= 0 and minute <= self.closes[idx]:
+            return idx
+        return -1
+
+    def is_market_minute(self, minute):
+        """
+        Whether ``minute`` is between the open and close, inclusive, of a
+        session.
+        """
+        return self.session_index_for_minute(minute) != -1
+
+    def minute_index(self, minute):
+        """
+        Get the position of the market minute ``minute``.
+
+        Raises
+        ------
+        KeyError
+            If ``minute`` isn't a market minute.
+        """
+        idx = self.session_index_for_minute(minute)
+        if idx == -1:
+            raise KeyError(minute)
+        return int(
+            self.first_minute_positions[idx] +
+            (minute - self.opens[idx]) // NANOS_IN_MINUTE
+        )
+
+    def minute_at(self, positions):
+        """
+        Get the market minutes at ``positions``.
+
+        Parameters
+        ----------
+        positions : int or np.ndarray[int64]
+            Positions in ``range(self.minute_count)``.
+
+        Returns
+        -------
+        minutes : int64 or np.ndarray[int64]
+            The market minute at each position.
+        """
+        first_minute_positions = self.first_minute_positions
+        idx = searchsorted(first_minute_positions, positions, side='right') - 1
+        return (
+            self.opens[idx] +
+            (positions - first_minute_positions[idx]) * NANOS_IN_MINUTE
+        )
+
+    def minutes_for_sessions(self, start_idx, stop_idx):
+        """
+        Get all the market minutes of the sessions at positions
+        ``start_idx`` up to, but not including, ``stop_idx``.
+
+        Returns
+        -------
+        minutes : np.ndarray[int64]
+        """
+        counts = self.minutes_per_session[start_idx:stop_idx]
+        if not len(counts):
+            return arange(0, dtype=int64)
+
+        starts = self.first_minute_positions[start_idx:stop_idx]
+        positions = arange(
+            starts[0],
+            starts[-1] + counts[-1],
+            dtype=int64,
+        )
+        return (
+            repeat(self.opens[start_idx:stop_idx], counts) +
+            (positions - repeat(starts, counts)) * NANOS_IN_MINUTE
+        )
+
+    def minute_window(self, minute, count, step=1):
+        """
+        Get ``count`` market minutes starting with ``minute`` and continuing
+        ``step`` market minutes at a time.
+
+        Returns
+        -------
+        minutes : np.ndarray[int64]
+
+        Raises
+        ------
+        KeyError
+            If ``minute`` isn't a market minute.
+        IndexError
+            If the window extends beyond the first or last market minute.
+        """
+        start = self.minute_index(minute)
+        positions = start + arange(count, dtype=int64) * step
+        if count and not (
+            0 <= positions[-1] < self.minute_count
+        ):
+            raise IndexError(
+                "Window of %d minutes starting at %d runs off the calendar." %
+                (count, minute),
+            )
+        return self.minute_at(positions)
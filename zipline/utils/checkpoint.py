@@ -0,0 +1,284 @@
+"""
+Checkpoints of a running simulation, so that a backtest which dies part way
+through can be resumed from its last checkpoint instead of from the start.
+
+A checkpoint is a directory holding a ``state`` file and one ``perfs-*`` file
+for each checkpoint written so far.  The state file holds everything needed
+to resume the algorithm after the last session it checkpointed, and the
+names of the perf files.  Each perf file holds the daily perf messages
+emitted since the checkpoint before it, so writing a checkpoint costs the
+same at the end of a long run as it does at the start.
+
+Every file is a zlib compressed pickle in which the ``TradingEnvironment`` and
+``AssetFinder`` are replaced by persistent ids, see
+:mod:`zipline.utils.serialization_utils`.  Files are written to a temporary
+file and moved into place, so a run which dies while writing a checkpoint
+leaves the checkpoint before it intact.
+"""
+from collections import namedtuple
+from errno import EEXIST
+import os
+from os.path import exists, join, realpath
+import pickle
+from tempfile import NamedTemporaryFile
+from timeit import default_timer
+import zlib
+
+from logbook import Logger
+from pandas.tseries.tools import normalize_date
+
+from zipline.errors import CheckpointMismatch
+from zipline.utils.compat import replace
+from zipline.utils.serialization_utils import (
+    VERSION_LABEL,
+    dumps_with_persistent_ids,
+    loads_with_persistent_ids,
+)
+
+log = Logger('Checkpoint')
+
+#: Bump this when the layout of the checkpoint state changes.  Checkpoints
+#: written with another version can't be resumed.
+CHECKPOINT_VERSION = 1
+
+STATE_FILENAME = 'state'
+
+# The fields of SimulationParameters which must match between the run that
+# wrote a checkpoint and the run resuming it.
+SIM_PARAMS_FIELDS = (
+    'period_start',
+    'period_end',
+    'capital_base',
+    'data_frequency',
+    'emission_rate',
+)
+
+Checkpoint = namedtuple('Checkpoint', 'path session segments state perfs')
+Checkpoint.__doc__ = """
+A checkpoint read by :func:`read_checkpoint`.
+
+Parameters
+----------
+path : str
+    The checkpoint directory.
+session : pd.Timestamp
+    The last session simulated before the checkpoint was written.
+segments : list[str]
+    The names of the perf files in the checkpoint.
+state : dict
+    The state of the algorithm, see ``TradingAlgorithm._checkpoint_state``.
+perfs : list[dict]
+    The daily perf messages emitted up to and including ``session``.
+"""
+
+
+def _dumps(obj):
+    # Level 1 compresses the float arrays and repeated dict keys in the perf
+    # messages about as well as the higher levels, for a fraction of the time.
+    return zlib.compress(
+        dumps_with_persistent_ids(obj, pickle.HIGHEST_PROTOCOL),
+        1,
+    )
+
+
+def _read(path, env):
+    with open(path, 'rb') as f:
+        return loads_with_persistent_ids(zlib.decompress(f.read()), env)
+
+
+def _write(directory, name, data):
+    # Write to a temporary file and move it into place so that a run which
+    # dies while writing never leaves a partially written file behind.
+    f = NamedTemporaryFile(dir=directory, delete=False)
+    try:
+        with f:
+            f.write(data)
+        replace(f.name, join(directory, name))
+    except BaseException:
+        try:
+            os.remove(f.name)
+        except OSError:
+            pass
+        raise
+    return len(data)
+
+
+def sim_params_key(sim_params):
+    """
+    The fields of ``sim_params`` that a checkpoint can only be resumed with.
+    """
+    return tuple(getattr(sim_params, field) for field in SIM_PARAMS_FIELDS)
+
+
+def check_sim_params(checkpoint, sim_params):
+    """
+    Check that ``checkpoint`` was written by a run with the same
+    ``sim_params``.
+
+    Raises
+    ------
+    CheckpointMismatch
+        Raised if one of the fields in ``SIM_PARAMS_FIELDS`` differs.
+    """
+    expected = checkpoint.state['sim_params']
+    for field, checkpointed, actual in zip(
+            SIM_PARAMS_FIELDS,
+            expected,
+            sim_params_key(sim_params)):
+        if checkpointed != actual:
+            raise CheckpointMismatch(
+                path=checkpoint.path,
+                field=field,
+                checkpointed=checkpointed,
+                actual=actual,
+            )
+
+
+def read_checkpoint(path, env):
+    """
+    Read the checkpoint in the directory ``path``.
+
+    Parameters
+    ----------
+    path : str
+        The checkpoint directory.
+    env : TradingEnvironment
+        The environment to resume the simulation in.
+
+    Returns
+    -------
+    checkpoint : Checkpoint
+        The checkpoint.
+
+    Raises
+    ------
+    CheckpointMismatch
+        Raised if the checkpoint was written by another version of zipline.
+    """
+    state = _read(join(path, STATE_FILENAME), env)
+    version = state.pop(VERSION_LABEL, None)
+    if version != CHECKPOINT_VERSION:
+        raise CheckpointMismatch(
+            path=path,
+            field='version',
+            checkpointed=version,
+            actual=CHECKPOINT_VERSION,
+        )
+
+    perfs = []
+    for name in state['segments']:
+        perfs.extend(_read(join(path, name), env))
+
+    return Checkpoint(
+        path=path,
+        session=state['session'],
+        segments=state['segments'],
+        state=state['algo'],
+        perfs=perfs,
+    )
+
+
+class Checkpointer(object):
+    """
+    Writes a checkpoint of an algorithm every ``every`` sessions.
+
+    Parameters
+    ----------
+    path : str
+        The checkpoint directory.  It is created if it doesn't exist.
+    every : int
+        The number of sessions between checkpoints.
+    resumed : Checkpoint, optional
+        The checkpoint the run was resumed from, if any.  If it is in ``path``
+        its perf files are reused, otherwise its perf messages are written
+        with the first checkpoint.
+
+    Attributes
+    ----------
+    count : int
+        The number of checkpoints written.
+    seconds : float
+        The time spent writing checkpoints.
+    nbytes : int
+        The number of bytes written.
+    """
+    def __init__(self, path, every, resumed=None):
+        if every < 1:
+            raise ValueError('every must be at least 1, got %r' % every)
+
+        try:
+            os.makedirs(path)
+        except OSError as e:
+            if e.errno != EEXIST:
+                raise
+
+        self.path = path
+        self.every = every
+
+        if resumed is not None and realpath(resumed.path) == realpath(path):
+            self._segments = list(resumed.segments)
+            self._pending = []
+        else:
+            self._segments = []
+            self._pending = list(resumed.perfs) if resumed is not None else []
+
+        self._sessions = 0
+        self.count = 0
+        self.seconds = 0.0
+        self.nbytes = 0
+
+    def session_closed(self, algo, perf):
+        """
+        Record the daily perf message ``perf`` for the session that just
+        closed, and write a checkpoint if it is time to.
+        """
+        self._pending.append(perf)
+        self._sessions += 1
+
+        session = normalize_date(algo.get_datetime())
+        last_session = normalize_date(algo.sim_params.last_close)
+        if self._sessions % self.every or session == last_session:
+            # There is nothing to resume after the last session.
+            return
+
+        self.write(algo, session)
+
+    def write(self, algo, session):
+        """
+        Write a checkpoint of ``algo`` after ``session``.
+        """
+        start = default_timer()
+        nbytes = 0
+
+        if self._pending:
+            name = 'perfs-%s' % session.strftime('%Y%m%d')
+            nbytes += _write(self.path, name, _dumps(self._pending))
+            self._segments.append(name)
+            self._pending = []
+
+        nbytes += _write(self.path, STATE_FILENAME, _dumps({
+            VERSION_LABEL: CHECKPOINT_VERSION,
+            'session': session,
+            'segments': self._segments,
+            'algo': algo._checkpoint_state(),
+        }))
+
+        seconds = default_timer() - start
+        self.count += 1
+        self.seconds += seconds
+        self.nbytes += nbytes
+        log.info(
+            'Wrote checkpoint for {session:%Y-%m-%d} to {path} in '
+            '{seconds:.3f}s ({nbytes} bytes).',
+            session=session,
+            path=self.path,
+            seconds=seconds,
+            nbytes=nbytes,
+        )
+
+
+def has_checkpoint(path):
+    """
+    Whether there is a checkpoint to resume in the directory ``path``.
+    """
+    return exists(join(path, STATE_FILENAME))
@@ -1,3 +1,5 @@
+import os
+
 from six import PY2
 
 
@@ -9,11 +11,24 @@ if PY2:
     mappingproxy.argtypes = [py_object]
     mappingproxy.restype = py_object
 
+    def replace(src, dst):
+        """
+        Move ``src`` to ``dst``, overwriting ``dst`` if it exists.
+
+        os.rename fails on Windows if ``dst`` exists, so it is removed first
+        there, which isn't atomic.
+        """
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
 else:
     from functools import lru_cache
+    from os import replace
     from types import MappingProxyType as mappingproxy
 
 __all__ = [
     'lru_cache',
     'mappingproxy',
+    'replace',
 ]
@@ -0,0 +1,184 @@
+"""
+Lightweight instrumentation for timing the phases of a simulation.
+"""
+from collections import defaultdict, namedtuple
+from timeit import default_timer
+
+import numpy as np
+import pandas as pd
+
+from zipline.utils.pandas_utils import sort_values
+
+
+class SimulationProfile(namedtuple('SimulationProfile', [
+        'totals',
+        'daily_seconds',
+        'daily_calls'])):
+    """
+    The result of profiling a simulation.
+
+    Attributes
+    ----------
+    totals : pd.DataFrame
+        Frame indexed by phase or counter name with columns ``calls`` and
+        ``seconds``, sorted by ``seconds`` in descending order.  Counters have
+        no ``seconds``, and ``other`` has no ``calls``.
+    daily_seconds : pd.DataFrame
+        Frame indexed by session with a column per phase holding the seconds
+        spent in that phase during the session.  The ``other`` column holds
+        the time in the session that was not spent in any phase.
+    daily_calls : pd.DataFrame
+        Frame indexed by session with a column per phase or counter holding
+        the number of calls made during the session.
+    """
+
+
+class SimulationProfiler(object):
+    """
+    Collects call counts and timings for the phases of a simulation, in total
+    and for each session.
+
+    Phases are timed by wrapping the callables that implement them with
+    ``timed``.  Time is exclusive: while a phase runs inside of another phase,
+    only the inner phase accrues time.  Callables wrapped with ``counted``
+    are only counted, which is cheap enough to use for hot calls like data
+    portal reads.
+
+    Parameters
+    ----------
+    timer : callable, optional
+        Function returning the current time in seconds.  Defaults to
+        ``timeit.default_timer``, which is monotonic on Python 3.
+    """
+    OTHER = 'other'
+
+    def __init__(self, timer=default_timer):
+        self._timer = timer
+
+        self._sessions = []
+        self._session_walls = []
+        self._session_seconds = []
+        self._session_calls = []
+        self._session_start = None
+
+        # Anything recorded before the first session is dropped.
+        self._seconds = defaultdict(float)
+        self._calls = defaultdict(int)
+
+        # The seconds spent in nested phases, one entry per running phase.
+        self._nested_seconds = []
+
+        self._undo = []
+
+    def start_session(self, session):
+        """
+        Attribute everything recorded from now on to ``session``.
+        """
+        now = self._timer()
+        self._end_session(now)
+
+        self._sessions.append(session)
+        self._seconds = defaultdict(float)
+        self._calls = defaultdict(int)
+        self._session_seconds.append(self._seconds)
+        self._session_calls.append(self._calls)
+        self._session_start = now
+
+    def _end_session(self, now):
+        if self._session_start is not None:
+            self._session_walls.append(now - self._session_start)
+            self._session_start = None
+
+    def stop(self):
+        """
+        End the current session and undo every ``instrument`` call.
+        """
+        self._end_session(self._timer())
+        while self._undo:
+            self._undo.pop()()
+
+    def timed(self, phase, f):
+        """
+        Wrap ``f`` so that each call is counted and timed as ``phase``.
+        """
+        timer = self._timer
+        nested_seconds = self._nested_seconds
+
+        def timed_f(*args, **kwargs):
+            nested_seconds.append(0.0)
+            start = timer()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                elapsed = timer() - start
+                exclusive = elapsed - nested_seconds.pop()
+                if nested_seconds:
+                    nested_seconds[-1] += elapsed
+                self._seconds[phase] += exclusive
+                self._calls[phase] += 1
+
+        return timed_f
+
+    def counted(self, name, f):
+        """
+        Wrap ``f`` so that each call is counted as ``name``.
+        """
+        def counted_f(*args, **kwargs):
+            self._calls[name] += 1
+            return f(*args, **kwargs)
+
+        return counted_f
+
+    def instrument(self, obj, attr, name, timed=True):
+        """
+        Replace the method ``attr`` of ``obj`` with a ``timed`` or ``counted``
+        version of itself until ``stop`` is called.
+        """
+        original = getattr(obj, attr)
+        if attr in vars(obj):
+            self.on_stop(lambda: setattr(obj, attr, original))
+        else:
+            self.on_stop(lambda: delattr(obj, attr))
+
+        wrap = self.timed if timed else self.counted
+        setattr(obj, attr, wrap(name, original))
+
+    def on_stop(self, f):
+        """
+        Call ``f`` when ``stop`` is called.  Callbacks are called in the
+        reverse of the order they were registered in.
+        """
+        self._undo.append(f)
+
+    def report(self):
+        """
+        Build a ``SimulationProfile`` from everything recorded so far.
+        """
+        index = pd.DatetimeIndex(self._sessions)
+        daily_seconds = pd.DataFrame(
+            self._session_seconds,
+            index=index,
+        ).fillna(0.0).sort_index(axis=1)
+        daily_calls = pd.DataFrame(
+            self._session_calls,
+            index=index,
+        ).fillna(0).astype(np.int64).sort_index(axis=1)
+
+        walls = np.array(self._session_walls, dtype=np.float64)
+        if len(walls) < len(index):
+            # The current session hasn't ended yet.
+            walls = np.append(walls, self._timer() - self._session_start)
+        daily_seconds[self.OTHER] = walls - daily_seconds.sum(axis=1).values
+
+        totals = pd.DataFrame(
+            {
+                'calls': daily_calls.sum(),
+                'seconds': daily_seconds.sum(),
+            },
+            columns=['calls', 'seconds'],
+        )
+        return SimulationProfile(
+            totals=sort_values(totals, 'seconds', ascending=False),
+            daily_seconds=daily_seconds,
+            daily_calls=daily_calls,
+        )
@@ -2,11 +2,14 @@ from datetime import datetime
 from os import listdir
 import os.path
 
+import numpy as np
 import pandas as pd
 import pytz
+from six import iteritems
 import zipline
 
 from zipline.errors import SymbolNotFound
+from zipline.utils.memoize import lazyval
 
 
 DATE_FORMAT = "%Y%m%d"
@@ -25,11 +28,14 @@ class SecurityList(object):
             current datetime
         """
         self.data = data
-        self._cache = {}
         self._knowledge_dates = self.make_knowledge_dates(self.data)
+        self._knowledge_date_values = np.array(
+            [kd.value for kd in self._knowledge_dates],
+            dtype=np.int64,
+        )
+        self._members = {}
         self.current_date = current_date_func
         self.count = 0
-        self._current_set = set()
         self.asset_finder = asset_finder
 
     def make_knowledge_dates(self, data):
@@ -45,32 +51,108 @@ class SecurityList(object):
 
     @property
     def restricted_list(self):
+        return self._members_at(self.current_date())[0]
 
-        cd = self.current_date()
-        for kd in self._knowledge_dates:
-            if cd < kd:
-                break
-            if kd in self._cache:
-                self._current_set = self._cache[kd]
-                continue
-
-            for effective_date, changes in iter(self.data[kd].items()):
-                self.update_current(
-                    effective_date,
-                    changes['add'],
-                    self._current_set.add
-                )
-
-                self.update_current(
-                    effective_date,
-                    changes['delete'],
-                    self._current_set.remove
-                )
+    def contains_many(self, sids, dt=None):
+        """
+        Check whether each of ``sids`` is on the list.
+
+        Parameters
+        ----------
+        sids : iterable[int or Asset]
+            The sids or assets to check.
+        dt : datetime, optional
+            The time at which to check the list.  Defaults to
+            ``current_date()``.
+
+        Returns
+        -------
+        contained : np.ndarray[bool]
+            Whether each entry of ``sids`` was on the list at ``dt``.
+        """
+        if dt is None:
+            dt = self.current_date()
+        member_sids = self._members_at(dt)[1]
+        return np.in1d(np.asarray(sids, dtype=np.int64), member_sids)
 
-            self._cache[kd] = self._current_set
-        return self._current_set
+    @lazyval
+    def intervals(self):
+        """
+        The intervals during which each sid is on the list.
+
+        A sid is added to the list on the knowledge date of the entry adding
+        it, and removed on the knowledge date of the entry deleting it.
+
+        Returns
+        -------
+        intervals : pd.DataFrame
+            A frame with a row for each [start, end) interval, with int64
+            columns ``sid``, ``start`` and ``end``.  Times are in nanoseconds
+            since the epoch.  Sids still on the list have an ``end`` of the
+            maximum int64.
+        """
+        sids, starts, ends = [], [], []
+        added = {}
+        for kd in self._knowledge_dates:
+            kd_value = kd.value
+            for effective_date, changes in sorted(self.data[kd].items()):
+                for sid in self._resolve(effective_date, changes['add']):
+                    added.setdefault(sid, kd_value)
+                for sid in self._resolve(effective_date, changes['delete']):
+                    start = added.pop(sid, None)
+                    if start is not None and start < kd_value:
+                        sids.append(sid)
+                        starts.append(start)
+                        ends.append(kd_value)
+
+        for sid, start in iteritems(added):
+            sids.append(sid)
+            starts.append(start)
+            ends.append(np.iinfo(np.int64).max)
+
+        return pd.DataFrame({
+            'sid': np.array(sids, dtype=np.int64),
+            'start': np.array(starts, dtype=np.int64),
+            'end': np.array(ends, dtype=np.int64),
+        }, columns=['sid', 'start', 'end'])
+
+    def _members_at(self, dt):
+        """
+        Get the sids on the list at ``dt`` as a frozenset and as a sorted
+        int64 array.
 
-    def update_current(self, effective_date, symbols, change_func):
+        Membership only changes on knowledge dates, so the results are
+        cached by knowledge date.
+        """
+        loc = self._knowledge_date_values.searchsorted(
+            pd.Timestamp(dt).value,
+            side='right',
+        ) - 1
+        try:
+            return self._members[loc]
+        except KeyError:
+            pass
+
+        if loc < 0:
+            member_sids = np.empty(0, dtype=np.int64)
+        else:
+            intervals = self.intervals
+            kd_value = self._knowledge_date_values[loc]
+            member_sids = np.unique(intervals.sid.values[
+                (intervals.start.values <= kd_value) &
+                (kd_value < intervals.end.values)
+            ])
+        members = self._members[loc] = (
+            frozenset(member_sids.tolist()),
+            member_sids,
+        )
+        return members
+
+    def _resolve(self, effective_date, symbols):
+        """
+        Look up the sids of ``symbols`` as of ``effective_date``, skipping
+        symbols that don't resolve to an asset.
+        """
         for symbol in symbols:
             try:
                 asset = self.asset_finder.lookup_symbol(
@@ -80,7 +162,7 @@ class SecurityList(object):
             # Pass if no Asset exists for the symbol
             except SymbolNotFound:
                 continue
-            change_func(asset.sid)
+            yield asset.sid
 
 
 class SecurityListSet(object):
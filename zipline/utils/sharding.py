@@ -0,0 +1,252 @@
+"""
+Run one backtest as date-range shards in parallel.
+"""
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+from zipline.errors import ShardHandoffMismatch, ShardModelNotProportional
+from zipline.finance.commission import PerDollar, PerShare
+from zipline.finance.risk import RiskMetricsCumulative
+from zipline.finance.slippage import FixedSlippage
+from zipline.utils.factory import create_simulation_parameters
+from zipline.utils.sweep import imap_forked, prepare_for_fork
+
+# The columns of a perf frame that are denominated in dollars.  They are
+# rescaled when shards are stitched together.
+DOLLAR_COLUMNS = (
+    'capital_used',
+    'ending_cash',
+    'ending_exposure',
+    'ending_value',
+    'long_exposure',
+    'long_value',
+    'pnl',
+    'portfolio_value',
+    'short_exposure',
+    'short_value',
+    'starting_cash',
+    'starting_exposure',
+    'starting_value',
+)
+
+
+def shard_boundaries(sessions):
+    """
+    The first session of each month in ``sessions`` after the first session.
+    """
+    months = sessions.year * 12 + sessions.month
+    return sessions[1:][np.diff(months) != 0]
+
+
+def _shard_sessions(sessions, boundaries):
+    locs = sorted(set(sessions.searchsorted(boundaries)) - {0, len(sessions)})
+    return [
+        sessions[start:stop]
+        for start, stop in zip([0] + locs, locs + [len(sessions)])
+    ]
+
+
+def _nonproportional_model(blotter):
+    """
+    The commission or slippage model of ``blotter`` whose costs aren't
+    proportional to the size of an order, or None if both of them are.
+    """
+    commission = blotter.commission
+    if not (type(commission) is PerDollar or
+            type(commission) is PerShare and
+            commission.min_trade_cost is None):
+        return commission
+    if type(blotter.slippage_func) is not FixedSlippage:
+        return blotter.slippage_func
+    return None
+
+
+def _run_shard(make_algorithm, sim_params, data_portal):
+    algo = make_algorithm(sim_params)
+    perf = algo.run(data_portal)
+    positions = {
+        int(asset): position.amount
+        for asset, position in iteritems(
+            algo.perf_tracker.position_tracker.positions
+        )
+        if position.amount
+    }
+    open_orders = sum(
+        len(orders) for orders in algo.blotter.open_orders.values()
+    )
+    # The models are only known once ``initialize`` has run.  Exceptions
+    # raised in a worker lose their kwargs, so the error is raised by the
+    # parent.
+    model = _nonproportional_model(algo.blotter)
+    return perf, positions, open_orders, None if model is None else repr(model)
+
+
+def _check_handoff(start, previous, result):
+    """
+    Check that the shard starting on ``start``, which ran from the capital
+    base without positions, can be rescaled to continue from ``previous``.
+    """
+    model = result[3]
+    if model is not None:
+        raise ShardModelNotProportional(start=start, model=model)
+
+    # Compare the shards' own, unscaled, results.
+    previous_frame, positions, open_orders, _ = previous
+    ending_value = previous_frame.ending_value.iloc[-1]
+    if positions or open_orders or ending_value:
+        raise ShardHandoffMismatch(
+            start=start,
+            positions=positions,
+            open_orders=open_orders,
+            ending_value=ending_value,
+        )
+
+
+def _restate_risk(perf, sim_params, env):
+    """
+    Recompute the cumulative risk metrics in ``perf`` over the full run.
+    """
+    # Shards report benchmark returns cumulative from their own first day.
+    cumulative = 1.0 + perf.benchmark_period_return.values.astype(np.float64)
+    starts = perf.pop('_shard_start').values
+    benchmark_returns = np.where(
+        starts,
+        cumulative - 1.0,
+        cumulative / np.roll(cumulative, 1) - 1.0,
+    )
+
+    risk = RiskMetricsCumulative(
+        sim_params,
+        env,
+        create_first_day_stats=sim_params.emission_rate == 'minute',
+    )
+    rows = []
+    for dt, returns, benchmark_return, leverage in zip(
+            sim_params.trading_days,
+            perf.returns.values,
+            benchmark_returns,
+            perf.gross_leverage.values):
+        risk.update(dt, returns, benchmark_return, leverage)
+        rows.append(risk.to_dict())
+
+    restated = pd.DataFrame(rows, index=perf.index)
+    for column in restated.columns:
+        perf[column] = restated[column]
+    return perf
+
+
+def run_sharded(make_algorithm,
+                sim_params,
+                data_portal,
+                boundaries=None,
+                processes=None):
+    """
+    Run a backtest as a series of date-range shards, ``processes`` at a time,
+    and stitch the shards' results together.
+
+    This is only valid for algorithms which
+
+    - hold no positions and no open orders at the end of every shard, so
+      that each shard can start from cash without knowing how the shards
+      before it ended, and
+    - size their orders in proportion to their portfolio value, e.g. with
+      ``order_target_percent``, and
+    - pay commissions and slippage in proportion to the size of their
+      orders, i.e. use ``PerDollar`` or ``PerShare`` without a minimum trade
+      cost, and ``FixedSlippage``.
+
+    Each shard starts from ``sim_params.capital_base`` and is rescaled to
+    continue from the portfolio value of the shard before it.
+
+    The first and last requirements are checked once all of the shards have
+    run.  The sizing of orders can't be checked: an algorithm which trades
+    fixed share amounts gets wrong dollar columns, returns and risk metrics
+    without an error.  Orders are rounded to whole shares in each shard, so
+    the stitched results are only approximately those of a sequential run,
+    more closely the larger the capital base.
+
+    Parameters
+    ----------
+    make_algorithm : callable[SimulationParameters -> TradingAlgorithm]
+        Builds the algorithm for one shard.  Called in a worker process.
+    sim_params : SimulationParameters
+        The parameters of the whole backtest.
+    data_portal : DataPortal
+        The data to run the backtest against.
+    boundaries : iterable[pd.Timestamp], optional
+        The sessions each shard after the first starts on.  Defaults to the
+        first session of each month.
+    processes : int, optional
+        The number of shards to run at once.  Defaults to the number of CPUs.
+
+    Returns
+    -------
+    perf : pd.DataFrame
+        The stitched daily perf frame for the whole backtest.
+
+    Raises
+    ------
+    ShardHandoffMismatch
+        Raised if a shard other than the last ends with positions or open
+        orders.
+    ShardModelNotProportional
+        Raised if the algorithm's commission or slippage model isn't
+        proportional to the size of its orders.
+
+    Notes
+    -----
+    Every shard runs with ``sim_params.capital_base``.  The dollar columns of
+    each shard are then scaled so that it starts with the portfolio value the
+    shard before it ended with.  Share amounts in the positions,
+    orders and transactions columns are not scaled.  The cumulative risk
+    metrics are recomputed over the whole backtest.
+    """
+    sessions = sim_params.trading_days
+    if boundaries is None:
+        boundaries = shard_boundaries(sessions)
+    shards = _shard_sessions(sessions, pd.DatetimeIndex(boundaries))
+
+    def run_shard(days):
+        return _run_shard(
+            make_algorithm,
+            create_simulation_parameters(
+                start=days[0],
+                end=days[-1],
+                capital_base=sim_params.capital_base,
+                data_frequency=sim_params.data_frequency,
+                emission_rate=sim_params.emission_rate,
+                env=data_portal.env,
+            ),
+            data_portal,
+        )
+
+    initializer = prepare_for_fork(data_portal)
+    results = {
+        days[0]: result
+        for days, result in imap_forked(
+            run_shard,
+            shards,
+            processes,
+            initializer=initializer,
+        )
+    }
+    results = [results[days[0]] for days in shards]
+
+    capital_base = sim_params.capital_base
+    portfolio_value = capital_base
+    frames = []
+    for i, (days, result) in enumerate(zip(shards, results)):
+        if i:
+            _check_handoff(days[0], results[i - 1], result)
+
+        frame = result[0].copy()
+        scale = portfolio_value / capital_base
+        for column in DOLLAR_COLUMNS:
+            frame[column] *= scale
+        frame['_shard_start'] = np.arange(len(frame)) == 0
+
+        portfolio_value = frame.portfolio_value.iloc[-1]
+        frames.append(frame)
+
+    return _restate_risk(pd.concat(frames), sim_params, data_portal.env)
@@ -0,0 +1,193 @@
+"""
+Run many backtests over the same data in parallel.
+"""
+import multiprocessing
+import sqlite3
+
+from six.moves import map
+
+# The function, items and worker initializer of the running ``imap_forked``
+# call.  Workers inherit them when they are forked, so none of them is ever
+# pickled.
+_forked_state = None
+
+
+def _fork_pool(processes):
+    try:
+        context = multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2 always forks on POSIX.
+        return multiprocessing.Pool(processes, _init_forked)
+    return context.Pool(processes, _init_forked)
+
+
+def _init_forked():
+    initializer = _forked_state[2]
+    if initializer is not None:
+        initializer()
+
+
+def _call_forked(index):
+    f, items, _ = _forked_state
+    return index, f(items[index])
+
+
+def imap_forked(f, items, processes=None, initializer=None):
+    """
+    Call ``f`` on each of ``items`` in a pool of ``processes`` worker
+    processes forked from this one.
+
+    Parameters
+    ----------
+    f : callable
+        The function to call.  It does not need to be picklable.
+    items : iterable
+        The arguments to call ``f`` with.  They do not need to be picklable.
+    processes : int, optional
+        The number of workers.  Defaults to the number of CPUs.  If this is 1
+        ``f`` is called in this process.
+    initializer : callable, optional
+        Called with no arguments in each worker when it starts, e.g. to open
+        the worker's own database connections.  It is not called if ``f`` is
+        called in this process.
+
+    Yields
+    ------
+    item : object
+        One of ``items``.
+    result : object
+        The result of ``f(item)``, which must be picklable.
+
+    Notes
+    -----
+    Results are yielded as the calls finish, which is not necessarily the
+    order of ``items``.  Only one call can run in a process at a time.
+    Workers are forked, so this is not available on Windows.
+    """
+    global _forked_state
+
+    items = list(items)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = min(processes, len(items))
+
+    if _forked_state is not None:
+        raise RuntimeError('imap_forked is already running in this process.')
+
+    _forked_state = f, items, initializer
+    try:
+        if processes <= 1:
+            for index, result in map(_call_forked, range(len(items))):
+                yield items[index], result
+            return
+
+        pool = _fork_pool(processes)
+        try:
+            for index, result in pool.imap_unordered(
+                    _call_forked,
+                    range(len(items)),
+                    chunksize=1):
+                yield items[index], result
+        finally:
+            pool.terminate()
+            pool.join()
+    finally:
+        _forked_state = None
+
+
+def _database_path(conn):
+    """
+    The file of the main database of the SQLite connection ``conn``, or None
+    if the database is in memory.
+    """
+    for _, name, path in conn.execute('PRAGMA database_list'):
+        if name == 'main':
+            return path or None
+    return None
+
+
+def prepare_for_fork(data_portal):
+    """
+    Fill the asset caches behind ``data_portal`` so that forked workers
+    don't each query the assets db for the same assets, and build the
+    initializer that gives each worker its own database connections.
+
+    SQLite connections must not be used across a fork, so each worker
+    disposes of the connections the asset finder's engine inherited and
+    reopens the adjustment reader's database.  In-memory databases can't be
+    reopened.  The fork copies them into the worker, so their connections
+    are kept.
+
+    Returns
+    -------
+    initializer : callable
+        The ``initializer`` to pass to :func:`imap_forked`.
+    """
+    finder = data_portal.env.asset_finder
+    finder.retrieve_all(finder.sids)
+
+    engine = finder.engine
+    dispose_engine = engine.url.database not in (None, '', ':memory:')
+
+    adjustment_reader = data_portal._adjustment_reader
+    conn = getattr(adjustment_reader, 'conn', None)
+    if isinstance(conn, sqlite3.Connection):
+        adjustments_path = _database_path(conn)
+    else:
+        adjustments_path = None
+
+    def reconnect():
+        if dispose_engine:
+            engine.dispose()
+        if adjustments_path is not None:
+            adjustment_reader.conn = sqlite3.connect(adjustments_path)
+
+    return reconnect
+
+
+def run_sweep(make_algorithm, parameters, data_portal, processes=None):
+    """
+    Run a backtest for each set of parameters, ``processes`` at a time.
+
+    The data portal, with its readers, asset finder and trading environment,
+    is loaded once in this process.  Each worker is forked from this process
+    and shares those objects, and any memory-mapped bars behind them,
+    copy-on-write instead of loading them again.
+
+    Parameters
+    ----------
+    make_algorithm : callable[object -> TradingAlgorithm]
+        Called in a worker with one element of ``parameters`` to build the
+        algorithm for that run.  It does not need to be picklable.
+    parameters : iterable
+        The parameters for each run.  They do not need to be picklable.
+    data_portal : DataPortal
+        The data to run every backtest against.
+    processes : int, optional
+        The number of backtests to run at once.  Defaults to the number of
+        CPUs.  If this is 1 the backtests are run in this process.
+
+    Yields
+    ------
+    parameters : object
+        The parameters of a finished run.
+    perf : pd.DataFrame
+        The result of ``TradingAlgorithm.run`` for those parameters.
+
+    Notes
+    -----
+    Results are yielded as the runs finish, which is not necessarily the
+    order of ``parameters``.  Each worker opens its own connections to the
+    assets and adjustments databases when it starts, see
+    :func:`prepare_for_fork`.
+
+    See Also
+    --------
+    imap_forked
+    """
+    return imap_forked(
+        lambda params: make_algorithm(params).run(data_portal),
+        parameters,
+        processes,
+        initializer=prepare_for_fork(data_portal),
+    )
@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -19,6 +20,8 @@ from datetime import datetime
 from dateutil import rrule
 from functools import partial
 
+from zipline.utils.calendar_cache import cached_calendar_dates
+
 start = pd.Timestamp('1990-01-01', tz='UTC')
 end_base = pd.Timestamp('today', tz='UTC')
 # Give an aggressive buffer for logic that needs to use the next trading
@@ -247,7 +250,9 @@ def get_non_trading_days(start, end):
     non_trading_days.sort()
     return pd.DatetimeIndex(non_trading_days)
 
-non_trading_days = get_non_trading_days(start, end)
+non_trading_days = cached_calendar_dates(
+    'nyse_non_trading_days', get_non_trading_days, start, end,
+)
 trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
 
 
@@ -365,7 +370,9 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
+early_closes = cached_calendar_dates(
+    'nyse_early_closes', get_early_closes, start, end,
+)
 
 
 def get_open_and_close(day, early_closes):
@@ -401,5 +408,60 @@ def get_open_and_closes(trading_days, early_closes, get_open_and_close):
 
     return open_and_closes
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+def get_open_and_closes_from_times(trading_days,
+                                   early_closes,
+                                   tz,
+                                   open_offset,
+                                   close_offset,
+                                   early_close_offset):
+    """
+    Vectorized ``get_open_and_closes`` for calendars whose opens and closes
+    are at fixed local times.
+
+    Parameters
+    ----------
+    trading_days : pd.DatetimeIndex
+        The trading days, labelled at midnight UTC.
+    early_closes : pd.DatetimeIndex
+        The days which close at ``early_close_offset``.
+    tz : str
+        The timezone of the exchange.
+    open_offset, close_offset, early_close_offset : pd.Timedelta
+        The local time of the open, the close, and the close on early close
+        days, as offsets from midnight.
+
+    Returns
+    -------
+    open_and_closes : pd.DataFrame
+        Frame indexed by ``trading_days`` with UTC ``market_open`` and
+        ``market_close`` columns.
+    """
+    # Midnight, local time, on each trading day.
+    midnights = pd.DatetimeIndex(trading_days.asi8)
+
+    def to_utc(local):
+        return local.tz_localize(tz).tz_convert('UTC')
+
+    close_offsets = np.where(
+        trading_days.isin(early_closes),
+        early_close_offset.value,
+        close_offset.value,
+    )
+
+    open_and_closes = pd.DataFrame(index=trading_days,
+                                   columns=('market_open', 'market_close'))
+    open_and_closes['market_open'], open_and_closes['market_close'] = (
+        tuple(to_utc(midnights + open_offset)),
+        tuple(to_utc(pd.DatetimeIndex(midnights.asi8 + close_offsets))),
+    )
+    return open_and_closes
+
+open_and_closes = get_open_and_closes_from_times(
+    trading_days,
+    early_closes,
+    'US/Eastern',
+    open_offset=pd.Timedelta(hours=9, minutes=31),
+    close_offset=pd.Timedelta(hours=16),
+    early_close_offset=pd.Timedelta(hours=13),
+)
@@ -19,8 +19,9 @@ import pytz
 
 from datetime import datetime
 from dateutil import rrule
+from zipline.utils.calendar_cache import cached_calendar_dates
 from zipline.utils.tradingcalendar import end, canonicalize_datetime, \
-    get_open_and_closes
+    get_open_and_closes_from_times
 
 start = pd.Timestamp('1994-01-01', tz='UTC')
 
@@ -261,7 +262,9 @@ def get_non_trading_days(start, end):
     non_trading_days.sort()
     return pd.DatetimeIndex(non_trading_days)
 
-non_trading_days = get_non_trading_days(start, end)
+non_trading_days = cached_calendar_dates(
+    'tse_non_trading_days', get_non_trading_days, start, end,
+)
 trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
 
 
@@ -336,7 +339,9 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
+early_closes = cached_calendar_dates(
+    'tse_early_closes', get_early_closes, start, end,
+)
 
 
 def get_open_and_close(day, early_closes):
@@ -360,5 +365,11 @@ def get_open_and_close(day, early_closes):
 
     return market_open, market_close
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+open_and_closes = get_open_and_closes_from_times(
+    trading_days,
+    early_closes,
+    'US/Eastern',
+    open_offset=pd.Timedelta(hours=9, minutes=31),
+    close_offset=pd.Timedelta(hours=16),
+    early_close_offset=pd.Timedelta(hours=13),
+)